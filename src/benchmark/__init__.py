@@ -0,0 +1,22 @@
+from timeit import Timer
+
+
+def time_per_call(func, repeat=5, number=100):
+    """Returns the best mean wall time of the given callable, in seconds per call,
+    over the given number of repetitions of the given number of calls.
+    :param func: the zero-argument callable to time
+    :param repeat: the number of repetitions, of which the fastest is kept
+    :param number: the number of calls per repetition
+    :return: the best mean wall time of the callable, in seconds per call
+    """
+    return min(Timer(func).repeat(repeat=repeat, number=number)) / number
+
+
+def format_time(seconds):
+    """Returns the given duration as a human-readable string in microseconds or milliseconds.
+    :param seconds: the duration in seconds
+    :return: the duration as a human-readable string
+    """
+    if seconds < 1e-3:
+        return "%.1f us" % (seconds * 1e6)
+    return "%.3f ms" % (seconds * 1e3)
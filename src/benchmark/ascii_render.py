@@ -0,0 +1,41 @@
+import numpy as np
+
+from benchmark import time_per_call, format_time
+from model.level_generator import generate_level
+
+
+def ndenumerate_to_ascii(game_grid):
+    """Translates the FOV of the given Game Grid to characters one cell at a time,
+    as data_grid_to_ascii did before the lookup array was introduced.
+    :param game_grid: the Game Grid to translate
+    :return: the FOV as a 2-D array of characters
+    """
+    data_grid = game_grid.get_fov_grid()
+    ascii_grid = np.ndarray(shape=data_grid.shape, dtype='<U1')
+    for pos, val in np.ndenumerate(data_grid):
+        ascii_grid[pos] = game_grid._data_to_ascii[val]
+
+    return ascii_grid
+
+
+def main():
+    """Prints the per-frame cost of translating the FOV cell by cell and through
+    the lookup array, on a freshly generated level. Run from the src directory
+    with: python -m benchmark.ascii_render
+    :return: None
+    """
+    game_grid = generate_level()
+    assert (ndenumerate_to_ascii(game_grid) == game_grid.data_grid_to_ascii()).all()
+
+    compose = time_per_call(game_grid.get_fov_grid)
+    before = time_per_call(lambda: ndenumerate_to_ascii(game_grid), number=20)
+    after = time_per_call(game_grid.data_grid_to_ascii)
+
+    print("FOV composition only:   " + format_time(compose) + " per frame")
+    print("np.ndenumerate + dict:  " + format_time(before) + " per frame")
+    print("lookup array:           " + format_time(after) + " per frame")
+    print("translation speed-up:   %.1fx" % ((before - compose) / max(after - compose, 1e-9)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,55 @@
+import os
+import tempfile
+from time import perf_counter, sleep
+
+from benchmark import format_time
+from model.autosaver import Autosaver
+from model.level_generator import generate_level
+from model.save_format import write_save
+from model.save_slot_manager import SaveSlotManager
+from model.settings import TICK_RATE
+
+SAVES = 50
+
+
+def main():
+    """Prints how long the simulation thread is held up by SAVES saves written
+    synchronously and by SAVES saves handed to the Autosaver, one per tick at
+    TICK_RATE, with the Autosaver's own snapshot and write latency statistics,
+    which include updating the save slot manifest.
+    Run from the src directory with: python -m benchmark.autosave
+    :return: None
+    """
+    game_grid = generate_level(10, seed=0)
+    directory = tempfile.mkdtemp()
+    path = os.path.join(directory, "save.dat")
+
+    stalls = []
+    for _ in range(SAVES):
+        start = perf_counter()
+        write_save(game_grid, path, seeded=True)
+        stalls.append(perf_counter() - start)
+    print("synchronous: stall mean %s, max %s" % (format_time(sum(stalls) / SAVES), format_time(max(stalls))))
+
+    save_slots = SaveSlotManager(directory)
+    autosaver = Autosaver(TICK_RATE, save_slots)
+    autosaver.start()
+    stalls = []
+    for _ in range(SAVES):
+        start = perf_counter()
+        autosaver.save(game_grid, 1)
+        stalls.append(perf_counter() - start)
+        sleep(1 / TICK_RATE)
+        autosaver.tick(game_grid, 1)
+    autosaver.shutdown()
+    print("autosaver:   stall mean %s, max %s" % (format_time(sum(stalls) / SAVES), format_time(max(stalls))))
+    print(autosaver)
+
+    os.remove(path)
+    save_slots.delete(1)
+    os.remove(save_slots.get_manifest_path())
+    os.rmdir(directory)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,55 @@
+from time import perf_counter
+
+from benchmark import format_time
+from model.level_generator.chunk_generator import generate_chunked_level, CHUNKED_LEVEL_WIDTH, CHUNKED_LEVEL_HEIGHT
+
+STEPS = 2000
+
+
+def walk(game_grid, steps):
+    """Walks the player of the given Game Grid along the corridors for the given
+    number of steps, rendering a frame and stepping mobs after each one, and
+    returns the mean time per step.
+    :param game_grid: the Game Grid in which to walk
+    :param steps: the number of steps to walk
+    :return: the mean time per step, in seconds
+    """
+    player = game_grid.get_player()
+    moves = ((game_grid.right_possible, game_grid.move_right), (game_grid.down_possible, game_grid.move_down),
+             (game_grid.left_possible, game_grid.move_left), (game_grid.up_possible, game_grid.move_up))
+    direction = 0
+    start = perf_counter()
+    for step in range(steps):
+        if step % 500 == 499 or not moves[direction][0](player.get_position()):
+            direction = (direction + 1) % len(moves)
+        if moves[direction][0](player.get_position()):
+            moves[direction][1](player)
+        game_grid.data_grid_to_ascii()
+        game_grid.update_mobs()
+
+    return (perf_counter() - start) / steps
+
+
+def main():
+    """Prints the per-step cost, the number of chunks generated and held, and the
+    terrain memory held while walking STEPS steps across a Chunked Level of
+    CHUNKED_LEVEL_WIDTH x CHUNKED_LEVEL_HEIGHT tiles, against the memory a dense
+    level of that size would take. Run from the src directory with:
+    python -m benchmark.chunked_level
+    :return: None
+    """
+    game_grid = generate_chunked_level(seed=0)
+    terrain = game_grid.get_terrain()
+    step_time = walk(game_grid, STEPS)
+    chunk_bytes = terrain.get_chunk_size() ** 2 * terrain.dtype.itemsize
+
+    print("level:             %dx%d" % (CHUNKED_LEVEL_WIDTH, CHUNKED_LEVEL_HEIGHT))
+    print("per step:          " + format_time(step_time))
+    print("chunks generated:  %d (%d evicted)" % (terrain.get_generated_count(), terrain.get_evicted_count()))
+    print("terrain held:      %.1f KiB in %d chunks" % (terrain.get_resident_count() * chunk_bytes / 1024,
+                                                        terrain.get_resident_count()))
+    print("dense terrain:     %.1f KiB" % (CHUNKED_LEVEL_WIDTH * CHUNKED_LEVEL_HEIGHT * terrain.dtype.itemsize / 1024))
+
+
+if __name__ == '__main__':
+    main()
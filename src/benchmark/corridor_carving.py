@@ -0,0 +1,53 @@
+from random import Random
+
+import numpy as np
+
+from benchmark import time_per_call, format_time
+from model.level_generator import init_rooms, add_boarder_wall, connect_rooms
+from model.level_generator.corridor import CORRIDOR_STRATEGIES
+
+SIZES = ((202, 68), (808, 272), (3232, 1088))
+
+
+def legacy_connect_rooms(rooms, level_map):
+    """Connects each room to the next the way connect_rooms did before corridors
+    were carved with slices: by listing the corridor's tiles as tuples and zipping
+    them into index arrays.
+    :param rooms: the list of rooms
+    :param level_map: the level data with isolated rooms
+    :return: None
+    """
+    for i in range(len(rooms) - 1):
+        cols, rows = zip(*rooms[i].get_path_indices_to(rooms[i + 1]))
+        level_map[rows, cols] = 1
+
+
+def main():
+    """Prints the cost of connecting the rooms of levels of growing size through
+    tuple lists and through slice assignment, for each corridor strategy, checking
+    that both carve the same chain of corridors. Run from the src directory with:
+    python -m benchmark.corridor_carving
+    :return: None
+    """
+    print("%12s %6s %12s %s" % ("level", "rooms", "tuple lists",
+                                " ".join("%14s" % strategy for strategy in CORRIDOR_STRATEGIES)))
+    for scale, (width, height) in enumerate(SIZES):
+        level_map = np.zeros((height - 2, width - 2), dtype=np.int8)
+        rooms = init_rooms(level_map, Random(0), 10 * 16 ** scale)
+        rooms.sort()
+        level_map = add_boarder_wall(level_map)
+
+        legacy_map, sliced_map = level_map.copy(), level_map.copy()
+        legacy_connect_rooms(rooms, legacy_map)
+        connect_rooms(rooms, sliced_map, "chain")
+        assert (legacy_map == sliced_map).all()
+
+        legacy = time_per_call(lambda: legacy_connect_rooms(rooms, level_map.copy()), repeat=3, number=5)
+        sliced = [time_per_call(lambda: connect_rooms(rooms, level_map.copy(), strategy), repeat=3, number=5)
+                  for strategy in CORRIDOR_STRATEGIES]
+        print("%12s %6d %12s %s" % ("%dx%d" % (width, height), len(rooms), format_time(legacy),
+                                    " ".join("%14s" % format_time(cost) for cost in sliced)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,62 @@
+import io
+import os
+import pty
+import tempfile
+from time import sleep
+
+from benchmark import format_time
+from controller import Controller
+from controller.input_backend import TerminalInput
+from controller.key_map import SPACE
+from model import Model, GameState
+from view.terminal_renderer import TerminalRenderer
+
+KEYS = 200
+KEY_INTERVAL = 0.05
+STARTUP_TIMEOUT = 5
+
+
+def main():
+    """Plays a game through the Terminal Input backend over a pseudo-terminal,
+    typing KEYS movement keys into it, and prints the key-to-frame latency: the
+    time from a key being read to the first frame displayed after it was
+    performed. Frames are rendered to memory, so no terminal or display server is
+    needed. Run from the src directory with: python -m benchmark.input_latency
+    :return: None
+    """
+    master, slave = pty.openpty()
+    with tempfile.TemporaryDirectory() as save_directory:
+        model = Model(save_directory=save_directory)
+        controller = Controller(model, journal_path=None, input_backend=TerminalInput(slave),
+                                renderer=TerminalRenderer(stream=io.StringIO()))
+        controller.start()
+        try:
+            # load, then slot 1, which starts a new game as the slot is empty
+            os.write(master, SPACE.encode())
+            sleep(0.2)
+            os.write(master, SPACE.encode())
+            waited = 0.0
+            while model.get_game_state() != GameState.IN_GAME and waited < STARTUP_TIMEOUT:
+                sleep(0.05)
+                waited += 0.05
+            menu_keys = controller.get_input_latency().get_count()
+
+            for index in range(KEYS):
+                os.write(master, b"ad"[index % 2:index % 2 + 1])
+                sleep(KEY_INTERVAL)
+            sleep(0.2)
+        finally:
+            controller.stop()
+            os.close(master)
+            os.close(slave)
+
+    latency = controller.get_input_latency()
+    print("%d keys over a pty (%d in menus), at %s intervals" % (latency.get_count(), menu_keys,
+                                                                  format_time(KEY_INTERVAL)))
+    print(latency)
+    print(controller.get_command_queue())
+    print(controller.get_loop_statistics())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,102 @@
+import argparse
+import os
+import sys
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from time import perf_counter
+
+import numpy as np
+
+from model.level_generator import generate_level
+from model.level_generator.validation import check_reachability
+
+COLUMNS = (("seed", np.uint32),
+           ("level", np.int16),
+           ("rooms", np.int16),
+           ("unreachable_rooms", np.int16),
+           ("door_reachable", bool),
+           ("walkable_ratio", np.float32),
+           ("mobs", np.int32),
+           ("hearts", np.int32),
+           ("generation_time", np.float32))
+ROW_GROUP_SIZE = 256
+
+
+def farm_level(seed, level):
+    """Generates the given level of the given seed, checks its reachability, and
+    returns its statistics.
+    :param seed: the seed of the run
+    :param level: the level to generate
+    :return: the tuple of statistics, in the order of COLUMNS
+    """
+    start = perf_counter()
+    game_grid = generate_level(level, seed=seed)
+    generation_time = perf_counter() - start
+
+    unreachable_rooms, door_reachable = check_reachability(game_grid)
+    terrain = game_grid.get_terrain()
+    walkable_ratio = np.count_nonzero(terrain == 1) / terrain.size
+
+    return (seed, level, len(game_grid.get_rooms()), unreachable_rooms, door_reachable, walkable_ratio,
+            len(game_grid.get_mob_store()), len(game_grid.get_hearts()), generation_time)
+
+
+def write_row_group(archive: zipfile.ZipFile, group, rows):
+    """Appends the given rows to the given archive as one row group, one .npy
+    member per column, named "<group>/<column>".
+    :param archive: the open .npz archive to append to
+    :param group: the index of the row group
+    :param rows: the list of statistics tuples, in the order of COLUMNS
+    :return: None
+    """
+    for (name, dtype), values in zip(COLUMNS, zip(*rows)):
+        with archive.open("%05d/%s.npy" % (group, name), "w") as member:
+            np.lib.format.write_array(member, np.array(values, dtype=dtype))
+
+
+def main(argv=None):
+    """Generates and validates the given level for a range of seeds across a process
+    pool, streaming per-level statistics to a columnar .npz file in row groups, and
+    prints the throughput and the number of levels failing validation. Exits with
+    status 1 if any level has a room or door unreachable from the spawn. Run from
+    the src directory with: python -m benchmark.level_farm --seeds 10000
+    Load the output with np.load, whose keys are "<row group>/<column>".
+    :param argv: the command-line arguments, or None to use sys.argv
+    :return: None
+    """
+    parser = argparse.ArgumentParser(description="Generate, validate and catalogue dungeon levels.")
+    parser.add_argument("--seeds", type=int, default=1000, help="the number of seeds to generate")
+    parser.add_argument("--first-seed", type=int, default=0, help="the first seed to generate")
+    parser.add_argument("--level", type=int, default=0, help="the level to generate for each seed")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="the number of worker processes")
+    parser.add_argument("--output", default="level_farm.npz", help="the columnar file to write")
+    parser.add_argument("--row-group", type=int, default=ROW_GROUP_SIZE, help="the number of levels per row group")
+    args = parser.parse_args(argv)
+
+    seeds = range(args.first_seed, args.first_seed + args.seeds)
+    failures = 0
+    rows = []
+    group = 0
+    start = perf_counter()
+    with ProcessPoolExecutor(max_workers=args.workers) as executor, \
+            zipfile.ZipFile(args.output, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for row in executor.map(farm_level, seeds, [args.level] * len(seeds), chunksize=max(1, args.row_group // 4)):
+            rows.append(row)
+            if row[3] or not row[4]:
+                failures += 1
+            if len(rows) == args.row_group:
+                write_row_group(archive, group, rows)
+                group += 1
+                rows = []
+        if rows:
+            write_row_group(archive, group, rows)
+    elapsed = perf_counter() - start
+
+    print("%d levels in %.2f s (%.0f levels/s) on %d workers, %d failing validation, written to %s"
+          % (len(seeds), elapsed, len(seeds) / elapsed, args.workers, failures, args.output))
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
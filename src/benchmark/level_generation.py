@@ -0,0 +1,51 @@
+import hashlib
+
+from benchmark import time_per_call, format_time
+from model.level_generator import generate_level, generate_terrain
+
+SEEDS = range(8)
+LEVELS = (0, 5, 20)
+
+
+def level_digest(game_grid):
+    """Returns a short digest of the terrain, mobs and hearts of the given Game Grid,
+    which changes whenever the generator draws differently for the same seed.
+    :param game_grid: the Game Grid to digest
+    :return: the first 12 hexadecimal digits of the digest
+    """
+    digest = hashlib.sha256(game_grid.get_terrain().tobytes())
+    for mob in sorted(game_grid.get_mob_store().get_mobs(), key=lambda mob: (mob.get_y(), mob.get_x())):
+        digest.update(b"m%d,%d" % (mob.get_x(), mob.get_y()))
+    for heart in sorted(game_grid.get_occupancy_grid().get_window(0, game_grid.get_rows(),
+                                                                  0, game_grid.get_columns())[1].nonzero()[0]):
+        digest.update(b"h%d" % heart)
+
+    return digest.hexdigest()[:12]
+
+
+def main():
+    """Prints the cost of generating a level with a cold and a warm terrain cache,
+    and a digest of each (seed, level) pair of SEEDS and LEVELS. The digests
+    must be identical from run to run; a change means the generator no longer
+    reproduces its levels. Run from the src directory with:
+    python -m benchmark.level_generation
+    :return: None
+    """
+    for level in LEVELS:
+        assert level_digest(generate_level(level, seed=0)) == level_digest(generate_level(level, seed=0))
+
+        def cold():
+            generate_terrain.cache_clear()
+            generate_level(level, seed=0)
+
+        warm = time_per_call(lambda: generate_level(level, seed=0), repeat=3, number=50)
+        print("level %2d: cold %s, cached terrain %s" % (level, format_time(time_per_call(cold, repeat=3, number=50)),
+                                                         format_time(warm)))
+
+    print("digests:")
+    for seed in SEEDS:
+        print("  seed %d: %s" % (seed, " ".join(level_digest(generate_level(level, seed=seed)) for level in LEVELS)))
+
+
+if __name__ == '__main__':
+    main()
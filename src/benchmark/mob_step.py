@@ -0,0 +1,88 @@
+import numpy as np
+
+from benchmark import time_per_call, format_time
+from model.game_grid import GameGrid
+from model.living_entity.mob import Rat
+from model.living_entity.mob.mob_store import MobStore
+from model.living_entity.player import Player
+from model.position import Position
+
+ARENA_SIZE = 160
+
+
+def legacy_move_mob(game_grid, mob):
+    """Steps the given mob the way GameGrid.move_mob did before mobs were stepped
+    in batches, one Position comparison and move call at a time.
+    :param game_grid: the Game Grid in which the mob lives
+    :param mob: the mob to step
+    :return: None
+    """
+    player_position = game_grid.get_position()
+    if mob.get_position().distance_to(player_position) <= 18 and mob.get_position().distance_to(player_position) != 1:
+        if abs(mob.get_y() - game_grid.get_y()) > 1:
+            if mob.get_y() > game_grid.get_y():
+                game_grid.move_up(mob)
+            if mob.get_y() < game_grid.get_y():
+                game_grid.move_down(mob)
+        if abs(mob.get_x() - game_grid.get_x()) > 1:
+            if mob.get_x() > game_grid.get_x():
+                game_grid.move_left(mob)
+            if mob.get_x() < game_grid.get_x():
+                game_grid.move_right(mob)
+    if abs(mob.get_position() - player_position) == Position(1, 1):
+        if mob.get_x() < game_grid.get_x():
+            game_grid.move_right(mob)
+        else:
+            game_grid.move_left(mob)
+
+    if mob.get_position().distance_to(player_position) == 1:
+        if mob.get_weapon_position() == player_position:
+            game_grid.get_player().take_damage(mob.get_attack())
+        else:
+            mob.turn_to_face(player_position)
+
+
+def make_arena(num_mobs, seed=0):
+    """Returns a Game Grid of an open square arena with the player at its center
+    and the given number of Rats scattered over distinct tiles.
+    :param num_mobs: the number of Rats to scatter
+    :param seed: the seed from which the Rat positions are drawn
+    :return: the Game Grid of the arena
+    """
+    level_data = np.ones((ARENA_SIZE, ARENA_SIZE), dtype=np.int8)
+    level_data[[0, -1], :] = 0
+    level_data[:, [0, -1]] = 0
+    center = ARENA_SIZE // 2
+
+    tiles = np.random.default_rng(seed).permutation((ARENA_SIZE - 2) ** 2)[:num_mobs + 1]
+    tiles = tiles[tiles != (center - 1) * (ARENA_SIZE - 2) + center - 1][:num_mobs]
+    store = MobStore(num_mobs)
+    mobs = {}
+    for tile in tiles.tolist():
+        mob = Rat(Position(tile % (ARENA_SIZE - 2) + 1, tile // (ARENA_SIZE - 2) + 1), store=store)
+        mobs[mob.get_mob_id()] = mob
+
+    return GameGrid(mobs=mobs, level_data=level_data, player=Player(health=10 ** 9, position=Position(center, center)))
+
+
+def main():
+    """Prints the per-step cost of stepping every mob one at a time, as update_mobs
+    did before mobs were stepped in batches, against the batched Mob Store step, for
+    growing numbers of mobs scattered over an open arena. Run from the src directory
+    with: python -m benchmark.mob_step
+    :return: None
+    """
+    print("%8s %16s %16s" % ("mobs", "per-object", "batched"))
+    for num_mobs in (100, 1000, 10000, 20000):
+        legacy_grid = make_arena(num_mobs)
+        mobs = list(legacy_grid.get_mob_store().get_mobs())
+        before = time_per_call(lambda: [legacy_move_mob(legacy_grid, mob) for mob in mobs], repeat=3, number=5)
+
+        batched_grid = make_arena(num_mobs)
+        after = time_per_call(batched_grid.update_mobs, repeat=3, number=20)
+
+        print("%8d %16s %16s" % (num_mobs, format_time(before), format_time(after)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,136 @@
+from collections import deque
+
+import numpy as np
+
+from benchmark import time_per_call, format_time
+from benchmark.mob_step import legacy_move_mob
+from model.flow_field import FlowField, compute_distance_field, UNREACHABLE
+from model.game_grid import GameGrid, MOB_CHASE_RADIUS, FLOW_FIELD_RADIUS
+from model.level_generator import generate_level
+from model.living_entity.mob import Rat
+from model.living_entity.player import Player
+from model.position import Position
+
+STEPS = 40
+SEED = 3
+
+
+def legacy_chase(game_grid):
+    """Steps every mob one at a time with the per-mob move_mob loop that update_mobs
+    ran before mobs were stepped in batches and chased along the Flow Field,
+    vertically and then horizontally straight towards the player, however the
+    walls lie.
+    :param game_grid: the Game Grid whose mobs to step
+    :return: None
+    """
+    for mob in list(game_grid.get_mob_store().get_mobs()):
+        legacy_move_mob(game_grid, mob)
+
+
+def flow_field_lookup(game_grid, flow_field, origins):
+    """Rebuilds the given Flow Field towards the next of the given origins and finds
+    the next step of every mob along it, without stepping them.
+    :param game_grid: the Game Grid whose mobs to look up
+    :param flow_field: the Flow Field over the Game Grid's terrain
+    :param origins: the deque of player positions towards which to rebuild the
+    field in turn, so that every call rebuilds it
+    :return: None
+    """
+    origins.rotate()
+    flow_field.update(*origins[0])
+    store = game_grid.get_mob_store()
+    flow_field.get_next_directions(store.get_x(), store.get_y(), game_grid.get_occupancy_grid().are_occupied)
+
+
+def populate(terrain, spawn, num_mobs, seed=0):
+    """Returns a Game Grid of the given terrain, with the player at the given spawn
+    and the given number of Rats on random walkable tiles within MOB_CHASE_RADIUS of it.
+    :param terrain: the level data of the Game Grid
+    :param spawn: the position of the player
+    :param num_mobs: the number of Rats to spawn
+    :param seed: the seed of the random spawn positions
+    :return: the populated Game Grid
+    """
+    ys, xs = np.nonzero(terrain == 1)
+    nearby = (xs - spawn.get_x()) ** 2 + (ys - spawn.get_y()) ** 2 <= MOB_CHASE_RADIUS ** 2
+    nearby &= (xs != spawn.get_x()) | (ys != spawn.get_y())
+    tiles = np.random.default_rng(seed).permutation(np.flatnonzero(nearby))[:num_mobs]
+
+    mobs = {}
+    for tile in tiles:
+        mob = Rat(Position(int(xs[tile]), int(ys[tile])))
+        mobs[mob.get_mob_id()] = mob
+
+    return GameGrid(mobs=mobs, level_data=terrain, player=Player(position=Position(spawn.get_x(), spawn.get_y())))
+
+
+def mean_walking_distance(game_grid):
+    """Returns the mean walking distance to the player from the mobs that can reach it.
+    :param game_grid: the Game Grid whose mobs to measure
+    :return: the mean walking distance to the player
+    """
+    terrain = game_grid.get_terrain()
+    distances, _, _ = compute_distance_field((terrain == 1) | (terrain == -1), game_grid.get_x(), game_grid.get_y())
+    store = game_grid.get_mob_store()
+    mob_distances = distances[store.get_y(), store.get_x()]
+    return mob_distances[mob_distances != UNREACHABLE].mean()
+
+
+def run(game_grid, chase, steps):
+    """Runs the given number of steps, each moving the player back or forth and
+    then chasing it with the given chase.
+    :param game_grid: the Game Grid in which to run the steps
+    :param chase: the callable stepping the mobs of a Game Grid
+    :param steps: the number of steps to run
+    :return: None
+    """
+    for step in range(steps):
+        if step % 2 == 0:
+            game_grid.move_left(game_grid.get_player())
+        else:
+            game_grid.move_right(game_grid.get_player())
+        chase(game_grid)
+
+
+def main():
+    """Prints, for 10, 100 and up to 1000 mobs spawned around the player of a seeded
+    level, as many as there are walkable tiles within MOB_CHASE_RADIUS of it,
+    the per-step cost of the per-mob move_mob loop against that of rebuilding the
+    Flow Field and looking up the next step of every mob along it, which is the
+    pathfinding that replaced it. The move_mob loop also steps each mob as it
+    goes, whereas the batched step is left out, as it is benchmarked by mob_step. Also prints the mean walking distance from the mobs
+    to the player before and after STEPS steps of each chase, the Flow Field
+    chase being a full update_mobs. Run from the src directory with:
+    python -m benchmark.pathfinding
+    :return: None
+    """
+    level = generate_level(seed=SEED)
+    terrain = level.get_terrain()
+    spawn = level.get_position()
+    x, y = spawn.get_x(), spawn.get_y()
+    neighbour = next((x + dx, y + dy) for dx, dy in ((-1, 0), (1, 0), (0, -1), (0, 1))
+                     if terrain[y + dy, x + dx] in (1, -1))
+    origins = deque(((x, y), neighbour))
+
+    print("%6s %12s %12s %18s %18s" % ("mobs", "move_mob", "flow field", "move_mob distance", "flow distance"))
+    for num_mobs in (10, 100, 1000):
+        game_grid = populate(terrain, spawn, num_mobs)
+        num_spawned = len(game_grid.get_mob_store().get_mobs())
+        before = time_per_call(lambda: legacy_chase(game_grid), repeat=3, number=10)
+
+        game_grid = populate(terrain, spawn, num_mobs)
+        flow_field = FlowField(terrain, FLOW_FIELD_RADIUS)
+        after = time_per_call(lambda: flow_field_lookup(game_grid, flow_field, origins), repeat=3, number=10)
+
+        distances = []
+        for chase in (legacy_chase, GameGrid.update_mobs):
+            game_grid = populate(terrain, spawn, num_mobs)
+            start = mean_walking_distance(game_grid)
+            run(game_grid, chase, STEPS)
+            distances.append("%.1f -> %.1f" % (start, mean_walking_distance(game_grid)))
+
+        print("%6d %12s %12s %18s %18s" % (num_spawned, format_time(before), format_time(after), *distances))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+import io
+import tempfile
+from time import perf_counter
+
+import numpy as np
+
+from benchmark import format_time
+from model import Model, GameState
+from model.level_generator import generate_level
+from model.phase_profiler import PhaseProfiler, set_active_profiler
+from view import View
+from view.terminal_renderer import TerminalRenderer
+
+TICKS = 2000
+SEED = 7
+RUNS = 5
+
+
+def play(profiler):
+    """Plays TICKS ticks of a seeded level, the player walking at random, and
+    renders a frame after every tick to memory, with the given profiler active.
+    :param profiler: the Phase Profiler to make active, or None to profile nothing
+    :return: the time taken, in seconds
+    """
+    with tempfile.TemporaryDirectory() as save_directory:
+        model = Model(generate_level(seed=SEED), GameState.IN_GAME, save_directory=save_directory)
+        view = View(model, TerminalRenderer(stream=io.StringIO()))
+        moves = (model.move_left, model.move_right, model.move_up, model.move_down, model.player_attack)
+        actions = np.random.default_rng(SEED).integers(len(moves), size=TICKS)
+
+        set_active_profiler(profiler)
+        try:
+            start = perf_counter()
+            for action in actions.tolist():
+                moves[action]()
+                model.tick()
+                model.request_update()
+                view.display()
+            elapsed = perf_counter() - start
+        finally:
+            set_active_profiler(None)
+            model.shutdown()
+
+    return elapsed
+
+
+def main():
+    """Plays the same game with phase profiling off and on, RUNS times each, and
+    prints the time per tick and frame of each, the overhead of profiling, and
+    the profiled phase statistics. Run from the src directory with:
+    python -m benchmark.phase_profile
+    :return: None
+    """
+    profiler = PhaseProfiler()
+    disabled = min(play(None) for _ in range(RUNS))
+    enabled = min(play(profiler) for _ in range(RUNS))
+
+    print("profiling off: %s per tick and frame" % format_time(disabled / TICKS))
+    print("profiling on:  %s per tick and frame (%+.1f%%)"
+          % (format_time(enabled / TICKS), 100 * (enabled / disabled - 1)))
+    print(profiler)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+from random import Random
+
+import numpy as np
+
+from benchmark import time_per_call, format_time
+from model.level_generator import init_rooms, MIN_NUM_ROOMS, MAX_NUM_ROOMS, MIN_ROOM_WIDTH, MAX_ROOM_WIDTH, \
+    MIN_ROOM_HEIGHT, MAX_ROOM_HEIGHT
+from model.level_generator.room import Room
+from model.position import Position
+
+SIZES = ((202, 68), (404, 136), (808, 272), (1616, 544))
+SAMPLES = 500
+
+
+def legacy_init_rooms(level_map, rng, num_rooms):
+    """Places rooms the way init_rooms did before placement was batched: up to
+    MIN_NUM_ROOMS x num_rooms single attempts, each checked against every accepted
+    room with Room.overlaps.
+    :param level_map: the level data, in which to insert rooms
+    :param rng: the random number generator from which to draw
+    :param num_rooms: the number of attempts per round
+    :return: the list of rooms
+    """
+    rows, columns = level_map.shape
+    rooms = []
+    for i in range(MIN_NUM_ROOMS):
+        for j in range(num_rooms):
+            x = rng.randrange(0, columns)
+            y = rng.randrange(0, rows)
+            room = Room(Position(x, y), rng.randrange(MIN_ROOM_WIDTH, MAX_ROOM_WIDTH),
+                        rng.randrange(MIN_ROOM_HEIGHT, MAX_ROOM_HEIGHT))
+            if room.lies_within(Position(0, 0), Position(columns, rows)) and not room.overlaps(rooms):
+                rooms.append(room)
+
+    for room in rooms:
+        level_map[room.get_y():room.get_y() + room.get_height(), room.get_x():room.get_x() + room.get_width()] = 1
+
+    return rooms
+
+
+def main():
+    """Prints the cost of placing rooms one attempt at a time and in batches, on
+    levels of the default size and of two, four and eight times its width and
+    height. The one-at-a-time placer makes a number of attempts scaled with the
+    area, and the batched placer is asked for as many rooms as it placed. Also
+    prints the fewest rooms either placed on SAMPLES default-size levels.
+    Run from the src directory with: python -m benchmark.room_placement
+    :return: None
+    """
+    print("%12s %8s %14s %14s" % ("level", "rooms", "one at a time", "batched"))
+    for scale, (width, height) in enumerate(SIZES):
+        attempts = MIN_NUM_ROOMS * 4 ** scale
+        shape = (height - 2, width - 2)
+        num_rooms = len(legacy_init_rooms(np.zeros(shape, dtype=np.int8), Random(0), attempts))
+        legacy = time_per_call(lambda: legacy_init_rooms(np.zeros(shape, dtype=np.int8), Random(0), attempts),
+                               repeat=3, number=3)
+        batched = time_per_call(lambda: init_rooms(np.zeros(shape, dtype=np.int8), Random(0), num_rooms),
+                                repeat=3, number=3)
+        print("%12s %8d %14s %14s" % ("%dx%d" % (width, height), num_rooms, format_time(legacy), format_time(batched)))
+
+    shape = (SIZES[0][1] - 2, SIZES[0][0] - 2)
+    legacy_counts = [len(legacy_init_rooms(np.zeros(shape, dtype=np.int8), Random(seed),
+                                           Random(seed).randrange(MIN_NUM_ROOMS, MAX_NUM_ROOMS)))
+                     for seed in range(SAMPLES)]
+    batched_counts = [len(init_rooms(np.zeros(shape, dtype=np.int8), Random(seed))) for seed in range(SAMPLES)]
+    print("fewest rooms over %d levels: one at a time %d, batched %d"
+          % (SAMPLES, min(legacy_counts), min(batched_counts)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+import os
+import tempfile
+
+from dill import dump, dumps, loads
+
+from benchmark import time_per_call, format_time
+from model.level_generator import generate_level
+from model.save_format import encode_game_grid, decode_game_grid, read_save, write_save
+
+LEVELS = (0, 10, 40)
+
+
+def main():
+    """Prints, for a Game Grid of each of LEVELS, the size of a save and the time to
+    encode, decode, write and read it, with dill, with the binary save format,
+    including a read that memory-maps the level data, and with a seeded save,
+    whose decoding generates the level again from its seed. Run from the src
+    directory with: python -m benchmark.save_format
+    :return: None
+    """
+    directory = tempfile.mkdtemp()
+    dill_path = os.path.join(directory, "dill.dat")
+    binary_path = os.path.join(directory, "binary.dat")
+    seeded_path = os.path.join(directory, "seeded.dat")
+
+    for level in LEVELS:
+        game_grid = generate_level(level, seed=0)
+        pickled = dumps(game_grid)
+        encoded = encode_game_grid(game_grid)
+        seeded = encode_game_grid(game_grid, seeded=True)
+        print("level %d (%d mobs, %d hearts):" % (level, len(game_grid.get_mob_store()), len(game_grid.get_hearts())))
+        print("  size:   dill %6d B, binary %6d B, seeded %6d B" % (len(pickled), len(encoded), len(seeded)))
+        print("  encode: dill %s, binary %s, seeded %s"
+              % (format_time(time_per_call(lambda: dumps(game_grid))),
+                 format_time(time_per_call(lambda: encode_game_grid(game_grid))),
+                 format_time(time_per_call(lambda: encode_game_grid(game_grid, seeded=True)))))
+        print("  decode: dill %s, binary %s, seeded %s"
+              % (format_time(time_per_call(lambda: loads(pickled))),
+                 format_time(time_per_call(lambda: decode_game_grid(encoded))),
+                 format_time(time_per_call(lambda: decode_game_grid(seeded)))))
+
+        def dill_write():
+            with open(dill_path, "wb") as save_file:
+                dump(game_grid, save_file)
+
+        print("  save:   dill %s, binary %s, seeded %s"
+              % (format_time(time_per_call(dill_write)),
+                 format_time(time_per_call(lambda: write_save(game_grid, binary_path))),
+                 format_time(time_per_call(lambda: write_save(game_grid, seeded_path, seeded=True)))))
+        print("  load:   dill %s, binary %s, memory-mapped %s, seeded %s"
+              % (format_time(time_per_call(lambda: read_save(dill_path))),
+                 format_time(time_per_call(lambda: read_save(binary_path))),
+                 format_time(time_per_call(lambda: read_save(binary_path, memory_map=True))),
+                 format_time(time_per_call(lambda: read_save(seeded_path)))))
+
+    os.remove(dill_path)
+    os.remove(binary_path)
+    os.remove(seeded_path)
+    os.rmdir(directory)
+
+
+if __name__ == '__main__':
+    main()
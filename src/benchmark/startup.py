@@ -0,0 +1,90 @@
+import subprocess
+import sys
+from collections import defaultdict
+
+from benchmark import format_time
+
+TARGETS = ("model", "view")
+TOP_MODULES = 15
+RUNS = 5
+STARTUP_SCRIPT = """
+import sys, tempfile
+from time import perf_counter
+start = perf_counter()
+import model
+import model.menu.asset_cache as asset_cache
+imported = perf_counter()
+if sys.argv[1] == "cold":
+    asset_cache.ASSET_CACHE_DIRECTORY = tempfile.mkdtemp()
+game_model = model.Model()
+constructed = perf_counter()
+game_model.get_current_game_state().get_full_background()
+drawn = perf_counter()
+game_model.shutdown()
+print(imported - start, constructed - imported, drawn - constructed)
+"""
+
+
+def import_times(target):
+    """Imports the given module in a fresh interpreter with -X importtime and
+    returns the time spent importing each module.
+    :param target: the name of the module to import
+    :return: a list of (module, self time, cumulative time, depth) tuples in import
+    order, the times in seconds
+    """
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", "import " + target],
+                            capture_output=True, text=True, check=True)
+    times = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_time, cumulative, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip())) // 2
+        times.append((name.strip(), int(self_time) / 1e6, int(cumulative) / 1e6, depth))
+
+    return times
+
+
+def startup_times(cache):
+    """Starts the model in a fresh interpreter and returns the best time of RUNS
+    runs for each startup phase.
+    :param cache: "warm" to use the menu asset cache, "cold" to start without one
+    :return: the time to import the model, construct it, and draw the first menu, in seconds
+    """
+    runs = [tuple(map(float, subprocess.run([sys.executable, "-c", STARTUP_SCRIPT, cache], capture_output=True,
+                                            text=True, check=True).stdout.split()))
+            for _ in range(RUNS)]
+
+    return tuple(min(phase) for phase in zip(*runs))
+
+
+def main():
+    """Prints, for each of TARGETS, the total import time, the time by top-level
+    package and the TOP_MODULES modules with the highest self time, as reported by
+    python -X importtime, then the time to import the model, construct it and draw
+    the first menu with a warm and a cold menu asset cache. Run from the src
+    directory with: python -m benchmark.startup
+    :return: None
+    """
+    for target in TARGETS:
+        times = import_times(target)
+        by_package = defaultdict(float)
+        for name, self_time, _, _ in times:
+            by_package[name.split(".")[0]] += self_time
+
+        print("import %s: %s" % (target, format_time(sum(self_time for _, self_time, _, _ in times))))
+        print("  by package:")
+        for package, self_time in sorted(by_package.items(), key=lambda item: -item[1])[:TOP_MODULES]:
+            print("    %-28s %s" % (package, format_time(self_time)))
+        print("  by module (self, cumulative):")
+        for name, self_time, cumulative, _ in sorted(times, key=lambda item: -item[1])[:TOP_MODULES]:
+            print("    %-40s %10s %10s" % (name, format_time(self_time), format_time(cumulative)))
+
+    for cache in ("warm", "cold"):
+        imported, constructed, drawn = startup_times(cache)
+        print("startup, %s asset cache: import %s, Model() %s, first menu %s"
+              % (cache, format_time(imported), format_time(constructed), format_time(drawn)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,42 @@
+import io
+import tempfile
+
+from model import Model, GameState
+from model.level_generator import generate_level
+from view import View
+from view.terminal_renderer import TerminalRenderer
+
+SEED = 7
+
+
+def main():
+    """Walks the player around a freshly generated level and prints the bytes
+    written per frame by the diff-based Terminal Renderer, alongside the bytes
+    a full reprint of every frame would have written. Run from the src
+    directory with: python -m benchmark.terminal_render
+    :return: None
+    """
+    with tempfile.TemporaryDirectory() as save_directory:
+        model = Model(generate_level(seed=SEED), GameState.IN_GAME, save_directory=save_directory)
+        renderer = TerminalRenderer(stream=io.StringIO())
+        view = View(model, renderer)
+        moves = [model.move_left] * 8 + [model.move_down] * 4 + [model.move_right] * 8 + [model.move_up] * 4
+
+        view.display()
+        full_frame_bytes = renderer.get_last_frame_bytes()
+        for move in moves:
+            move()
+            model.request_update()
+            view.display()
+        model.shutdown()
+
+    diff_frames = renderer.get_frame_count() - renderer.get_full_redraw_count()
+    diff_bytes = renderer.get_total_bytes() - full_frame_bytes
+
+    print("full redraw:        %d bytes per frame" % full_frame_bytes)
+    print("diff redraw:        %.0f bytes per frame over %d moves" % (diff_bytes / diff_frames, diff_frames))
+    print("bandwidth saved:    %.1f%%" % (100 * (1 - diff_bytes / (diff_frames * full_frame_bytes))))
+
+
+if __name__ == '__main__':
+    main()
@@ -1,52 +1,48 @@
+import threading
 from os import system
+from time import perf_counter
 
-from pynput import keyboard
-from pynput.keyboard import Controller as KeyBoardController
-from pynput.keyboard import Key, KeyCode
-
-from controller.repeat_timer import RepeatTimer
+from controller.command_queue import CommandQueue
+from controller.game_loop import GameLoop
+from controller.input_backend import make_input_backend
+from controller.input_latency import InputLatency
+from controller.journal import JournalRecorder
+from controller.key_map import build_key_map, perform_key, EXIT_KEY
 from model import GameState
+from model.phase_profiler import PhaseProfiler, set_active_profiler
+from model.settings import FRAME_RATE, JOURNAL_PATH, INPUT_BACKEND, PROFILE_PHASES, PROFILE_DUMP_PATH
 from view import View
 
 
 class Controller:
     """This class represents a Controller in Dungeon Crawler"""
 
-    def __init__(self, model):
-        """Constructs a Controller with the given Model.
+    def __init__(self, model, frame_rate=FRAME_RATE, journal_path=JOURNAL_PATH, input_backend=None, renderer=None):
+        """Constructs a Controller with the given Model and frame rate. The
+        simulation runs at the Model's tick rate, while frames are rendered
+        at most frame_rate times per second. If no frame rate is provided,
+        the frame rate defaults to FRAME_RATE. Every key performed is recorded to
+        the journal at journal_path, from which the session can be replayed. If
+        PROFILE_PHASES is True, the phases of each tick and frame are profiled, and
+        their statistics written to PROFILE_DUMP_PATH on exit.
         :param model: the model to be controlled
+        :param frame_rate: the maximum number of frames rendered per second
+        :param journal_path: the path of the journal to record, or None to record none
+        :param input_backend: the Input Backend from which keys are read, or None for the INPUT_BACKEND backend
+        :param renderer: the render backend of the View, or None for a Terminal Renderer on standard output
         """
         self._model = model
-        self._view = View(self._model)
-        self._cont = KeyBoardController()
-        self._update_clock = RepeatTimer(0.5, self.update)
-        _in_game_key_map = {KeyCode.from_char('w'): self._model.move_up,
-                            KeyCode.from_char('s'): self._model.move_down,
-                            KeyCode.from_char('a'): self._model.move_left,
-                            KeyCode.from_char('d'): self._model.move_right,
-                            Key.space: self._model.player_attack,
-                            Key.esc: self._model.set_game_state_pause_menu}
-        _main_menu_key_map = {KeyCode.from_char('w'): self._model.get_game_state_at(GameState.MAIN_MENU).move_up,
-                              KeyCode.from_char('s'): self._model.get_game_state_at(GameState.MAIN_MENU).move_down,
-                              Key.space: self._model.choose}
-        _load_menu_key_map = {KeyCode.from_char('w'): self._model.get_game_state_at(GameState.LOAD_MENU).move_up,
-                              KeyCode.from_char('s'): self._model.get_game_state_at(GameState.LOAD_MENU).move_down,
-                              KeyCode.from_char('c'): self._model.get_game_state_at(GameState.LOAD_MENU).delete_save,
-                              Key.space: self._model.choose,
-                              Key.esc: self._model.set_game_state_main_menu}
-        _pause_menu_key_map = {KeyCode.from_char('w'): self._model.get_game_state_at(GameState.PAUSE_MENU).move_up,
-                               KeyCode.from_char('s'): self._model.get_game_state_at(GameState.PAUSE_MENU).move_down,
-                               Key.space: self._model.choose,
-                               Key.esc: self._model.set_game_state_in_game}
-        _death_menu_key_map = {KeyCode.from_char('w'): self._model.get_game_state_at(GameState.DEATH_MENU).move_up,
-                               KeyCode.from_char('s'): self._model.get_game_state_at(GameState.DEATH_MENU).move_down,
-                               Key.space: self._model.choose}
-
-        self._key_map = {GameState.MAIN_MENU: _main_menu_key_map,
-                         GameState.PAUSE_MENU: _pause_menu_key_map,
-                         GameState.LOAD_MENU: _load_menu_key_map,
-                         GameState.IN_GAME: _in_game_key_map,
-                         GameState.DEATH_MENU: _death_menu_key_map}
+        self._view = View(self._model, renderer)
+        self._input = input_backend if input_backend is not None else make_input_backend(INPUT_BACKEND)
+        self._commands = CommandQueue()
+        self._game_loop = GameLoop(self.update, self.render, self._model.get_tick_rate(), frame_rate)
+        self._key_map = build_key_map(self._model)
+        self._recorder = JournalRecorder(journal_path, self._model) if journal_path is not None else None
+        self._input_latency = InputLatency()
+        self._awaiting_frame = []
+        self._exited = threading.Event()
+        self._profiler = PhaseProfiler() if PROFILE_PHASES else None
+        set_active_profiler(self._profiler)
 
     def get_game_state(self):
         """Retrieves the current Game State type.
@@ -54,49 +50,133 @@ class Controller:
         """
         return self._model.get_game_state()
 
-    def on_press(self, key):
-        """Performs the action mapped to the given key,
+    def get_loop_statistics(self):
+        """Retrieves the frame pacing statistics of the game loop.
+        :return: the frame pacing statistics of the game loop
+        """
+        return self._game_loop.get_statistics()
+
+    def get_command_queue(self):
+        """Retrieves the queue of commands awaiting the simulation thread, e.g. to
+        report how long commands wait in it.
+        :return: the queue of commands awaiting the simulation thread
+        """
+        return self._commands
+
+    def get_recorder(self):
+        """Retrieves the Journal Recorder recording the session.
+        :return: the Journal Recorder recording the session, or None if none is recorded
+        """
+        return self._recorder
+
+    def get_profiler(self):
+        """Retrieves the Phase Profiler profiling the session.
+        :return: the Phase Profiler profiling the session, or None if phases are not profiled
+        """
+        return self._profiler
+
+    def get_input_backend(self):
+        """Retrieves the Input Backend from which keys are read.
+        :return: the Input Backend from which keys are read
+        """
+        return self._input
+
+    def get_input_latency(self):
+        """Retrieves the key-to-frame latency statistics of the session.
+        :return: the key-to-frame latency statistics of the session
+        """
+        return self._input_latency
+
+    def on_key(self, key, time):
+        """Enqueues the given key for the simulation thread to perform on its next
+        tick, or exits if it is EXIT_KEY. Called from the input backend's thread,
+        which never touches the model itself.
+        :param key: the key pressed, named by the character it types
+        :param time: the perf_counter time at which the key was read
+        :return: None
+        """
+        if key == EXIT_KEY:
+            self._exited.set()
+        else:
+            self._commands.put((time, key))
+
+    def perform(self, command):
+        """Performs the action mapped to the given key in the current Game State,
         if such a mapping exists.
-        :param key: the key pressed
+        The key is recorded to the journal before it is performed, so the journal
+        of a session that crashed ends with the key that crashed it.
+        :param command: the time at which the key was read, and the key pressed
         :return: None
         """
-        self._cont.press(Key.backspace)
-        try:
-            self._key_map[self.get_game_state()][key]()
-        except KeyError:
-            pass
-        except NotImplementedError:
-            pass
+        time, key = command
+        if self._recorder is not None and key in self._key_map.get(self.get_game_state(), ()):
+            self._recorder.record(self._model.get_tick_count(), key)
+        if perform_key(self._key_map, self._model, key):
+            self._awaiting_frame.append(time)
+
+    def render(self):
+        """Displays a frame, then records the key-to-frame latency of the keys
+        performed since the last frame.
+        :return: None
+        """
+        self._view.display()
+        if self._awaiting_frame:
+            now = perf_counter()
+            for time in self._awaiting_frame:
+                self._input_latency.record(now - time)
+            self._awaiting_frame.clear()
 
     def update(self):
-        """Requests update of model and view.
+        """Performs the keys pressed since the last tick, in order, then advances
+        the model by one simulation tick. Rendering is left to the game loop.
+        As this is the only thread that touches the model, no locking is needed.
         :return: None
         """
-        self._model.update_mobs()
+        self._commands.drain(self.perform)
+        self._model.tick()
         if self.get_game_state() == GameState.IN_GAME:
             self._model.end_game_if_player_dies()
 
-        self._view.display()
-
         if self.get_game_state() == GameState.EXIT:
-            self._cont.press(".")
+            self._exited.set()
+
+    def start(self):
+        """Starts reading keys and running the game loop.
+        :return: None
+        """
+        self._input.start(self.on_key)
+        self._game_loop.start()
+
+    def stop(self):
+        """Stops the game loop and the input backend, ends the journal, writes the
+        phase statistics if phases are profiled, and stops the model's background work.
+        :return: None
+        """
+        self._game_loop.cancel()
+        self._game_loop.join()
+        self._input.stop()
+        if self._recorder is not None:
+            self._recorder.close(self._model)
+        if self._profiler is not None:
+            self._profiler.dump(PROFILE_DUMP_PATH)
+            set_active_profiler(None)
+        self._model.shutdown()
+
+    def wait_until_exited(self, timeout=None):
+        """Waits until the game is exited, from the menus or with EXIT_KEY.
+        :param timeout: the number of seconds after which to stop waiting, or None to wait indefinitely
+        :return: True if the game was exited, else False
+        """
+        return self._exited.wait(timeout)
 
     def go(self):
         """Runs Dungeon Crawler until exited.
         :return: None
         """
         system("clear")
-        with keyboard.Events() as events:
-            self._update_clock.start()
-            self._cont.press(Key.backspace)
-            for event in events:
-                if event.key == KeyCode.from_char("."):
-                    self._cont.press(Key.backspace)
-                    self._update_clock.cancel()
-                    exit(0)
-                elif event.key == Key.backspace:
-                    continue
-                else:
-                    if isinstance(event, keyboard.Events.Press):
-                        self.on_press(event.key)
-                        self._view.display()
+        self.start()
+        try:
+            self.wait_until_exited()
+        finally:
+            self.stop()
+        exit(0)
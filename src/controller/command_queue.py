@@ -0,0 +1,89 @@
+from collections import deque
+from time import perf_counter
+
+
+class CommandQueue:
+    """This class represents a queue of commands passed from input threads to the
+    simulation thread. It is built on a deque, whose append and popleft are atomic,
+    so neither side ever takes a lock."""
+    def __init__(self):
+        """Constructs an empty Command Queue."""
+        self._queue = deque()
+        self._commands_run = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+        self._max_depth = 0
+        self._max_put_time = 0.0
+
+    def put(self, command):
+        """Enqueues the given command, stamped with the time it was enqueued.
+        May be called from any thread.
+        :param command: the command to enqueue
+        :return: None
+        """
+        start = perf_counter()
+        self._queue.append((start, command))
+        put_time = perf_counter() - start
+        if put_time > self._max_put_time:
+            self._max_put_time = put_time
+
+    def drain(self, perform):
+        """Performs the given callable on each command enqueued before the call, in
+        the order they were enqueued. Commands enqueued while draining are left for
+        the next drain. Must only be called from the simulation thread.
+        :param perform: the callable to which each command is passed
+        :return: None
+        """
+        depth = len(self._queue)
+        if depth > self._max_depth:
+            self._max_depth = depth
+
+        for _ in range(depth):
+            enqueued, command = self._queue.popleft()
+            wait = perf_counter() - enqueued
+            self._total_wait += wait
+            if wait > self._max_wait:
+                self._max_wait = wait
+            self._commands_run += 1
+            perform(command)
+
+    def get_commands_run(self):
+        """Returns the number of commands performed.
+        :return: the number of commands performed
+        """
+        return self._commands_run
+
+    def get_mean_wait(self):
+        """Returns the mean time commands waited in the queue, in seconds.
+        :return: the mean time commands waited in the queue, in seconds
+        """
+        if self._commands_run == 0:
+            return 0.0
+        return self._total_wait / self._commands_run
+
+    def get_max_wait(self):
+        """Returns the longest time a command waited in the queue, in seconds.
+        :return: the longest time a command waited in the queue, in seconds
+        """
+        return self._max_wait
+
+    def get_max_depth(self):
+        """Returns the largest number of commands found waiting at a single drain.
+        :return: the largest number of commands found waiting at a single drain
+        """
+        return self._max_depth
+
+    def get_max_put_time(self):
+        """Returns the longest time an enqueue took, in seconds. As enqueueing never
+        waits on the simulation thread, this stays in the microsecond range.
+        :return: the longest time an enqueue took, in seconds
+        """
+        return self._max_put_time
+
+    def __str__(self):
+        """Returns the queue statistics as a one-line summary.
+        :return: the queue statistics as a one-line summary
+        """
+        return ("commands: %d (wait mean %.2f ms, max %.2f ms, max depth %d, max enqueue %.1f us)"
+                % (self._commands_run, self.get_mean_wait() * 1e3, self._max_wait * 1e3,
+                   self._max_depth, self._max_put_time * 1e6))
@@ -0,0 +1,185 @@
+import threading
+from math import sqrt
+from time import perf_counter
+
+MAX_CATCH_UP_TICKS = 5
+
+
+class LoopStatistics:
+    """This class represents the frame pacing statistics of a Game Loop"""
+    def __init__(self, tick_interval, frame_interval):
+        """Constructs empty Loop Statistics for the given target tick and frame intervals.
+        :param tick_interval: the target time between simulation ticks, in seconds
+        :param frame_interval: the target time between rendered frames, in seconds
+        """
+        self._tick_interval = tick_interval
+        self._frame_interval = frame_interval
+        self._ticks = 0
+        self._tick_overruns = 0
+        self._dropped_ticks = 0
+        self._max_tick_time = 0.0
+        self._frames = 0
+        self._last_frame_time = None
+        self._frame_interval_mean = 0.0
+        self._frame_interval_m2 = 0.0
+
+    def record_tick(self, duration):
+        """Records a simulation tick that took the given time to run. The tick
+        overran if it took longer than the target tick interval.
+        :param duration: the time the tick took, in seconds
+        :return: None
+        """
+        self._ticks += 1
+        if duration > self._tick_interval:
+            self._tick_overruns += 1
+        if duration > self._max_tick_time:
+            self._max_tick_time = duration
+
+    def record_dropped_ticks(self, count):
+        """Records simulation ticks skipped because the loop fell too far behind.
+        :param count: the number of ticks skipped
+        :return: None
+        """
+        self._dropped_ticks += count
+
+    def record_frame(self, time):
+        """Records a frame rendered at the given time, updating the running mean and
+        variance of the interval between frames.
+        :param time: the time at which the frame was rendered, in seconds
+        :return: None
+        """
+        if self._last_frame_time is not None:
+            interval = time - self._last_frame_time
+            count = self._frames
+            delta = interval - self._frame_interval_mean
+            self._frame_interval_mean += delta / count
+            self._frame_interval_m2 += delta * (interval - self._frame_interval_mean)
+        self._last_frame_time = time
+        self._frames += 1
+
+    def get_ticks(self):
+        """Returns the number of simulation ticks run.
+        :return: the number of simulation ticks run
+        """
+        return self._ticks
+
+    def get_tick_overruns(self):
+        """Returns the number of simulation ticks that took longer than the tick interval.
+        :return: the number of simulation ticks that took longer than the tick interval
+        """
+        return self._tick_overruns
+
+    def get_dropped_ticks(self):
+        """Returns the number of simulation ticks skipped to catch up.
+        :return: the number of simulation ticks skipped to catch up
+        """
+        return self._dropped_ticks
+
+    def get_max_tick_time(self):
+        """Returns the longest time a simulation tick took, in seconds.
+        :return: the longest time a simulation tick took, in seconds
+        """
+        return self._max_tick_time
+
+    def get_frames(self):
+        """Returns the number of frames rendered.
+        :return: the number of frames rendered
+        """
+        return self._frames
+
+    def get_mean_frame_interval(self):
+        """Returns the mean time between rendered frames, in seconds.
+        :return: the mean time between rendered frames, in seconds
+        """
+        return self._frame_interval_mean
+
+    def get_frame_jitter(self):
+        """Returns the standard deviation of the time between rendered frames, in seconds.
+        :return: the standard deviation of the time between rendered frames, in seconds
+        """
+        if self._frames < 3:
+            return 0.0
+        return sqrt(self._frame_interval_m2 / (self._frames - 2))
+
+    def __str__(self):
+        """Returns the statistics as a one-line summary.
+        :return: the statistics as a one-line summary
+        """
+        return ("ticks: %d (%d overruns, %d dropped, max %.2f ms)  frames: %d (mean %.2f ms, jitter %.2f ms, target %.2f ms)"
+                % (self._ticks, self._tick_overruns, self._dropped_ticks, self._max_tick_time * 1e3,
+                   self._frames, self._frame_interval_mean * 1e3, self.get_frame_jitter() * 1e3,
+                   self._frame_interval * 1e3))
+
+
+class GameLoop(threading.Thread):
+    """This class represents a fixed-timestep game loop, which runs the simulation
+    at a fixed tick rate and renders at a separately capped frame rate."""
+    daemon = True
+
+    def __init__(self, update, render, tick_rate, frame_rate):
+        """Constructs a Game Loop calling the given update callable once per simulation
+        tick and the given render callable at most once per frame.
+        :param update: the callable advancing the simulation by one tick
+        :param render: the callable rendering a frame
+        :param tick_rate: the number of simulation ticks per second
+        :param frame_rate: the maximum number of frames rendered per second
+        """
+        super().__init__()
+        self._update = update
+        self._render = render
+        self._tick_interval = 1 / tick_rate
+        self._frame_interval = 1 / frame_rate
+        self._statistics = LoopStatistics(self._tick_interval, self._frame_interval)
+        self.finished = threading.Event()
+
+    def get_statistics(self):
+        """Returns the frame pacing statistics of the Game Loop.
+        :return: the frame pacing statistics of the Game Loop
+        """
+        return self._statistics
+
+    def cancel(self):
+        """Stops the Game Loop after the current tick or frame.
+        :return: None
+        """
+        self.finished.set()
+
+    def run(self):
+        """Runs as many simulation ticks as the elapsed time calls for, and renders
+        a frame whenever the frame interval has passed, until the cancel method is
+        called. If the simulation falls more than MAX_CATCH_UP_TICKS ticks behind,
+        the remaining ticks are dropped rather than run back to back.
+        :return: None
+        """
+        previous = perf_counter()
+        next_frame = previous
+        lag = 0.0
+
+        while not self.finished.is_set():
+            now = perf_counter()
+            lag += now - previous
+            previous = now
+
+            ticks = 0
+            while lag >= self._tick_interval and ticks < MAX_CATCH_UP_TICKS:
+                start = perf_counter()
+                self._update()
+                self._statistics.record_tick(perf_counter() - start)
+                lag -= self._tick_interval
+                ticks += 1
+
+            if lag >= self._tick_interval:
+                dropped = int(lag // self._tick_interval)
+                self._statistics.record_dropped_ticks(dropped)
+                lag -= dropped * self._tick_interval
+
+            now = perf_counter()
+            if now >= next_frame:
+                self._render()
+                self._statistics.record_frame(now)
+                next_frame += self._frame_interval
+                if next_frame < now:
+                    next_frame = now + self._frame_interval
+
+            next_tick = previous + self._tick_interval - lag
+            self.finished.wait(max(0.0, min(next_tick, next_frame) - perf_counter()))
@@ -0,0 +1,189 @@
+import os
+import sys
+import threading
+from abc import ABC, abstractmethod
+from time import perf_counter
+
+from controller.key_map import SPACE, ESCAPE
+
+ARROW_KEYS = {"A": "w", "B": "s", "C": "d", "D": "a"}
+READ_SIZE = 1024
+
+
+def decode_keys(text):
+    """Splits the given text read from a terminal into keys. The escape sequences
+    of the arrow keys are read as the movement keys they stand for, and any other
+    escape sequence is dropped; a lone escape character is the escape key.
+    :param text: the text read from the terminal
+    :return: the list of keys, each a single character
+    """
+    keys = []
+    index = 0
+    while index < len(text):
+        char = text[index]
+        index += 1
+        if char == ESCAPE and index < len(text) and text[index] in "[O":
+            end = index + 1
+            while end < len(text) and not ("@" <= text[end] <= "~"):
+                end += 1
+            if end < len(text) and text[end] in ARROW_KEYS and end == index + 1:
+                keys.append(ARROW_KEYS[text[end]])
+            index = end + 1
+        else:
+            keys.append(char)
+
+    return keys
+
+
+class InputBackend(ABC):
+    """This class represents a source of key presses. Once started, a backend
+    calls its listener from its own thread with each key, named by the character
+    it types, and the perf_counter time at which the key was read."""
+    @abstractmethod
+    def start(self, on_key):
+        """Starts listening for keys.
+        :param on_key: the callable to which each key and the time it was read are passed
+        :return: None
+        """
+
+    @abstractmethod
+    def stop(self):
+        """Stops listening for keys and restores the state of the input device.
+        :return: None
+        """
+
+
+class TerminalInput(InputBackend):
+    """This class represents an input backend reading raw keys from a terminal. The
+    terminal is put in cbreak mode, so keys are read as they are typed and are not
+    echoed, and a reader thread waits on the terminal with select, so it never
+    blocks the game and wakes as soon as a key arrives or it is stopped. Only
+    keys typed into the game's own terminal are read, and no display server is
+    needed, so it also runs over ssh or a pseudo-terminal."""
+    def __init__(self, fd=None):
+        """Constructs a Terminal Input reading the given terminal.
+        :param fd: the file descriptor of the terminal, or None for standard input
+        """
+        self._fd = fd
+        self._saved_attributes = None
+        self._wake_read = None
+        self._wake_write = None
+        self._thread = None
+
+    def start(self, on_key):
+        """Puts the terminal in cbreak mode and starts the reader thread.
+        :param on_key: the callable to which each key and the time it was read are passed
+        :return: None
+        """
+        # imported here, as termios and tty only exist on POSIX systems
+        import termios
+        import tty
+
+        if self._fd is None:
+            self._fd = sys.stdin.fileno()
+        self._saved_attributes = termios.tcgetattr(self._fd)
+        tty.setcbreak(self._fd)
+        self._wake_read, self._wake_write = os.pipe()
+        self._thread = threading.Thread(target=self._read, args=(on_key,), name="terminal-input", daemon=True)
+        self._thread.start()
+
+    def _read(self, on_key):
+        """Passes keys to the listener as they are read, until woken by stop. Runs
+        on the reader thread.
+        :param on_key: the callable to which each key and the time it was read are passed
+        :return: None
+        """
+        # imported here, as select cannot wait on standard input on Windows
+        from select import select
+
+        while True:
+            ready, _, _ = select((self._fd, self._wake_read), (), ())
+            if self._wake_read in ready:
+                return
+            try:
+                data = os.read(self._fd, READ_SIZE)
+            except OSError:
+                return
+            if not data:
+                return
+            now = perf_counter()
+            for key in decode_keys(data.decode(errors="ignore")):
+                on_key(key, now)
+
+    def stop(self):
+        """Stops the reader thread and restores the terminal's previous mode.
+        :return: None
+        """
+        if self._thread is None:
+            return
+        import termios
+
+        os.write(self._wake_write, b"\0")
+        self._thread.join()
+        os.close(self._wake_read)
+        os.close(self._wake_write)
+        self._thread = None
+        termios.tcsetattr(self._fd, termios.TCSADRAIN, self._saved_attributes)
+
+
+class PynputInput(InputBackend):
+    """This class represents an input backend reading keys from pynput's global
+    keyboard hook, which needs a display server and also sees keys typed into
+    other windows. The terminal echoes every key typed, so each key is followed by
+    an injected backspace to erase it."""
+    def __init__(self):
+        """Constructs a Pynput Input."""
+        self._listener = None
+        self._keyboard = None
+
+    def start(self, on_key):
+        """Starts the keyboard listener thread.
+        :param on_key: the callable to which each key and the time it was read are passed
+        :return: None
+        """
+        # imported here, as pynput needs a display server to import
+        from pynput import keyboard
+        from pynput.keyboard import Key
+
+        self._keyboard = keyboard.Controller()
+        special_keys = {Key.space: SPACE, Key.esc: ESCAPE}
+
+        def on_press(key):
+            """Passes the given key to the listener and erases its echo.
+            :param key: the pynput key pressed
+            :return: None
+            """
+            now = perf_counter()
+            if key == Key.backspace:
+                return
+            self._keyboard.press(Key.backspace)
+            char = special_keys.get(key, getattr(key, "char", None))
+            if char is not None:
+                on_key(char, now)
+
+        self._listener = keyboard.Listener(on_press=on_press)
+        self._listener.start()
+        self._keyboard.press(Key.backspace)
+
+    def stop(self):
+        """Stops the keyboard listener thread.
+        :return: None
+        """
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
+
+
+INPUT_BACKENDS = {"terminal": TerminalInput, "pynput": PynputInput}
+
+
+def make_input_backend(name):
+    """Constructs the input backend of the given name.
+    :param name: the name of the backend, one of the keys of INPUT_BACKENDS
+    :return: the input backend
+    :raises ValueError: if there is no backend of the given name
+    """
+    try:
+        return INPUT_BACKENDS[name]()
+    except KeyError:
+        raise ValueError("Unknown input backend %r, expected one of %s" % (name, ", ".join(INPUT_BACKENDS)))
@@ -0,0 +1,55 @@
+import numpy as np
+
+
+class InputLatency:
+    """This class represents the key-to-frame latency of a session: the time from a
+    key being read by the input backend to the first frame displayed after the
+    key was performed, which covers the wait in the command queue, the wait for
+    the next tick and the wait for the next frame."""
+    def __init__(self):
+        """Constructs empty Input Latency statistics."""
+        self._latencies = []
+
+    def record(self, latency):
+        """Records the key-to-frame latency of one key.
+        :param latency: the time from the key being read to its frame, in seconds
+        :return: None
+        """
+        self._latencies.append(latency)
+
+    def get_count(self):
+        """Returns the number of keys recorded.
+        :return: the number of keys recorded
+        """
+        return len(self._latencies)
+
+    def get_mean(self):
+        """Returns the mean key-to-frame latency, in seconds.
+        :return: the mean key-to-frame latency, in seconds
+        """
+        if not self._latencies:
+            return 0.0
+        return sum(self._latencies) / len(self._latencies)
+
+    def get_percentile(self, percentile):
+        """Returns the given percentile of the key-to-frame latency, in seconds.
+        :param percentile: the percentile, from 0 to 100
+        :return: the percentile of the key-to-frame latency, in seconds
+        """
+        if not self._latencies:
+            return 0.0
+        return float(np.percentile(self._latencies, percentile))
+
+    def get_max(self):
+        """Returns the longest key-to-frame latency, in seconds.
+        :return: the longest key-to-frame latency, in seconds
+        """
+        return max(self._latencies, default=0.0)
+
+    def __str__(self):
+        """Returns the statistics as a one-line summary.
+        :return: the statistics as a one-line summary
+        """
+        return ("key-to-frame latency: %d keys (mean %.2f ms, p50 %.2f ms, p95 %.2f ms, max %.2f ms)"
+                % (self.get_count(), self.get_mean() * 1e3, self.get_percentile(50) * 1e3,
+                   self.get_percentile(95) * 1e3, self.get_max() * 1e3))
@@ -0,0 +1,197 @@
+import struct
+
+MAGIC = b"DCJL"
+VERSION = 2
+HEADER = struct.Struct("<4sBHQH")
+SAVE_HEADER = struct.Struct("<II")
+END_STATE = struct.Struct("<bhhhh")
+END_KEY = 0
+NO_GAME = -1
+
+
+def encode_varint(value):
+    """Encodes the given non-negative integer as an unsigned LEB128 varint, 7 bits
+    per byte, so the tick deltas between key presses mostly take a single byte.
+    :param value: the non-negative integer to encode
+    :return: the encoded bytes
+    """
+    data = bytearray()
+    while value > 0x7F:
+        data.append(value & 0x7F | 0x80)
+        value >>= 7
+    data.append(value)
+
+    return bytes(data)
+
+
+def decode_varint(data, offset):
+    """Decodes the unsigned LEB128 varint at the given offset of the given bytes.
+    :param data: the bytes to decode
+    :param offset: the offset of the varint
+    :return: the decoded integer and the offset after it
+    :raises ValueError: if the data ends within the varint
+    """
+    value = 0
+    shift = 0
+    while True:
+        if offset >= len(data):
+            raise ValueError("The journal ends within a record")
+        byte = data[offset]
+        offset += 1
+        value |= (byte & 0x7F) << shift
+        shift += 7
+        if byte < 0x80:
+            return value, offset
+
+
+def describe_model(model):
+    """Returns a summary of the given model's state, recorded at the end of a
+    journal so that a replay can check it ends in the same state.
+    :param model: the model to describe
+    :return: the Game State's value, then the level, player x, player y and player
+    health, or NO_GAME for each if no game has been started
+    """
+    game_grid = model.get_game_grid()
+    if game_grid is None:
+        return (model.get_game_state().value,) + (NO_GAME,) * 4
+
+    return (model.get_game_state().value, game_grid.get_current_level(), game_grid.get_x(), game_grid.get_y(),
+            game_grid.get_player_health()[0])
+
+
+class JournalRecorder:
+    """This class represents the recorder of a session's journal: the seed and tick
+    rate of the session, the save slots present when it started, and every key
+    performed, stamped with the simulation tick at which it was performed. A
+    session replayed from its journal plays out exactly as recorded. Each key takes
+    two bytes, its tick delta as a varint and its character, and is flushed as it
+    is recorded, so the journal of a session that crashed or was killed is kept."""
+    def __init__(self, path, model):
+        """Constructs a Journal Recorder writing the journal of the given model's
+        session to the given path, starting with a copy of every save slot.
+        :param path: the path of the journal file
+        :param model: the model whose session to record, before any tick has run
+        """
+        save_slots = model.get_save_slots()
+        self._file = open(path, "wb")
+        self._file.write(HEADER.pack(MAGIC, VERSION, model.get_tick_rate(), model.get_seed(),
+                                     len(save_slots.get_slots())))
+        for slot in save_slots.get_slots():
+            with open(save_slots.get_path(slot), "rb") as save_file:
+                data = save_file.read()
+            self._file.write(SAVE_HEADER.pack(slot, len(data)) + data)
+        self._file.flush()
+        self._last_tick = 0
+        self._keys = 0
+
+    def record(self, tick, key):
+        """Appends the given key, performed at the given tick, to the journal.
+        :param tick: the simulation tick at which the key was performed
+        :param key: the key performed, a single character other than NUL
+        :return: None
+        """
+        self._file.write(encode_varint(tick - self._last_tick) + key.encode("latin-1"))
+        self._file.flush()
+        self._last_tick = tick
+        self._keys += 1
+
+    def close(self, model):
+        """Ends the journal with the given model's tick count and state, and closes it.
+        :param model: the model whose session was recorded
+        :return: None
+        """
+        if self._file.closed:
+            return
+        self._file.write(encode_varint(model.get_tick_count() - self._last_tick) + bytes((END_KEY,))
+                         + END_STATE.pack(*describe_model(model)))
+        self._file.close()
+
+    def get_key_count(self):
+        """Returns the number of keys recorded.
+        :return: the number of keys recorded
+        """
+        return self._keys
+
+
+class Journal:
+    """This class represents a session's journal read back from its file."""
+    def __init__(self, path):
+        """Reads the journal at the given path. A journal without an end, e.g.
+        that of a session that crashed, is read up to its last whole key.
+        :param path: the path of the journal file
+        :raises ValueError: if the file is not a journal or is of an unsupported version
+        """
+        with open(path, "rb") as journal_file:
+            data = journal_file.read()
+        if len(data) < HEADER.size:
+            raise ValueError("%s is not a journal" % path)
+        magic, version, self._tick_rate, self._seed, save_count = HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise ValueError("%s is not a journal" % path)
+        if version != VERSION:
+            raise ValueError("Unsupported journal version %d" % version)
+
+        offset = HEADER.size
+        self._saves = {}
+        for _ in range(save_count):
+            slot, size = SAVE_HEADER.unpack_from(data, offset)
+            offset += SAVE_HEADER.size
+            self._saves[slot] = data[offset:offset + size]
+            offset += size
+
+        self._keys = []
+        self._end_tick = None
+        self._end_state = None
+        tick = 0
+        try:
+            while offset < len(data):
+                delta, offset = decode_varint(data, offset)
+                if offset >= len(data):
+                    break
+                tick += delta
+                key = data[offset]
+                offset += 1
+                if key == END_KEY:
+                    self._end_tick = tick
+                    self._end_state = END_STATE.unpack_from(data, offset)
+                    break
+                self._keys.append((tick, chr(key)))
+        except (ValueError, struct.error):
+            pass
+
+    def get_tick_rate(self):
+        """Retrieves the tick rate of the recorded session.
+        :return: the number of simulation ticks per second
+        """
+        return self._tick_rate
+
+    def get_seed(self):
+        """Retrieves the seed of the recorded session.
+        :return: the seed of the recorded session
+        """
+        return self._seed
+
+    def get_saves(self):
+        """Retrieves the save slots present when the session started.
+        :return: a dictionary mapping each slot to the bytes of its save file
+        """
+        return self._saves
+
+    def get_keys(self):
+        """Retrieves the keys performed, in order.
+        :return: the list of (tick, key) pairs
+        """
+        return self._keys
+
+    def get_end_tick(self):
+        """Retrieves the tick count at which the session ended.
+        :return: the tick count at which the session ended, or None if the journal has no end
+        """
+        return self._end_tick
+
+    def get_end_state(self):
+        """Retrieves the summary of the model's state when the session ended, as
+        returned by describe_model.
+        :return: the summary of the model's state, or None if the journal has no end
+        """
+        return self._end_state
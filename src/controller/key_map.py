@@ -0,0 +1,59 @@
+from model import GameState
+
+SPACE = " "
+ESCAPE = "\x1b"
+EXIT_KEY = "."
+
+
+def build_key_map(model):
+    """Returns the actions of the given model bound to each key in each Game
+    State. Keys are named by the character they type, so any input backend, or a
+    journal being replayed, can drive the model.
+    :param model: the model to be controlled
+    :return: a dictionary mapping each Game State to a dictionary mapping keys to actions
+    """
+    main_menu = model.get_game_state_at(GameState.MAIN_MENU)
+    load_menu = model.get_game_state_at(GameState.LOAD_MENU)
+    pause_menu = model.get_game_state_at(GameState.PAUSE_MENU)
+    death_menu = model.get_game_state_at(GameState.DEATH_MENU)
+
+    return {GameState.MAIN_MENU: {"w": main_menu.move_up,
+                                  "s": main_menu.move_down,
+                                  SPACE: model.choose},
+            GameState.PAUSE_MENU: {"w": pause_menu.move_up,
+                                   "s": pause_menu.move_down,
+                                   SPACE: model.choose,
+                                   ESCAPE: model.set_game_state_in_game},
+            GameState.LOAD_MENU: {"w": load_menu.move_up,
+                                  "s": load_menu.move_down,
+                                  "c": model.delete_save,
+                                  SPACE: model.choose,
+                                  ESCAPE: model.set_game_state_main_menu},
+            GameState.IN_GAME: {"w": model.move_up,
+                                "s": model.move_down,
+                                "a": model.move_left,
+                                "d": model.move_right,
+                                SPACE: model.player_attack,
+                                ESCAPE: model.set_game_state_pause_menu},
+            GameState.DEATH_MENU: {"w": death_menu.move_up,
+                                   "s": death_menu.move_down,
+                                   SPACE: model.choose}}
+
+
+def perform_key(key_map, model, key):
+    """Performs the action bound to the given key in the model's current Game
+    State, if there is one.
+    :param key_map: the key map built for the model by build_key_map
+    :param model: the model being controlled
+    :param key: the key pressed
+    :return: True if an action was performed, else False
+    """
+    action = key_map.get(model.get_game_state(), {}).get(key)
+    if action is None:
+        return False
+    try:
+        action()
+    except (KeyError, NotImplementedError):
+        pass
+
+    return True
@@ -0,0 +1,145 @@
+import argparse
+import os
+import sys
+import tempfile
+from time import perf_counter
+
+from controller.journal import Journal, describe_model
+from controller.key_map import build_key_map, perform_key
+from model import Model, GameState
+
+
+class ReplayEngine:
+    """This class represents the replay of a recorded session: a model is started
+    from the journal's seed, tick rate and save slots, in a save directory of its
+    own, and driven headlessly, as fast as it will run, by the journal's keys at
+    the ticks they were performed, exactly as the Controller drives it live."""
+    def __init__(self, journal: Journal, view_factory=None, trailing_ticks=None):
+        """Constructs a Replay Engine for the given journal. The model is not
+        started until run is called.
+        :param journal: the journal to replay
+        :param view_factory: a callable building the View to display after every
+        tick from the model, e.g. to dump frames, or None to display nothing
+        :param trailing_ticks: the number of ticks to run after the last key of a
+        journal without an end, or None for one second's worth
+        """
+        self._journal = journal
+        self._view_factory = view_factory
+        self._trailing_ticks = journal.get_tick_rate() if trailing_ticks is None else trailing_ticks
+        self._model = None
+        self._keys_performed = 0
+        self._elapsed = 0.0
+
+    def get_model(self):
+        """Retrieves the model being replayed.
+        :return: the model being replayed, or None if the replay has not started
+        """
+        return self._model
+
+    def run(self):
+        """Replays the journal to its end, in a temporary save directory holding a
+        copy of the save slots recorded.
+        :return: True if the model ends in the state recorded at the end of the
+        journal, False if it does not, or None if the journal has no end
+        """
+        journal = self._journal
+        keys = journal.get_keys()
+        end_tick = journal.get_end_tick()
+        if end_tick is None:
+            end_tick = (keys[-1][0] if keys else 0) + self._trailing_ticks
+
+        with tempfile.TemporaryDirectory() as save_directory:
+            for slot, data in journal.get_saves().items():
+                with open(os.path.join(save_directory, "save%d.dat" % slot), "wb") as save_file:
+                    save_file.write(data)
+
+            model = self._model = Model(tick_rate=journal.get_tick_rate(), seed=journal.get_seed(),
+                                        save_directory=save_directory)
+            key_map = build_key_map(model)
+            view = self._view_factory(model) if self._view_factory is not None else None
+            try:
+                start = perf_counter()
+                index = 0
+                while True:
+                    while index < len(keys) and keys[index][0] == model.get_tick_count():
+                        perform_key(key_map, model, keys[index][1])
+                        index += 1
+                    if model.get_tick_count() >= end_tick:
+                        break
+                    model.tick()
+                    if model.get_game_state() == GameState.IN_GAME:
+                        model.end_game_if_player_dies()
+                    if view is not None:
+                        view.display()
+                self._keys_performed = index
+                self._elapsed = perf_counter() - start
+            finally:
+                model.shutdown()
+
+        if journal.get_end_state() is None:
+            return None
+        return describe_model(model) == journal.get_end_state()
+
+    def get_keys_performed(self):
+        """Returns the number of keys performed by the last run.
+        :return: the number of keys performed
+        """
+        return self._keys_performed
+
+    def get_elapsed(self):
+        """Returns the time the last run took to replay, excluding starting the model, in seconds.
+        :return: the time the last run took to replay, in seconds
+        """
+        return self._elapsed
+
+
+def main(argv=None):
+    """Replays a recorded session headlessly as fast as it will run, optionally
+    dumping every frame to a text file, and prints the replay speed and whether
+    the session ended as recorded. Exits with status 1 if it did not. Run from the
+    src directory with: python -m controller.replay save_data/last_session.journal
+    :param argv: the command-line arguments, or None to use sys.argv
+    :return: None
+    """
+    parser = argparse.ArgumentParser(description="Replay a recorded Dungeon Crawler session.")
+    parser.add_argument("journal", help="the journal to replay")
+    parser.add_argument("--frames", help="the text file to which to dump every frame")
+    args = parser.parse_args(argv)
+
+    journal = Journal(args.journal)
+    frames = open(args.frames, "w", encoding="utf-8") if args.frames else None
+    view_factory = None
+    if frames is not None:
+        # imported here, as the view is only needed to dump frames
+        from view import View
+        from view.frame_dump_renderer import FrameDumpRenderer
+
+        def view_factory(model):
+            """Builds a View dumping every frame of the given model to the frames file.
+            :param model: the model being replayed
+            :return: the View
+            """
+            return View(model, FrameDumpRenderer(frames, model.get_tick_count))
+
+    engine = ReplayEngine(journal, view_factory)
+    try:
+        matches = engine.run()
+    finally:
+        if frames is not None:
+            frames.close()
+
+    ticks = engine.get_model().get_tick_count()
+    print("%d ticks and %d keys replayed in %.2f s (%.0f ticks/s, %.0fx real time)"
+          % (ticks, engine.get_keys_performed(), engine.get_elapsed(), ticks / engine.get_elapsed(),
+             ticks / journal.get_tick_rate() / engine.get_elapsed()))
+    if matches is None:
+        print("the journal has no end, so the final state cannot be checked")
+    elif matches:
+        print("the session ended as recorded")
+    else:
+        print("the session diverged from the recording")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
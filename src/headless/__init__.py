@@ -0,0 +1,116 @@
+import numpy as np
+
+from model.game_clock import GameClock
+from model.level_generator import generate_level
+from model.settings import TICK_RATE
+
+WAIT = 0
+LEFT = 1
+RIGHT = 2
+UP = 3
+DOWN = 4
+ATTACK = 5
+ACTIONS = ("wait", "left", "right", "up", "down", "attack")
+
+MOB_CODE = 6
+STATS = ("x", "y", "health", "max_health", "level", "mobs", "tick")
+
+
+class HeadlessSession:
+    """This class represents a game of Dungeon Crawler played without a keyboard or
+    terminal, e.g. by a bot. Each step performs one action, as a key press would in
+    game, then advances the simulation by ticks_per_step ticks on the same Game
+    Clock as the Model, and moving onto the door enters the next level through the
+    same GameGrid.enter_door. Nothing is rendered, saved or prefetched, and next
+    levels are generated synchronously, so sessions can be run by the thousand
+    across processes."""
+    def __init__(self, tick_rate=TICK_RATE, ticks_per_step=1):
+        """Constructs a Headless Session with no game in progress; call reset to start one.
+        :param tick_rate: the number of simulation ticks per second
+        :param ticks_per_step: the number of simulation ticks advanced by each step
+        """
+        self._tick_rate = tick_rate
+        self._ticks_per_step = ticks_per_step
+        self._game_grid = None
+        self._game_clock = GameClock(tick_rate)
+        self._steps = 0
+
+    def reset(self, seed=None, level=0):
+        """Starts a new game on the given level of the given seed.
+        :param seed: the seed of the run, or None to draw a random seed
+        :param level: the level on which to start
+        :return: the observation of the new game
+        """
+        self._game_grid = generate_level(level, seed=seed)
+        self._game_clock = GameClock(self._tick_rate)
+        self._steps = 0
+
+        return self.get_observation()
+
+    def step(self, action):
+        """Performs the given action, then advances the simulation by ticks_per_step
+        ticks. Moving up onto the door enters the next level.
+        :param action: the action to perform, one of WAIT, LEFT, RIGHT, UP, DOWN and ATTACK
+        :return: the observation after the step, and True if the player has died, else False
+        """
+        game_grid = self._game_grid
+        player = game_grid.get_player()
+        if action == ATTACK:
+            game_grid.player_attack(self._game_clock.get_timer_wheel())
+        elif action == LEFT:
+            game_grid.move_left(player)
+        elif action == RIGHT:
+            game_grid.move_right(player)
+        elif action == UP:
+            game_grid.move_up(player)
+            next_game_grid = game_grid.enter_door(generate_level)
+            if next_game_grid is not None:
+                self._game_grid = next_game_grid
+        elif action == DOWN:
+            game_grid.move_down(player)
+
+        for _ in range(self._ticks_per_step):
+            if self._game_clock.tick():
+                self._game_grid.update_mobs()
+        self._steps += 1
+
+        return self.get_observation(), self.is_done()
+
+    def is_done(self):
+        """Checks whether the game is over, i.e. the player has died.
+        :return: True if the player has died, else False
+        """
+        return self._game_grid.is_player_dead()
+
+    def get_observation(self):
+        """Returns what the player can see: the FOV window of the level data, with
+        every mob shown as MOB_CODE, and the player's statistics.
+        :return: a dictionary holding the int8 FOV grid under "grid" and the int32
+        array of statistics, in the order of STATS, under "stats"
+        """
+        game_grid = self._game_grid
+        grid = game_grid.get_fov_grid()
+        grid[grid > MOB_CODE] = MOB_CODE
+        health, max_health = game_grid.get_player_health()
+        stats = np.array((game_grid.get_x(), game_grid.get_y(), health, max_health, game_grid.get_current_level(),
+                          len(game_grid.get_mob_store()), self._game_clock.get_tick_count()), dtype=np.int32)
+
+        return {"grid": grid.astype(np.int8), "stats": stats}
+
+    def get_game_grid(self):
+        """Retrieves the Game Grid of the game in progress.
+        :return: the Game Grid of the game in progress
+        """
+        return self._game_grid
+
+    def get_step_count(self):
+        """Returns the number of steps taken since the game started.
+        :return: the number of steps taken since the game started
+        """
+        return self._steps
+
+    def get_tick_count(self):
+        """Returns the number of simulation ticks since the game started.
+        :return: the number of simulation ticks since the game started
+        """
+        return self._game_clock.get_tick_count()
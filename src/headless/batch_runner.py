@@ -0,0 +1,66 @@
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
+from time import perf_counter
+
+from headless import HeadlessSession
+from headless.bots import BOTS
+
+MAX_STEPS = 5000
+
+
+def play_game(seed, bot_name="door", max_steps=MAX_STEPS):
+    """Plays one headless game of the given seed with the given bot, until the
+    player dies or max_steps steps have been taken.
+    :param seed: the seed of the game, also used to seed the bot
+    :param bot_name: the name of the bot to play with, one of the keys of BOTS
+    :param max_steps: the number of steps after which to stop the game
+    :return: the seed, the number of steps taken, the level reached, whether the
+    player died, and the time spent playing, in seconds
+    """
+    start = perf_counter()
+    session = HeadlessSession()
+    bot = BOTS[bot_name](seed)
+    observation = session.reset(seed)
+    done = False
+    while not done and session.get_step_count() < max_steps:
+        observation, done = session.step(bot.act(observation, session))
+
+    return (seed, session.get_step_count(), session.get_game_grid().get_current_level(), done,
+            perf_counter() - start)
+
+
+def main(argv=None):
+    """Plays a range of seeded bot games across a process pool and prints the
+    number of steps taken, the levels reached, the deaths, and the throughput in
+    steps per second overall and per core. Run from the src directory with:
+    python -m headless.batch_runner --games 1000
+    :param argv: the command-line arguments, or None to use sys.argv
+    :return: None
+    """
+    parser = argparse.ArgumentParser(description="Play headless bot games across a process pool.")
+    parser.add_argument("--games", type=int, default=100, help="the number of games to play")
+    parser.add_argument("--first-seed", type=int, default=0, help="the seed of the first game")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="the number of worker processes")
+    parser.add_argument("--max-steps", type=int, default=MAX_STEPS, help="the number of steps after which to stop a game")
+    parser.add_argument("--bot", choices=sorted(BOTS), default="door", help="the bot to play with")
+    args = parser.parse_args(argv)
+
+    seeds = range(args.first_seed, args.first_seed + args.games)
+    start = perf_counter()
+    with ProcessPoolExecutor(max_workers=args.workers) as executor:
+        results = list(executor.map(play_game, seeds, [args.bot] * len(seeds), [args.max_steps] * len(seeds),
+                                    chunksize=max(1, len(seeds) // (4 * args.workers))))
+    elapsed = perf_counter() - start
+
+    steps = sum(result[1] for result in results)
+    levels = [result[2] for result in results]
+    deaths = sum(result[3] for result in results)
+    game_time = sum(result[4] for result in results)
+    print("%d games with the %s bot in %.2f s on %d workers: %d steps, %d deaths, level reached mean %.2f, max %d"
+          % (len(results), args.bot, elapsed, args.workers, steps, deaths, sum(levels) / len(levels), max(levels)))
+    print("%.0f steps/s overall, %.0f steps/s per core" % (steps / elapsed, steps / game_time))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+import numpy as np
+
+from headless import WAIT, LEFT, RIGHT, UP, DOWN, ATTACK, HeadlessSession
+from model.flow_field import compute_distance_field, UNREACHABLE
+
+ATTACK_RADIUS = 1
+NEIGHBOURS = ((LEFT, -1, 0), (RIGHT, 1, 0), (UP, 0, -1), (DOWN, 0, 1))
+
+
+class RandomBot:
+    """This class represents a bot that presses a random key every step."""
+    def __init__(self, seed=None):
+        """Constructs a Random Bot drawing its actions from the given seed.
+        :param seed: the seed of the bot's actions, or None for a random seed
+        """
+        self._rng = np.random.default_rng(seed)
+
+    def act(self, observation, session: HeadlessSession):
+        """Chooses the action to perform.
+        :param observation: the current observation of the session
+        :param session: the session being played
+        :return: the action to perform
+        """
+        return int(self._rng.integers(WAIT, ATTACK + 1))
+
+
+class DoorSeekingBot:
+    """This class represents a bot that walks the shortest path to the door of each
+    level, attacking any mob that comes within reach. The distance from every tile
+    to the door is computed once per level."""
+    def __init__(self, seed=None):
+        """Constructs a Door Seeking Bot. It plays deterministically, so the seed is unused.
+        :param seed: unused, accepted so that every bot is constructed alike
+        """
+        self._game_grid = None
+        self._distances = None
+
+    def act(self, observation, session: HeadlessSession):
+        """Chooses the action to perform.
+        :param observation: the current observation of the session
+        :param session: the session being played
+        :return: the action to perform
+        """
+        game_grid = session.get_game_grid()
+        if game_grid.get_mobs_within(ATTACK_RADIUS):
+            return ATTACK
+
+        if game_grid is not self._game_grid:
+            self._game_grid = game_grid
+            terrain = game_grid.get_terrain()
+            door = game_grid.get_door_position()
+            self._distances, _, _ = compute_distance_field((terrain == 1) | (terrain == -1), door.get_x(), door.get_y())
+
+        x, y = game_grid.get_x(), game_grid.get_y()
+        rows, columns = self._distances.shape
+        best_action, best_distance = WAIT, UNREACHABLE
+        for action, step_x, step_y in NEIGHBOURS:
+            if 0 <= x + step_x < columns and 0 <= y + step_y < rows \
+                    and self._distances[y + step_y, x + step_x] < best_distance:
+                best_action, best_distance = action, self._distances[y + step_y, x + step_x]
+
+        return best_action
+
+
+BOTS = {"random": RandomBot, "door": DoorSeekingBot}
@@ -1,26 +1,49 @@
+from functools import partial
+from random import Random, randrange
+from time import perf_counter
+
 from model.living_entity.weapon.fist import Fist
+from model.autosaver import Autosaver
 from model.direction import Direction
+from model.game_clock import GameClock
 from model.game_state import GameState
-from model.level_generator import generate_level
+from model.level_generator import generate_level, SEED_RANGE
+from model.level_generator.level_prefetcher import LevelPrefetcher
 from model.menu import MainMenu, PauseMenu, LoadMenu, DeathMenu
-from dill import dump, load
+from model.phase_profiler import record_phase, UPDATE_MOBS
+from model.save_format import read_save
+from model.save_slot_manager import SaveSlotManager
+from model.settings import TICK_RATE, SAVE_DIRECTORY
 
 
 class Model:
     """This class represents a model in Dungeon Crawler"""
-    def __init__(self, game_grid=generate_level(), current_game_state=GameState.MAIN_MENU):
-        """Constructs a new model from the given Game Grid and Game State. If
-        no Game Grid is provided, the a Game Grid is generated at level 0.
+    def __init__(self, game_grid=None, current_game_state=GameState.MAIN_MENU, tick_rate=TICK_RATE, seed=None,
+                 save_directory=SAVE_DIRECTORY):
+        """Constructs a new model from the given Game Grid, Game State and tick rate. If
+        no Game Grid is provided, none is generated until a save slot is loaded.
         If no Game State is provided, the Game State defaults to Main Menu.
+        If no tick rate is provided, the tick rate defaults to TICK_RATE.
+        The seeds of new games are drawn from the given seed of the session, so a
+        session replayed with the same seed and inputs plays out the same.
         :param game_grid: the Game Grid from which the model is constructed
         :param current_game_state: the Game State to which the model is initialized.
+        :param tick_rate: the number of simulation ticks per second
+        :param seed: the seed of the session, or None to draw a random seed
+        :param save_directory: the directory holding the save slots
         """
+        self._seed = seed if seed is not None else randrange(SEED_RANGE)
+        self._game_seeds = Random(self._seed)
         self._game_state = current_game_state
         self._game_grid = game_grid
+        self._game_clock = GameClock(tick_rate)
         self._save_slot = -1
+        self._level_prefetcher = LevelPrefetcher()
+        self._save_slots = SaveSlotManager(save_directory)
+        self._autosaver = Autosaver(tick_rate, self._save_slots)
         self._main_menu = MainMenu()
         self._pause_menu = PauseMenu()
-        self._load_menu = LoadMenu()
+        self._load_menu = LoadMenu(self._save_slots)
         self._death_menu = DeathMenu()
         self._game_states = {GameState.MAIN_MENU: self.get_main_menu,
                              GameState.PAUSE_MENU: self.get_pause_menu,
@@ -29,14 +52,13 @@ class Model:
                              GameState.DEATH_MENU: self.get_death_menu}
         self._menu_operations = {"load": self.set_game_state_load_menu,
                                  "exit": self.set_game_state_exit,
-                                 "slot1": self.load_save_1,
-                                 "slot2": self.load_save_2,
-                                 "slot3": self.load_save_3,
                                  "resume": self.set_game_state_in_game,
                                  "save": self.save_game,
                                  "quit": self.set_game_state_main_menu,
                                  "new_game": self.new_game,
                                  "main_menu": self.set_game_state_main_menu}
+        for slot in LoadMenu.slots:
+            self._menu_operations["slot" + str(slot)] = partial(self.load_save, slot)
 
     def get_main_menu(self):
         """Retrieves the Main Menu Game State.
@@ -69,11 +91,40 @@ class Model:
         return self._game_grid
 
     def set_game_grid(self, game_grid):
-        """Assigns the Game Grid to the provided Game Grid.
+        """Assigns the Game Grid to the provided Game Grid, and starts generating
+        the level after it in the background.
         :param game_grid: the Game Grid to assign.
         :return: None
         """
         self._game_grid = game_grid
+        self._level_prefetcher.prefetch(game_grid.get_current_level() + 1, game_grid.get_seed())
+
+    def get_level_prefetcher(self):
+        """Retrieves the Level Prefetcher generating the next level, which also
+        records the door transition latency.
+        :return: the Level Prefetcher generating the next level
+        """
+        return self._level_prefetcher
+
+    def get_save_slots(self):
+        """Retrieves the Save Slot Manager indexing the save slots.
+        :return: the Save Slot Manager indexing the save slots
+        """
+        return self._save_slots
+
+    def get_autosaver(self):
+        """Retrieves the Autosaver writing the save files, which also records the
+        time saves take.
+        :return: the Autosaver writing the save files
+        """
+        return self._autosaver
+
+    def shutdown(self):
+        """Stops the background work of the model, after writing any save requested.
+        :return: None
+        """
+        self._level_prefetcher.shutdown()
+        self._autosaver.shutdown()
 
     def get_current_level(self):
         """Retrieves the current level of the Game Grid Game State.
@@ -180,8 +231,10 @@ class Model:
         """
         self._game_grid.move_up(self._game_grid.get_player())
 
-        if self._game_grid.is_at_door():
-            self._game_grid = generate_level(self.get_current_level() + 1, self._game_grid.get_player())
+        next_game_grid = self._game_grid.enter_door(self._level_prefetcher.take)
+        if next_game_grid is not None:
+            self.set_game_grid(next_game_grid)
+            self._autosaver.level_changed()
 
     def move_down(self):
         """Moves the player down in Game Grid.
@@ -199,7 +252,7 @@ class Model:
         """Toggles whether player is attacking.
         :return: None
         """
-        self._game_grid.player_attack()
+        self._game_grid.player_attack(self._game_clock.get_timer_wheel())
         self.request_update()
 
     def game_state_is_exit(self):
@@ -208,12 +261,51 @@ class Model:
         """
         return self._game_state == GameState.EXIT
 
+    def get_tick_rate(self):
+        """Retrieves the number of simulation ticks per second.
+        :return: the number of simulation ticks per second
+        """
+        return self._game_clock.get_tick_rate()
+
+    def get_seed(self):
+        """Retrieves the seed of the session, from which the seeds of new games are drawn.
+        :return: the seed of the session
+        """
+        return self._seed
+
+    def get_tick_count(self):
+        """Retrieves the number of simulation ticks run since the model was constructed.
+        :return: the number of simulation ticks run
+        """
+        return self._game_clock.get_tick_count()
+
+    def get_timer_wheel(self):
+        """Retrieves the Timer Wheel on which timed game events, such as the end
+        of an attack, are scheduled.
+        :return: the Timer Wheel advanced once per simulation tick
+        """
+        return self._game_clock.get_timer_wheel()
+
+    def tick(self):
+        """Advances the simulation by one tick, calling any timers now due. Mobs
+        are updated once every MOB_MOVE_INTERVAL seconds' worth of ticks,
+        whatever the tick rate. Autosaves are made at the end of the tick, while
+        a game is being played in a save slot.
+        :return: None
+        """
+        if self._game_clock.tick():
+            self.update_mobs()
+        if self._game_state == GameState.IN_GAME and self._save_slot > 0:
+            self._autosaver.tick(self._game_grid, self._save_slot)
+
     def update_mobs(self):
         """Updates mobs if Game State is In Game.
         :return: None
         """
         if self._game_state == GameState.IN_GAME:
+            start = perf_counter()
             self._game_grid.update_mobs()
+            record_phase(UPDATE_MOBS, start)
 
     def get_player_health(self):
         """Retrieves the player's health and max health, as a size-2 tuple.
@@ -233,79 +325,60 @@ class Model:
         """
         return self._game_grid.get_current_enemy_symbol()
 
-    def save_game(self):
-        """Saves the current Game Grid to the current save slot and returns to the Main Menu.
+    def write_save_slot(self, slot):
+        """Saves the current Game Grid to the given save slot. The Game Grid is
+        snapshotted now and written in the background by the Autosaver. If
+        SEEDED_SAVES is True and the Game Grid was generated from a seed, only its
+        seed, level and the changes since are written, and its terrain is generated
+        again on loading.
+        :param slot: the save slot to write, from 1
         :return: None
         """
-        with open("save_data/save" + str(self._save_slot) + ".dat", "wb") as save_file:
-            dump(self.get_game_grid(), save_file)
+        self._autosaver.save(self.get_game_grid(), slot)
 
-        self.set_game_state_main_menu()
-
-    def load_save_1(self):
-        """Loads Game Grid from slot 1 if exists, else generates new
-        Game Grid at level 0 and saves to slot 1. Goes to In Game after.
+    def save_game(self):
+        """Saves the current Game Grid to the current save slot and returns to the Main Menu.
         :return: None
         """
-        if menu.get_saves()[0]:
-            with open("save_data/save1.dat", "rb") as save_file:
-                self.set_game_grid(load(save_file))
-        else:
-            with open("save_data/save1.dat", "wb") as save_file:
-                self.set_game_grid(generate_level())
-                dump(self.get_game_grid(), save_file)
+        self.write_save_slot(self._save_slot)
 
-        self._save_slot = 1
-        self.set_game_state(GameState.IN_GAME)
-        self.request_update()
+        self.set_game_state_main_menu()
 
-    def load_save_2(self):
-        """Loads Game Grid from slot 2 if exists, else generates new
-        Game Grid at level 0 and saves to slot 2. Goes to In Game after.
+    def load_save(self, slot):
+        """Loads Game Grid from the given slot if it holds a save, else generates
+        new Game Grid at level 0 and saves to the slot. Goes to In Game after.
+        :param slot: the save slot to load, from 1
         :return: None
         """
-        if menu.get_saves()[1]:
-            with open("save_data/save2.dat", "rb") as save_file:
-                self.set_game_grid(load(save_file))
+        self._autosaver.start()
+        self._autosaver.flush()
+        if self._save_slots.is_used(slot):
+            self.set_game_grid(read_save(self._save_slots.get_path(slot)))
+            self._autosaver.reset()
         else:
-            with open("save_data/save2.dat", "wb") as save_file:
-                self.set_game_grid(generate_level())
-                dump(self.get_game_grid(), save_file)
+            self.set_game_grid(generate_level(seed=self._game_seeds.randrange(SEED_RANGE)))
+            self.write_save_slot(slot)
 
-        self._save_slot = 2
+        self._save_slot = slot
         self.set_game_state(GameState.IN_GAME)
         self.request_update()
 
-    def load_save_3(self):
-        """Loads Game Grid from slot 3 if exists, else generates new
-        Game Grid at level 0 and saves to slot 3. Goes to In Game after.
+    def delete_save(self):
+        """Deletes the save selected in the Load Menu, if it exists, once every
+        save requested has been written, so that no save still in flight
+        recreates the slot after it is deleted.
         :return: None
         """
-        if menu.get_saves()[2]:
-            with open("save_data/save3.dat", "rb") as save_file:
-                self.set_game_grid(load(save_file))
-                self.set_game_state(GameState.IN_GAME)
-        else:
-            with open("save_data/save3.dat", "wb") as save_file:
-                self.set_game_grid(generate_level())
-                dump(self.get_game_grid(), save_file)
-
-        self._save_slot = 3
-        self.set_game_state(GameState.IN_GAME)
-        self.request_update()
+        self._autosaver.flush()
+        self._load_menu.delete_save()
 
     def new_game(self):
         """Starts a new game in the current slot.
         :return: None
         """
-        if self._save_slot == 1:
-            self.load_save_1()
-        elif self._save_slot == 2:
-            self.load_save_2()
-        elif self._save_slot == 3:
-            self.load_save_3()
-        else:
+        if self._save_slot < 1:
             raise NotImplementedError()
+        self.load_save(self._save_slot)
 
     def request_update(self):
         """Sets update flag in current Game State to True.
@@ -319,5 +392,6 @@ class Model:
         :return: None
         """
         if self._game_grid.is_player_dead():
-            self._load_menu.delete_save()
+            self._autosaver.flush()
+            self._save_slots.delete(self._save_slot)
             self.set_game_state(GameState.DEATH_MENU)
@@ -0,0 +1,123 @@
+import numpy as np
+
+from model.chunked_array import ChunkedArray
+
+CORRIDOR = 0
+
+
+class ActiveRegion:
+    """This class represents the region of a Game Grid in which mobs are simulated.
+    Mobs outside the region sleep, filed under the room they sleep in, and are woken
+    when the player enters that room or comes within the wake radius of them. Only
+    awake mobs are visited each mob step, so its cost depends on the number of mobs
+    near the player rather than the number of mobs on the level."""
+    def __init__(self, rooms, rows, columns, radius):
+        """Constructs an Active Region over a Game Grid of the given size and rooms,
+        with no mobs in it. Without rooms, no tile is labelled, so no label array
+        is allocated.
+        :param rooms: the list of Rooms of the Game Grid, in level data coordinates
+        :param rows: the number of rows in the Game Grid
+        :param columns: the number of columns in the Game Grid
+        :param radius: the distance from the player within which mobs are awake
+        """
+        self._radius = radius
+        if not rooms:
+            self._room_labels = ChunkedArray(rows, columns, np.int16, CORRIDOR)
+        else:
+            self._room_labels = np.full((rows, columns), CORRIDOR, dtype=np.int16)
+        for label, room in enumerate(rooms, start=1):
+            self._room_labels[room.get_y():room.get_y() + room.get_height(),
+                              room.get_x():room.get_x() + room.get_width()] = label
+        self._mobs = {}
+        self._asleep = {}
+        self._asleep_by_room = [set() for _ in range(len(rooms) + 1)]
+        self._awake = set()
+
+    def get_room_at(self, x, y):
+        """Returns the label of the room containing the given tile.
+        :param x: the x-position of the tile
+        :param y: the y-position of the tile
+        :return: the label of the room, counting from 1, or CORRIDOR if the tile is in no room
+        """
+        return int(self._room_labels[y, x])
+
+    def add_mob(self, mob):
+        """Adds the given mob to the region, asleep in the room it stands in.
+        :param mob: the mob to add
+        :return: None
+        """
+        self._mobs[mob.get_mob_id()] = mob
+        self.put_to_sleep(mob.get_mob_id(), self.get_room_at(mob.get_x(), mob.get_y()))
+
+    def remove_mob(self, mob):
+        """Removes the given mob from the region, whether awake or asleep.
+        :param mob: the mob to remove
+        :return: None
+        """
+        mob_id = mob.get_mob_id()
+        del self._mobs[mob_id]
+        self._awake.discard(mob_id)
+        if mob_id in self._asleep:
+            self._asleep_by_room[self._asleep.pop(mob_id)].discard(mob_id)
+
+    def put_to_sleep(self, mob_id, room):
+        """Puts the mob with the given mob id to sleep in the given room.
+        :param mob_id: the mob id of the mob
+        :param room: the label of the room in which the mob sleeps
+        :return: None
+        """
+        self._awake.discard(mob_id)
+        self._asleep[mob_id] = room
+        self._asleep_by_room[room].add(mob_id)
+
+    def wake(self, mob_id):
+        """Wakes the mob with the given mob id, if it is asleep.
+        :param mob_id: the mob id of the mob
+        :return: None
+        """
+        if mob_id in self._asleep:
+            self._asleep_by_room[self._asleep.pop(mob_id)].discard(mob_id)
+            self._awake.add(mob_id)
+
+    def update(self, store, occupancy, x, y):
+        """Wakes every mob in the player's room or within the wake radius of the
+        player, found through the Occupancy Grid rather than by visiting every mob,
+        then puts every awake mob that is in neither back to sleep.
+        :param store: the Mob Store holding the state of the mobs
+        :param occupancy: the Occupancy Grid indexing the mobs
+        :param x: the x-position of the player
+        :param y: the y-position of the player
+        :return: None
+        """
+        room = self.get_room_at(x, y)
+        if room != CORRIDOR:
+            for mob_id in list(self._asleep_by_room[room]):
+                self.wake(mob_id)
+        for code in occupancy.get_codes_within(x, y, self._radius).tolist():
+            self.wake(code)
+
+        slots = self.get_awake_slots()
+        xs = store.get_x()[slots]
+        ys = store.get_y()[slots]
+        rooms = self._room_labels[ys, xs]
+        out_of_range = ((xs - x) ** 2 + (ys - y) ** 2 > self._radius ** 2) & ((rooms != room) | (rooms == CORRIDOR))
+        for mob_id, mob_room in zip(store.get_mob_ids()[slots[out_of_range]].tolist(), rooms[out_of_range].tolist()):
+            self.put_to_sleep(mob_id, mob_room)
+
+    def get_awake_slots(self):
+        """Returns the Mob Store slots of the awake mobs, in ascending order.
+        :return: the sorted array of Mob Store slots of the awake mobs
+        """
+        return np.array(sorted(self._mobs[mob_id].get_slot() for mob_id in self._awake), dtype=np.intp)
+
+    def get_awake_count(self):
+        """Returns the number of awake mobs.
+        :return: the number of awake mobs
+        """
+        return len(self._awake)
+
+    def get_asleep_count(self):
+        """Returns the number of sleeping mobs.
+        :return: the number of sleeping mobs
+        """
+        return len(self._asleep)
@@ -0,0 +1,226 @@
+from concurrent.futures import ThreadPoolExecutor
+from time import perf_counter, time
+
+from model.game_grid import GameGrid
+from model.save_format import encode_game_grid
+from model.save_slot_manager import SaveSlotManager
+from model.settings import AUTOSAVE_INTERVAL, AUTOSAVE_ON_LEVEL_CHANGE, SEEDED_SAVES
+
+
+class Autosaver:
+    """This class represents the background writer of save slots. Saves are only
+    snapshotted between simulation ticks, by encoding the Game Grid to bytes on the
+    simulation thread, and the bytes are published to their slot on a worker
+    thread, so the game loop never waits on the disk. A save requested while
+    another is still being written replaces any save waiting behind it, so at
+    most one write is in flight and one is pending. Autosaves are made every
+    interval seconds of simulation time and, if asked, whenever the level changes."""
+    def __init__(self, tick_rate, save_slots: SaveSlotManager, interval=AUTOSAVE_INTERVAL,
+                 on_level_change=AUTOSAVE_ON_LEVEL_CHANGE, seeded=SEEDED_SAVES):
+        """Constructs an Autosaver for a simulation of the given tick rate, saving
+        to the slots of the given Save Slot Manager. The worker thread is started
+        by start, or on the first save if it was not called.
+        :param tick_rate: the number of simulation ticks per second
+        :param save_slots: the Save Slot Manager to which to publish saves
+        :param interval: the number of seconds between autosaves, or None to only autosave on level changes
+        :param on_level_change: whether to autosave whenever the level changes
+        :param seeded: whether to save Game Grids generated from a seed by their seed
+        """
+        self._interval_ticks = None if not interval else max(1, round(interval * tick_rate))
+        self._on_level_change = on_level_change
+        self._seeded = seeded
+        self._save_slots = save_slots
+        self._executor = None
+        self._future = None
+        self._pending = None
+        self._ticks = 0
+        self._requested = False
+        self._saves = 0
+        self._coalesced = 0
+        self._total_snapshot_time = 0.0
+        self._max_snapshot_time = 0.0
+        self._writes = 0
+        self._total_write_latency = 0.0
+        self._max_write_latency = 0.0
+        self._errors = 0
+        self._last_error = None
+
+    def start(self):
+        """Starts the worker thread, if it is not running, so that starting it is
+        not left to the first save, on the simulation thread. Called before a
+        game is played.
+        :return: None
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="autosaver")
+            self._executor.submit(int).result()
+
+    def tick(self, game_grid: GameGrid, slot):
+        """Called between simulation ticks while a game is being played. Saves the
+        given Game Grid to the given slot if an autosave is due, and hands the
+        pending save, if any, to the worker once it is idle.
+        :param game_grid: the Game Grid being played
+        :param slot: the save slot of the game
+        :return: None
+        """
+        self._ticks += 1
+        if self._requested or (self._interval_ticks is not None and self._ticks >= self._interval_ticks):
+            self.save(game_grid, slot)
+        elif self._pending is not None and self._future.done():
+            self._submit(self._pending)
+
+    def level_changed(self):
+        """Requests an autosave on the next tick if autosaves are made on level changes.
+        :return: None
+        """
+        if self._on_level_change:
+            self._requested = True
+
+    def reset(self):
+        """Restarts the autosave interval and drops any requested autosave, e.g.
+        when a game has just been loaded.
+        :return: None
+        """
+        self._ticks = 0
+        self._requested = False
+
+    def save(self, game_grid: GameGrid, slot):
+        """Snapshots the given Game Grid and publishes it to the given slot on the
+        worker thread. Only the snapshot is taken on the calling thread.
+        :param game_grid: the Game Grid to save
+        :param slot: the save slot to write
+        :return: None
+        """
+        start = perf_counter()
+        data = encode_game_grid(game_grid, self._seeded and game_grid.get_seed() is not None)
+        snapshot = (slot, data, game_grid.get_current_level()) + game_grid.get_player().get_health() + (time(),)
+        snapshot_time = perf_counter() - start
+        self._saves += 1
+        self._total_snapshot_time += snapshot_time
+        self._max_snapshot_time = max(self._max_snapshot_time, snapshot_time)
+        self.reset()
+
+        if self._future is not None and not self._future.done():
+            if self._pending is not None:
+                self._coalesced += 1
+            self._pending = snapshot
+        else:
+            self._submit(snapshot)
+
+    def _submit(self, snapshot):
+        """Hands the given snapshot to the worker thread to publish.
+        :param snapshot: the arguments of SaveSlotManager.publish for the save
+        :return: None
+        """
+        self.start()
+        self._pending = None
+        self._future = self._executor.submit(self._write, snapshot)
+
+    def _write(self, snapshot):
+        """Publishes the given snapshot to its slot, recording the time taken. Runs
+        on the worker thread. A write that fails, e.g. as the disk is full, is
+        counted and its error kept, rather than raised on the simulation thread.
+        :param snapshot: the arguments of SaveSlotManager.publish for the save
+        :return: None
+        """
+        start = perf_counter()
+        try:
+            self._save_slots.publish(*snapshot)
+        except OSError as error:
+            self._errors += 1
+            self._last_error = error
+            return
+        latency = perf_counter() - start
+        self._writes += 1
+        self._total_write_latency += latency
+        self._max_write_latency = max(self._max_write_latency, latency)
+
+    def flush(self):
+        """Waits until every save requested has been written or has failed, e.g.
+        before a save slot is read or deleted. Failed writes are counted by
+        get_error_count rather than raised.
+        :return: None
+        """
+        while self._future is not None:
+            self._future.exception()
+            if self._pending is None:
+                self._future = None
+            else:
+                self._submit(self._pending)
+
+    def shutdown(self):
+        """Writes every save requested and stops the worker thread.
+        :return: None
+        """
+        self.flush()
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def get_save_count(self):
+        """Returns the number of saves snapshotted.
+        :return: the number of saves snapshotted
+        """
+        return self._saves
+
+    def get_write_count(self):
+        """Returns the number of saves written, which is less than the number
+        snapshotted when a pending save was replaced by a newer one.
+        :return: the number of saves written
+        """
+        return self._writes
+
+    def get_error_count(self):
+        """Returns the number of saves whose write failed.
+        :return: the number of saves whose write failed
+        """
+        return self._errors
+
+    def get_last_error(self):
+        """Returns the error of the latest write that failed.
+        :return: the OSError of the latest failed write, or None if no write has failed
+        """
+        return self._last_error
+
+    def get_coalesced_count(self):
+        """Returns the number of pending saves replaced by a newer one before being written.
+        :return: the number of pending saves replaced by a newer one
+        """
+        return self._coalesced
+
+    def get_mean_snapshot_time(self):
+        """Returns the mean time a snapshot took on the simulation thread, in seconds.
+        :return: the mean time a snapshot took, in seconds
+        """
+        if self._saves == 0:
+            return 0.0
+        return self._total_snapshot_time / self._saves
+
+    def get_max_snapshot_time(self):
+        """Returns the longest time a snapshot took on the simulation thread, in seconds.
+        :return: the longest time a snapshot took, in seconds
+        """
+        return self._max_snapshot_time
+
+    def get_mean_write_latency(self):
+        """Returns the mean time the worker took to publish a save, in seconds.
+        :return: the mean time the worker took to publish a save, in seconds
+        """
+        if self._writes == 0:
+            return 0.0
+        return self._total_write_latency / self._writes
+
+    def get_max_write_latency(self):
+        """Returns the longest time the worker took to publish a save, in seconds.
+        :return: the longest time the worker took to publish a save, in seconds
+        """
+        return self._max_write_latency
+
+    def __str__(self):
+        """Returns the save statistics as a one-line summary.
+        :return: the save statistics as a one-line summary
+        """
+        return ("saves: %d (%d written, %d failed, %d coalesced, snapshot mean %.2f ms, max %.2f ms, "
+                "write mean %.2f ms, max %.2f ms)"
+                % (self._saves, self._writes, self._errors, self._coalesced, self.get_mean_snapshot_time() * 1e3,
+                   self._max_snapshot_time * 1e3, self.get_mean_write_latency() * 1e3, self._max_write_latency * 1e3))
@@ -0,0 +1,215 @@
+from collections import OrderedDict
+
+import numpy as np
+
+from model.settings import CHUNK_SIZE, MAX_RESIDENT_CHUNKS
+
+
+class ChunkedArray:
+    """This class represents a 2-D array split into square chunks of CHUNK_SIZE
+    tiles, of which only those written to are allocated. It supports the indexing
+    the Game Grid uses on dense arrays: a single tile, a window of slices, and
+    arrays of row and column indices, so memory depends on the area in use rather
+    than on the size of the array."""
+    def __init__(self, rows, columns, dtype, fill=0, chunk_size=CHUNK_SIZE):
+        """Constructs a Chunked Array of the given shape and dtype, with every tile
+        set to fill and no chunk allocated.
+        :param rows: the number of rows in the array
+        :param columns: the number of columns in the array
+        :param dtype: the dtype of the array
+        :param fill: the value of every tile in a chunk not yet allocated
+        :param chunk_size: the width and height of a chunk, in tiles
+        """
+        self.shape = (rows, columns)
+        self.dtype = np.dtype(dtype)
+        self._fill = fill
+        self._chunk_size = chunk_size
+        self._chunks = {}
+
+    def __len__(self):
+        """Returns the number of rows in the array.
+        :return: the number of rows in the array
+        """
+        return self.shape[0]
+
+    def get_chunk_size(self):
+        """Returns the width and height of a chunk, in tiles.
+        :return: the width and height of a chunk, in tiles
+        """
+        return self._chunk_size
+
+    def get_resident_count(self):
+        """Returns the number of chunks held in memory.
+        :return: the number of chunks held in memory
+        """
+        return len(self._chunks)
+
+    def get_chunk(self, chunk_y, chunk_x, create=False):
+        """Returns the given chunk, allocating it filled with the fill value if asked to.
+        :param chunk_y: the row of the chunk, in chunks
+        :param chunk_x: the column of the chunk, in chunks
+        :param create: whether to allocate the chunk if it is not held
+        :return: the chunk, or None if it is not held and create is False
+        """
+        chunk = self._chunks.get((chunk_y, chunk_x))
+        if chunk is None and create:
+            chunk = np.full((self._chunk_size, self._chunk_size), self._fill, dtype=self.dtype)
+            self._chunks[(chunk_y, chunk_x)] = chunk
+
+        return chunk
+
+    def __getitem__(self, index):
+        """Returns the given tile, window or tiles of the array.
+        :param index: a (row, column) pair of ints, of slices with unit step, or of index arrays
+        :return: the tile value, a copy of the window, or the array of tile values
+        """
+        rows, columns = index
+        if isinstance(rows, slice):
+            return self._get_window(rows, columns)
+        if np.ndim(rows) == 0 and np.ndim(columns) == 0:
+            chunk = self.get_chunk(rows // self._chunk_size, columns // self._chunk_size)
+            if chunk is None:
+                return self.dtype.type(self._fill)
+            return chunk[rows % self._chunk_size, columns % self._chunk_size]
+
+        rows, columns = np.broadcast_arrays(np.asarray(rows), np.asarray(columns))
+        values = np.full(rows.shape, self._fill, dtype=self.dtype)
+        for (chunk_y, chunk_x), in_chunk in self._group_by_chunk(rows, columns):
+            chunk = self.get_chunk(chunk_y, chunk_x)
+            if chunk is not None:
+                values[in_chunk] = chunk[rows[in_chunk] % self._chunk_size, columns[in_chunk] % self._chunk_size]
+
+        return values
+
+    def __setitem__(self, index, value):
+        """Sets the given tile or tiles of the array, allocating their chunks as needed.
+        :param index: a (row, column) pair of ints or of index arrays
+        :param value: the value, or array of values, to set
+        :return: None
+        """
+        rows, columns = index
+        if np.ndim(rows) == 0 and np.ndim(columns) == 0:
+            chunk = self.get_chunk(rows // self._chunk_size, columns // self._chunk_size, create=True)
+            chunk[rows % self._chunk_size, columns % self._chunk_size] = value
+            return
+
+        rows, columns = np.broadcast_arrays(np.asarray(rows), np.asarray(columns))
+        values = np.broadcast_to(np.asarray(value, dtype=self.dtype), rows.shape)
+        for (chunk_y, chunk_x), in_chunk in self._group_by_chunk(rows, columns):
+            chunk = self.get_chunk(chunk_y, chunk_x, create=True)
+            chunk[rows[in_chunk] % self._chunk_size, columns[in_chunk] % self._chunk_size] = values[in_chunk]
+
+    def _get_window(self, rows: slice, columns: slice):
+        """Returns a copy of the given window of the array, assembled from the
+        chunks it overlaps.
+        :param rows: the slice of rows of the window
+        :param columns: the slice of columns of the window
+        :return: a copy of the window
+        """
+        upper, lower, _ = rows.indices(self.shape[0])
+        left, right, _ = columns.indices(self.shape[1])
+        window = np.full((max(lower - upper, 0), max(right - left, 0)), self._fill, dtype=self.dtype)
+        size = self._chunk_size
+
+        for chunk_y in range(upper // size, (lower - 1) // size + 1):
+            for chunk_x in range(left // size, (right - 1) // size + 1):
+                chunk = self.get_chunk(chunk_y, chunk_x)
+                if chunk is None:
+                    continue
+                top, bottom = max(upper, chunk_y * size), min(lower, (chunk_y + 1) * size)
+                start, end = max(left, chunk_x * size), min(right, (chunk_x + 1) * size)
+                window[top - upper:bottom - upper, start - left:end - left] = \
+                    chunk[top - chunk_y * size:bottom - chunk_y * size, start - chunk_x * size:end - chunk_x * size]
+
+        return window
+
+    def _group_by_chunk(self, rows: np.ndarray, columns: np.ndarray):
+        """Groups the given tiles by the chunk containing them.
+        :param rows: the array of rows of the tiles
+        :param columns: the array of columns of the tiles
+        :return: a list of ((chunk_y, chunk_x), mask) pairs, the mask selecting the tiles in the chunk
+        """
+        chunk_ys = rows // self._chunk_size
+        chunk_xs = columns // self._chunk_size
+        keys = chunk_ys * (self.shape[1] // self._chunk_size + 1) + chunk_xs
+        unique_keys, first = np.unique(keys, return_index=True)
+        if len(unique_keys) == 1:
+            return [((int(chunk_ys.flat[0]), int(chunk_xs.flat[0])), np.ones(rows.shape, dtype=bool))]
+
+        return [((int(chunk_ys.flat[i]), int(chunk_xs.flat[i])), keys == key)
+                for key, i in zip(unique_keys.tolist(), first.tolist())]
+
+
+class ChunkedLevel(ChunkedArray):
+    """This class represents the read-only terrain of a level too large to generate
+    at once. Each chunk is generated when first read, and when more than
+    max_resident_chunks chunks are held, the least recently read chunks are
+    evicted. Since the generator is deterministic, an evicted chunk is simply
+    generated again if it is read later."""
+    def __init__(self, rows, columns, generate_chunk, chunk_size=CHUNK_SIZE, max_resident_chunks=MAX_RESIDENT_CHUNKS):
+        """Constructs a Chunked Level of the given shape with no chunk generated.
+        :param rows: the number of rows in the level
+        :param columns: the number of columns in the level
+        :param generate_chunk: a picklable callable taking a chunk row and column
+        and returning the level data of that chunk, chunk_size tiles square
+        :param chunk_size: the width and height of a chunk, in tiles
+        :param max_resident_chunks: the number of chunks to hold before evicting
+        """
+        super().__init__(rows, columns, np.int8, 0, chunk_size)
+        self._generate_chunk = generate_chunk
+        self._max_resident_chunks = max_resident_chunks
+        self._chunks = OrderedDict()
+        self._generated = 0
+        self._evicted = 0
+
+    def get_chunk(self, chunk_y, chunk_x, create=False):
+        """Returns the given chunk, generating it if it is not held and evicting the
+        least recently read chunk if too many are held.
+        :param chunk_y: the row of the chunk, in chunks
+        :param chunk_x: the column of the chunk, in chunks
+        :param create: ignored, as every chunk of a level exists
+        :return: the read-only chunk
+        """
+        key = (chunk_y, chunk_x)
+        chunk = self._chunks.get(key)
+        if chunk is not None:
+            self._chunks.move_to_end(key)
+            return chunk
+
+        chunk = self._generate_chunk(chunk_y, chunk_x)
+        chunk.flags.writeable = False
+        self._chunks[key] = chunk
+        self._generated += 1
+        while len(self._chunks) > self._max_resident_chunks:
+            self._chunks.popitem(last=False)
+            self._evicted += 1
+
+        return chunk
+
+    def __setitem__(self, index, value):
+        """Refuses to modify the terrain, which must stay as generated so evicted
+        chunks can be generated again.
+        :raises TypeError: always
+        """
+        raise TypeError("The terrain of a Chunked Level is read-only")
+
+    def get_generated_count(self):
+        """Returns the number of times a chunk has been generated, including regenerations.
+        :return: the number of chunk generations
+        """
+        return self._generated
+
+    def get_evicted_count(self):
+        """Returns the number of chunks evicted.
+        :return: the number of chunks evicted
+        """
+        return self._evicted
+
+    def __getstate__(self):
+        """Returns the Chunked Level state to pickle, without its chunks, which are
+        generated again when read.
+        :return: the Chunked Level state to pickle
+        """
+        state = self.__dict__.copy()
+        state['_chunks'] = OrderedDict()
+        return state
@@ -0,0 +1,127 @@
+import numpy as np
+
+UNREACHABLE = np.iinfo(np.int32).max
+STEP_X = np.array([-1, 0, 1, 0])
+STEP_Y = np.array([0, -1, 0, 1])
+
+
+def compute_distance_field(walkable: np.ndarray, x, y, max_distance=None):
+    """Computes the walking distance from the given tile to every walkable tile
+    within max_distance steps of it, by a breadth-first search run as a wavefront
+    of whole-array shifts: each step of the search costs a handful of array
+    operations rather than a Python iteration per tile. Only the window of tiles
+    max_distance away from the source is searched.
+    :param walkable: a 2-D boolean array, True where a tile may be walked on
+    :param x: the x-position of the source tile
+    :param y: the y-position of the source tile
+    :param max_distance: the number of steps after which to stop, or None to search the whole array
+    :return: the distance field of the window, with UNREACHABLE where no path was found,
+    and the row and column of the window's top left corner
+    """
+    rows, columns = walkable.shape
+    if max_distance is None:
+        upper, lower, left, right = 0, rows, 0, columns
+    else:
+        upper, lower = max(y - max_distance, 0), min(y + max_distance + 1, rows)
+        left, right = max(x - max_distance, 0), min(x + max_distance + 1, columns)
+    window = walkable[upper:lower, left:right]
+
+    distances = np.full(window.shape, UNREACHABLE, dtype=np.int32)
+    reached = np.zeros(window.shape, dtype=bool)
+    frontier = np.zeros(window.shape, dtype=bool)
+    frontier[y - upper, x - left] = True
+    reached[y - upper, x - left] = True
+    distances[y - upper, x - left] = 0
+
+    distance = 0
+    while frontier.any() and (max_distance is None or distance < max_distance):
+        distance += 1
+        grown = np.zeros(window.shape, dtype=bool)
+        grown[1:] |= frontier[:-1]
+        grown[:-1] |= frontier[1:]
+        grown[:, 1:] |= frontier[:, :-1]
+        grown[:, :-1] |= frontier[:, 1:]
+        frontier = grown & window & ~reached
+        reached |= frontier
+        distances[frontier] = distance
+
+    return distances, upper, left
+
+
+class FlowField:
+    """This class represents a flow field leading every walkable tile near the player
+    towards the player. The distance field is computed once per player position by a
+    single breadth-first search, after which any number of mobs find their next step
+    with a few array lookups each."""
+    def __init__(self, terrain, radius):
+        """Constructs an empty Flow Field over the given terrain, which will lead
+        towards the player from up to radius steps away. Only the window of terrain
+        the field covers is read on each rebuild, so the terrain may be a Chunked Level.
+        :param terrain: the level data without entities, in which 1 and -1 may be walked on
+        :param radius: the number of steps from the player the field covers
+        """
+        self._terrain = terrain
+        self._radius = radius
+        self._origin = None
+        self._distances = None
+        self._upper = 0
+        self._left = 0
+        self._rebuild_count = 0
+
+    def update(self, x, y):
+        """Rebuilds the field to lead towards the given tile, unless it already does.
+        :param x: the x-position of the player
+        :param y: the y-position of the player
+        :return: None
+        """
+        if self._origin != (x, y):
+            rows, columns = self._terrain.shape
+            upper, left = max(y - self._radius, 0), max(x - self._radius, 0)
+            window = self._terrain[upper:min(y + self._radius + 1, rows), left:min(x + self._radius + 1, columns)]
+            walkable = (window == 1) | (window == -1)
+            self._distances, _, _ = compute_distance_field(walkable, x - left, y - upper, self._radius)
+            self._upper, self._left = upper, left
+            self._origin = (x, y)
+            self._rebuild_count += 1
+
+    def get_rebuild_count(self):
+        """Returns the number of times the field has been rebuilt.
+        :return: the number of times the field has been rebuilt
+        """
+        return self._rebuild_count
+
+    def get_distances(self, xs, ys):
+        """Returns the walking distance to the player from each of the given tiles.
+        :param xs: the array of x-positions of the tiles
+        :param ys: the array of y-positions of the tiles
+        :return: the array of walking distances, UNREACHABLE where the field has no path
+        """
+        rows = ys - self._upper
+        columns = xs - self._left
+        inside = (rows >= 0) & (rows < self._distances.shape[0]) & (columns >= 0) & (columns < self._distances.shape[1])
+
+        distances = np.full(xs.shape, UNREACHABLE, dtype=np.int32)
+        distances[inside] = self._distances[rows[inside], columns[inside]]
+        return distances
+
+    def get_next_directions(self, xs, ys, occupied):
+        """Returns, for each of the given tiles, the direction of the free neighbouring
+        tile closest to the player, and whether that tile is closer than the tile itself.
+        :param xs: the array of x-positions of the tiles
+        :param ys: the array of y-positions of the tiles
+        :param occupied: a callable taking arrays of x- and y-positions and returning
+        a boolean array, True where a tile is held by a living entity
+        :return: the array of Direction values to step in, and a boolean array, True
+        where stepping that way brings the tile closer to the player
+        """
+        neighbour_distances = np.empty((len(STEP_X), len(xs)), dtype=np.int32)
+        for direction in range(len(STEP_X)):
+            neighbour_xs = xs + STEP_X[direction]
+            neighbour_ys = ys + STEP_Y[direction]
+            distances = self.get_distances(neighbour_xs, neighbour_ys)
+            distances[occupied(neighbour_xs, neighbour_ys)] = UNREACHABLE
+            neighbour_distances[direction] = distances
+
+        directions = neighbour_distances.argmin(axis=0)
+        closer = neighbour_distances[directions, np.arange(len(xs))] < self.get_distances(xs, ys)
+        return directions, closer
@@ -0,0 +1,45 @@
+from model.settings import MOB_MOVE_INTERVAL
+from model.timer_wheel import TimerWheel
+
+
+class GameClock:
+    """This class represents the simulation clock of a game. It counts the ticks,
+    advances the Timer Wheel every tick, and tells when the mobs are due to be
+    updated, once every MOB_MOVE_INTERVAL seconds' worth of ticks, whatever the
+    tick rate. The Model and a Headless Session both run on one, so a game plays
+    out the same in either."""
+    def __init__(self, tick_rate):
+        """Constructs a Game Clock for a simulation of the given tick rate, at tick 0.
+        :param tick_rate: the number of simulation ticks per second
+        """
+        self._tick_rate = tick_rate
+        self._mob_move_ticks = max(1, round(MOB_MOVE_INTERVAL * tick_rate))
+        self._ticks = 0
+        self._timer_wheel = TimerWheel(tick_rate)
+
+    def tick(self):
+        """Advances the clock by one tick, calling any timers now due.
+        :return: True if the mobs are due to be updated on this tick, else False
+        """
+        self._ticks += 1
+        self._timer_wheel.advance()
+
+        return self._ticks % self._mob_move_ticks == 0
+
+    def get_tick_rate(self):
+        """Retrieves the number of simulation ticks per second.
+        :return: the number of simulation ticks per second
+        """
+        return self._tick_rate
+
+    def get_tick_count(self):
+        """Retrieves the number of ticks run.
+        :return: the number of ticks run
+        """
+        return self._ticks
+
+    def get_timer_wheel(self):
+        """Retrieves the Timer Wheel advanced once per tick.
+        :return: the Timer Wheel advanced once per tick
+        """
+        return self._timer_wheel
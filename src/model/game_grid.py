@@ -1,36 +1,58 @@
+from time import perf_counter
+
 import numpy as np
 
+from model.active_region import ActiveRegion
+from model.chunked_array import ChunkedArray
 from model.direction import Direction
+from model.flow_field import FlowField, STEP_X, STEP_Y
 from model.living_entity import LivingEntity
+from model.living_entity.mob.mob_store import MobStore
 from model.living_entity.player import Player
+from model.occupancy_grid import OccupancyGrid
+from model.phase_profiler import record_phase, UPDATE_DEAD_MOBS, GET_FOV_GRID, DATA_GRID_TO_ASCII
 from model.position import Position
 from model.settings import LEVEL_HEIGHT, LEVEL_WIDTH, FOV_HEIGHT, FOV_WIDTH
 
+MOB_CHASE_RADIUS = 18
+MOB_CHASE_STEPS = 2
+MOB_ATTACK_COOLDOWN = 0
+FLOW_FIELD_RADIUS = 2 * MOB_CHASE_RADIUS
+
 
 class GameGrid:
     """This class represents a populated game data grid in Dungeon Crawler"""
     def __init__(self,
                  mobs={},
-                 level_data=np.zeros((LEVEL_HEIGHT, LEVEL_WIDTH)),
-                 player=Player(),
+                 level_data=None,
+                 player=None,
                  door_pos=Position(0, 0),
                  level=0,
-                 hearts=set()):
+                 hearts=set(),
+                 rooms=[],
+                 seed=None):
         """Constructs a Game Grid with the given mobs, level data, player,
-        door position, level, and hearts. If no mobs are provided, no mobs are placed in the
+        door position, level, hearts, rooms, and seed. If no mobs are provided, no mobs are placed in the
         Game Grid. If no level data is provided, the level data is set to a 2-D array of 0s (all walls).
         If no player is provided, a new player is created. If no door position is provided,
         the door position is set to the origin. If no level is provided, the level is set to 0.
         If no hearts are provided, no hearts will be included in the Game Grid.
+        If no rooms are provided, mobs are only woken by the player's approach.
+        If no seed is provided, the Game Grid is not reproducible from a seed.
         :param mobs: a dictionary mapping each mob id to its respective mob
-        :param level_data: a 2-D numpy array of dtype int8 representing level data
+        :param level_data: a 2-D numpy array of dtype int8 representing level data, or a Chunked Level
         :param player: the player
         :param door_pos: the position of the door in the Game Grid
         :param level: the current level of the Game Grid
         :param hearts: a list of Positions corresponding to each heart in the Game Grid
-        """
-        self._rows = len(level_data)
-        self._columns = len(level_data[0])
+        :param rooms: the list of Rooms in the Game Grid, in level data coordinates
+        :param seed: the seed of the run from which the Game Grid was generated
+        """
+        if level_data is None:
+            level_data = np.zeros((LEVEL_HEIGHT, LEVEL_WIDTH))
+        if player is None:
+            player = Player()
+        self._rows, self._columns = level_data.shape
         self._level_data = level_data
         self._level = level
         self._door_pos = door_pos
@@ -44,11 +66,87 @@ class GameGrid:
                                5: self._player.get_weapon_symbol()}
         self._mobs = mobs
         self._hearts = hearts
+        self._rooms = rooms
+        self._seed = seed
         for mob in self._mobs.values():
             self._data_to_ascii[mob.get_mob_id()] = mob.get_symbol()
+        self._ascii_lut = None
+        self._mob_store = self.collect_mob_store()
+        self._occupancy = self.build_occupancy_grid()
+        self._flow_field = None
+        self._active_region = self.build_active_region()
         self._current_enemy = None
         self._update_flag = True
 
+    def collect_mob_store(self):
+        """Returns a Mob Store holding exactly the mobs in the Game Grid. The store
+        the mobs were created in is reused if it holds nothing else, otherwise the
+        mobs are moved into a new one.
+        :return: the Mob Store holding the mobs in the Game Grid
+        """
+        mobs = list(self._mobs.values())
+        if mobs and len(mobs[0].get_store()) == len(mobs) and all(mob.get_store() is mobs[0].get_store() for mob in mobs):
+            return mobs[0].get_store()
+
+        store = MobStore(len(mobs))
+        for mob in mobs:
+            mob.move_to_store(store)
+
+        return store
+
+    def get_mob_store(self):
+        """Returns the Mob Store holding the state of the mobs in the Game Grid.
+        :return: the Mob Store of the Game Grid
+        """
+        return self._mob_store
+
+    def build_occupancy_grid(self):
+        """Builds the spatial index of the player, mobs and hearts in the Game Grid.
+        :return: the Occupancy Grid indexing the player, mobs and hearts
+        """
+        occupancy = OccupancyGrid(self._rows, self._columns, chunked=isinstance(self._level_data, ChunkedArray))
+        occupancy.add_entity(self._player, 4)
+        for mob in self._mobs.values():
+            occupancy.add_entity(mob, mob.get_mob_id())
+        for heart in self._hearts:
+            occupancy.add_heart(heart.get_x(), heart.get_y())
+
+        return occupancy
+
+    def get_occupancy_grid(self):
+        """Returns the spatial index of the player, mobs and hearts in the Game Grid.
+        :return: the Occupancy Grid of the Game Grid
+        """
+        return self._occupancy
+
+    def build_active_region(self):
+        """Builds the Active Region of the Game Grid, with every mob asleep until
+        the player enters its room or comes within MOB_CHASE_RADIUS of it.
+        :return: the Active Region of the Game Grid
+        """
+        active_region = ActiveRegion(self._rooms, self._rows, self._columns, MOB_CHASE_RADIUS)
+        for mob in self._mobs.values():
+            active_region.add_mob(mob)
+
+        return active_region
+
+    def get_active_region(self):
+        """Returns the Active Region of the Game Grid, which counts the awake and sleeping mobs.
+        :return: the Active Region of the Game Grid
+        """
+        return self._active_region
+
+    def get_flow_field(self):
+        """Returns the Flow Field leading mobs towards the player, creating it over
+        the walkable terrain on first use. The field itself is only rebuilt when the
+        player has moved.
+        :return: the Flow Field of the Game Grid
+        """
+        if self._flow_field is None:
+            self._flow_field = FlowField(self._level_data, FLOW_FIELD_RADIUS)
+
+        return self._flow_field
+
     def get_player_health(self):
         """Retrieves the player's health and max health, as a size-2 tuple.
         :return: the player's health, the player's max health
@@ -67,45 +165,91 @@ class GameGrid:
         """
         return self._columns
 
+    def get_terrain(self) -> np.ndarray:
+        """Returns the static terrain layer of the Game Grid, without any entities.
+        :return: the terrain level data of the Game Grid, a 2-D array or a Chunked Level
+        """
+        return self._level_data
+
     def get_level_data(self) -> np.ndarray:
-        """Returns the level data from the Game Grid.
+        """Returns the level data from the Game Grid, with all entities composited over the terrain.
         :return: the level data from the Game Grid
         """
-        bg = self._level_data.copy()
-        bg[self.get_y(), self.get_x()] = 4
-
-        for mob in self._mobs.values():
-            bg[mob.get_y(), mob.get_x()] = mob.get_mob_id()
-
-        for heart in self._hearts:
-            bg[heart.get_y(), heart.get_x()] = -1
-
-        if self._player.is_attacking():
-            weapon_position = self._player.get_weapon_position()
-            bg[weapon_position.get_y(), weapon_position.get_x()] = 5
-            self._data_to_ascii[5] = self._player.get_weapon_symbol()
-        return bg
+        return self.composite(0, self._rows, 0, self._columns)
 
     def get_fov_grid(self) -> np.ndarray:
-        """Returns the portion of the level data with the FOV.
+        """Returns the portion of the level data with the FOV. Only the FOV window
+        of the terrain is copied, and only entities within it are composited.
         :return: the portion of the level data with the FOV
         """
-        gg = self.get_level_data()
         upper, lower, left, right = self.get_fov()
 
-        return gg[upper:lower, left:right]
+        return self.composite(upper, lower, left, right)
+
+    def composite(self, upper, lower, left, right) -> np.ndarray:
+        """Returns the given window of the level data, compositing the entity layer
+        (player, mobs, hearts and the attacking weapon) over a copy of the static
+        terrain layer. Entities are read from the same window of the Occupancy Grid,
+        so those outside it are never visited. The window is widened to dtype intp,
+        so any mob id fits.
+        :param upper: the first row of the window
+        :param lower: the row after the last row of the window
+        :param left: the first column of the window
+        :param right: the column after the last column of the window
+        :return: the composited window of the level data
+        """
+        window = self._level_data[upper:lower, left:right].astype(np.intp)
+        codes, hearts = self._occupancy.get_window(upper, lower, left, right)
+        np.copyto(window, codes, where=codes != 0)
+        window[hearts] = -1
+
+        if self._player.is_attacking():
+            weapon_position = self._player.get_weapon_position()
+            x, y = weapon_position.get_x(), weapon_position.get_y()
+            if upper <= y < lower and left <= x < right:
+                window[y - upper, x - left] = 5
+            self.set_ascii_symbol(5, self._player.get_weapon_symbol())
+
+        return window
 
     def data_grid_to_ascii(self):
         """Returns the Game Grid as Chararray of respective character-mapped translations.
         :return: the Game Grid as Chararray of respective character-mapped translations
         """
+        start = perf_counter()
         data_grid = self.get_fov_grid()
-        ascii_grid = np.ndarray(shape=data_grid.shape, dtype='<U1')
-        for pos, val in np.ndenumerate(data_grid):
-            ascii_grid[pos] = self._data_to_ascii[val]
+        record_phase(GET_FOV_GRID, start)
+        start = perf_counter()
+        ascii_grid = self.get_ascii_lut()[data_grid]
+        record_phase(DATA_GRID_TO_ASCII, start)
 
         return ascii_grid
 
+    def get_ascii_lut(self) -> np.ndarray:
+        """Returns the lookup array translating level data codes to characters,
+        rebuilding it first if the character mapping has changed. Negative codes
+        index from the end of the array, so the heart (-1) is stored last.
+        :return: the lookup array translating level data codes to characters
+        """
+        if self._ascii_lut is None:
+            codes = np.fromiter(self._data_to_ascii.keys(), dtype=np.intp, count=len(self._data_to_ascii))
+            lut = np.full(codes.max() + 2, ' ', dtype='<U1')
+            lut[codes] = list(self._data_to_ascii.values())
+            self._ascii_lut = lut
+
+        return self._ascii_lut
+
+    def set_ascii_symbol(self, code, symbol):
+        """Maps the given level data code to the given character, invalidating
+        the lookup array only if the mapping actually changes.
+        :param code: the level data code
+        :param symbol: the character to which the code is mapped
+        :return: None
+        """
+        if self._data_to_ascii.get(code) != symbol:
+            self._data_to_ascii[code] = symbol
+            self._ascii_lut = None
+
     def get_position(self):
         """Retrieves the current position of the player.
         :return: the current position of the player
@@ -161,15 +305,10 @@ class GameGrid:
         if entity.get_direction() != Direction.LEFT:
             entity.set_direction(Direction.LEFT)
 
-        if self.left_possible(entity.get_position()):
+        if self.left_possible(entity.get_position()) and not self._occupancy.is_occupied(entity.get_x() - 1, entity.get_y()):
+            old_x, old_y = entity.get_x(), entity.get_y()
             entity.move_left()
-
-            if isinstance(entity, Player):
-                health, max_health = self.get_player_health()
-                if health != max_health and self.is_at_heart():
-                    self._hearts.remove(entity.get_position())
-                    self._player.gain_health(1)
-
+            self.on_entity_moved(entity, old_x, old_y)
             self.set_need_update()
 
     def move_right(self, entity: LivingEntity):
@@ -181,15 +320,10 @@ class GameGrid:
         if entity.get_direction() != Direction.RIGHT:
             entity.set_direction(Direction.RIGHT)
 
-        if self.right_possible(entity.get_position()):
+        if self.right_possible(entity.get_position()) and not self._occupancy.is_occupied(entity.get_x() + 1, entity.get_y()):
+            old_x, old_y = entity.get_x(), entity.get_y()
             entity.move_right()
-
-            if isinstance(entity, Player):
-                health, max_health = self.get_player_health()
-                if health != max_health and self.is_at_heart():
-                    self._hearts.remove(entity.get_position())
-                    self._player.gain_health(1)
-
+            self.on_entity_moved(entity, old_x, old_y)
             self.set_need_update()
 
     def move_up(self, entity: LivingEntity):
@@ -201,15 +335,10 @@ class GameGrid:
         if entity.get_direction() != Direction.UP:
             entity.set_direction(Direction.UP)
 
-        if self.up_possible(entity.get_position()):
+        if self.up_possible(entity.get_position()) and not self._occupancy.is_occupied(entity.get_x(), entity.get_y() - 1):
+            old_x, old_y = entity.get_x(), entity.get_y()
             entity.move_up()
-
-            if isinstance(entity, Player):
-                health, max_health = self.get_player_health()
-                if health != max_health and self.is_at_heart():
-                    self._hearts.remove(entity.get_position())
-                    self._player.gain_health(1)
-
+            self.on_entity_moved(entity, old_x, old_y)
             self.set_need_update()
 
     def move_down(self, entity: LivingEntity):
@@ -221,17 +350,31 @@ class GameGrid:
         if entity.get_direction() != Direction.DOWN:
             entity.set_direction(Direction.DOWN)
 
-        if self.down_possible(entity.get_position()):
+        if self.down_possible(entity.get_position()) and not self._occupancy.is_occupied(entity.get_x(), entity.get_y() + 1):
+            old_x, old_y = entity.get_x(), entity.get_y()
             entity.move_down()
-
-            if isinstance(entity, Player):
-                health, max_health = self.get_player_health()
-                if health != max_health and self.is_at_heart():
-                    self._hearts.remove(entity.get_position())
-                    self._player.gain_health(1)
-
+            self.on_entity_moved(entity, old_x, old_y)
             self.set_need_update()
 
+    def on_entity_moved(self, entity: LivingEntity, old_x, old_y):
+        """Updates the Occupancy Grid after the given entity moved from the given tile.
+        If the entity is the player and is missing health, it picks up any heart on
+        its new tile.
+        :param entity: the entity that moved
+        :param old_x: the x-position the entity moved from
+        :param old_y: the y-position the entity moved from
+        :return: None
+        """
+        if isinstance(entity, Player):
+            self._occupancy.move_entity(4, old_x, old_y, entity.get_x(), entity.get_y())
+            health, max_health = self.get_player_health()
+            if health != max_health and self.is_at_heart():
+                self._hearts.remove(entity.get_position())
+                self._occupancy.remove_heart(entity.get_x(), entity.get_y())
+                self._player.gain_health(1)
+        else:
+            self._occupancy.move_entity(entity.get_mob_id(), old_x, old_y, entity.get_x(), entity.get_y())
+
     def get_fov(self) -> (int, int, int, int):
         """Returns the FOV indices as a size-4 tuple of boundaries.
         :return: a size-4 tuple of form (upper, lower, left, right)
@@ -245,24 +388,25 @@ class GameGrid:
         if upper < 0:
             upper = 0
             lower = FOV_HEIGHT
-        elif lower > LEVEL_HEIGHT:
-            lower = LEVEL_HEIGHT
+        elif lower > self._rows:
+            lower = self._rows
             upper = lower - FOV_HEIGHT
 
         if left < 0:
             left = 0
             right = FOV_WIDTH
-        elif right > LEVEL_WIDTH:
-            right = LEVEL_WIDTH
+        elif right > self._columns:
+            right = self._columns
             left = right - FOV_WIDTH
 
         return upper, lower, left, right
 
-    def player_attack(self):
+    def player_attack(self, timer_wheel):
         """Toggles whether player attacking.
+        :param timer_wheel: the Timer Wheel on which to schedule the end of the attack
         :return: None
         """
-        self._player.attack()
+        self._player.attack(timer_wheel)
 
         if self._current_enemy is not None:
             self._current_enemy.take_damage(self._player.get_attack())
@@ -271,55 +415,117 @@ class GameGrid:
         """Removes any dead mobs from the Game Grid.
         :return: None
         """
-        for mob_id, mob in self._mobs.items():
-            if mob.get_health()[0] <= 0:
-                del self._mobs[mob_id]
-                del self._data_to_ascii[mob_id]
+        mobs = self._mob_store.get_mobs()
+        dead_mobs = [mobs[slot] for slot in np.flatnonzero(self._mob_store.get_health() <= 0)]
+
+        for mob in dead_mobs:
+            mob_id = mob.get_mob_id()
+            del self._mobs[mob_id]
+            del self._data_to_ascii[mob_id]
+            self._occupancy.remove_entity(mob, mob_id)
+            self._active_region.remove_mob(mob)
+            mob.move_to_store(MobStore(1))
+            if self._current_enemy is mob:
                 self._current_enemy = None
-                self.set_need_update()
-                break
-
-    def move_mob(self, mob):
-        """Exhibits mob behavior - either stationary, moving towards player, or attacking player - on given mob.
-        :param mob: the mob to examine/manipulate
-        :return: None
-        """
-        if mob.get_position().distance_to(self.get_position()) <= 18 and mob.get_position().distance_to(
-                self.get_position()) != 1:
-            if abs(mob.get_y() - self.get_y()) > 1:
-                if mob.get_y() > self.get_y():
-                    self.move_up(mob)
-                if mob.get_y() < self.get_y():
-                    self.move_down(mob)
-            if abs(mob.get_x() - self.get_x()) > 1:
-                if mob.get_x() > self.get_x():
-                    self.move_left(mob)
-                if mob.get_x() < self.get_x():
-                    self.move_right(mob)
-        if abs(mob.get_position() - self.get_position()) == Position(1, 1):
-            if mob.get_x() < self.get_x():
-                self.move_right(mob)
-            else:
-                self.move_left(mob)
-
-        if mob.get_position().distance_to(self.get_position()) == 1:
-            if mob.get_weapon_position() == self.get_position():
-                self._player.take_damage(mob.get_attack())
-                if self._current_enemy is not mob:
-                    self._current_enemy = mob
-            else:
-                mob.turn_to_face(self.get_position())
+            self._ascii_lut = None
             self.set_need_update()
 
     def update_mobs(self):
-        """Removes dead mobs from Game Grid and prompts
-        each mob to exhibit appropriate behaviour.
+        """Removes dead mobs from Game Grid, updates the Active Region, and steps
+        every awake mob in one batched update. Sleeping mobs are not visited. Each mob takes
+        up to MOB_CHASE_STEPS steps along the Flow Field towards the player,
+        and attacks the player once next to it, provided it faces the player
+        and its attack cooldown has run out; otherwise it turns to face the
+        player. Each step is applied to all mobs at once: a mob may not step
+        onto a tile held or vacated in the same step, and when several mobs
+        step onto the same tile, the mob in the lowest Mob Store slot wins.
         :return: None
         """
+        start = perf_counter()
         self.update_dead_mobs()
+        record_phase(UPDATE_DEAD_MOBS, start)
+
+        store = self._mob_store
+        x, y = self.get_x(), self.get_y()
+        self._active_region.update(store, self._occupancy, x, y)
+        slots = self._active_region.get_awake_slots()
+        if slots.size == 0:
+            return
+
+        cooldown = store.get_cooldown()
+        cooldown[slots[cooldown[slots] > 0]] -= 1
+
+        flow_field = self.get_flow_field()
+        flow_field.update(x, y)
+        for _ in range(MOB_CHASE_STEPS):
+            dx = x - store.get_x()[slots]
+            dy = y - store.get_y()[slots]
+            chasing = slots[dx * dx + dy * dy != 1]
+            directions, closer = flow_field.get_next_directions(store.get_x()[chasing], store.get_y()[chasing],
+                                                                self._occupancy.are_occupied)
+            self.step_mobs(chasing[closer], directions[closer])
+
+        dx = x - store.get_x()[slots]
+        dy = y - store.get_y()[slots]
+        adjacent = dx * dx + dy * dy == 1
+        if not adjacent.any():
+            return
+
+        slots = slots[adjacent]
+        dx = dx[adjacent]
+        dy = dy[adjacent]
+        facing = store.get_facing()[slots]
+        faces_player = (STEP_X[facing] == dx) & (STEP_Y[facing] == dy)
+
+        attacking = slots[faces_player & (cooldown[slots] == 0)]
+        if attacking.size:
+            self._player.take_damage(int(store.get_attack()[attacking].sum()))
+            cooldown[attacking] = MOB_ATTACK_COOLDOWN
+            self._current_enemy = store.get_mobs()[attacking[-1]]
+
+        turning = ~faces_player
+        store.get_facing()[slots[turning]] = np.select([dx[turning] == -1, dx[turning] == 1, dy[turning] == 1],
+                                                       [Direction.LEFT.value, Direction.RIGHT.value, Direction.DOWN.value],
+                                                       Direction.UP.value)
+        self.set_need_update()
+
+    def step_mobs(self, slots, directions):
+        """Turns the mobs in the given Mob Store slots to face the given directions,
+        then moves each one step that way if the terrain allows it and the tile is
+        free. Where several mobs step onto the same tile, the lowest slot wins.
+        :param slots: the array of Mob Store slots of the mobs to step
+        :param directions: the array of Direction values in which to step
+        :return: None
+        """
+        store = self._mob_store
+        store.get_facing()[slots] = directions
 
-        for mob in self._mobs.values():
-            self.move_mob(mob)
+        old_x = store.get_x()[slots]
+        old_y = store.get_y()[slots]
+        new_x = old_x + STEP_X[directions]
+        new_y = old_y + STEP_Y[directions]
+
+        terrain = self._level_data[new_y, new_x]
+        free = ((terrain == 1) | (terrain == -1)) & ~self._occupancy.are_occupied(new_x, new_y)
+        free = np.flatnonzero(free)
+        _, first = np.unique(new_y[free] * self._columns + new_x[free], return_index=True)
+        moving = free[first]
+        if moving.size == 0:
+            return
+
+        self._occupancy.move_entities(store.get_mob_ids()[slots[moving]],
+                                      old_x[moving], old_y[moving], new_x[moving], new_y[moving])
+        store.get_x()[slots[moving]] = new_x[moving]
+        store.get_y()[slots[moving]] = new_y[moving]
+        self.set_need_update()
+
+    def get_mobs_within(self, radius):
+        """Retrieves the mobs within the given radius of the player.
+        :param radius: the search radius, in tiles
+        :return: the list of mobs within the radius of the player
+        """
+        return [entity for entity in self._occupancy.get_entities_within(self.get_x(), self.get_y(), radius)
+                if entity is not self._player]
 
     def get_current_enemy_health(self):
         """Retrieves the current enemy's health and max health, as a size-2 tuple.
@@ -346,6 +552,49 @@ class GameGrid:
         """
         return self._player
 
+    def replace_player(self, player: Player):
+        """Replaces the player in the Game Grid with the given player, placed at the
+        position of the player it replaces.
+        :param player: the player to place in the Game Grid
+        :return: None
+        """
+        player.set_position(self._player.get_position())
+        self._player = player
+        self._occupancy.add_entity(player, 4)
+        self.set_ascii_symbol(4, player.get_symbol())
+        self.set_ascii_symbol(5, player.get_weapon_symbol())
+        self.set_need_update()
+
+    def __getstate__(self):
+        """Returns the Game Grid state to pickle, excluding the derived ASCII lookup array,
+        Flow Field and Active Region.
+        :return: the Game Grid state to pickle
+        """
+        state = self.__dict__.copy()
+        state['_ascii_lut'] = None
+        state['_flow_field'] = None
+        state['_active_region'] = None
+        return state
+
+    def __setstate__(self, state):
+        """Restores the Game Grid from the given pickled state. States saved before
+        the ASCII lookup array, Mob Store, Occupancy Grid, rooms or seed were introduced are given them.
+        :param state: the pickled Game Grid state
+        :return: None
+        """
+        self.__dict__.update(state)
+        self._ascii_lut = None
+        self._flow_field = None
+        if '_mob_store' not in state:
+            self._mob_store = self.collect_mob_store()
+        if '_occupancy' not in state:
+            self._occupancy = self.build_occupancy_grid()
+        if '_rooms' not in state:
+            self._rooms = []
+        if '_seed' not in state:
+            self._seed = None
+        self._active_region = self.build_active_region()
+
     def __copy__(self):
         """Creates a shallow copy of the Game Grid.
         :return: a shallow copy of the Game Grid
@@ -358,17 +607,54 @@ class GameGrid:
         """
         return self.get_position().distance_to(self._door_pos) <= 1.6
 
+    def enter_door(self, next_level):
+        """Enters the next level if the player is at the door. The Model takes the
+        next level from its Level Prefetcher, and a Headless Session generates it.
+        :param next_level: the callable taking the level, player and seed of the
+        run and returning the Game Grid of that level, such as generate_level
+        :return: the Game Grid of the next level with the player at its spawn, or
+        None if the player is not at the door
+        """
+        if not self.is_at_door():
+            return None
+
+        return next_level(self._level + 1, self._player, self._seed)
+
+    def get_seed(self):
+        """Retrieves the seed of the run from which the Game Grid was generated.
+        :return: the seed of the Game Grid, or None if it was not generated from one
+        """
+        return self._seed
+
     def get_current_level(self):
         """Returns the current level of the Game Grid.
         :return: the current level of the Game Grid
         """
         return self._level
 
+    def get_rooms(self):
+        """Returns the Rooms of the Game Grid, in level data coordinates.
+        :return: the list of Rooms of the Game Grid
+        """
+        return self._rooms
+
+    def get_door_position(self):
+        """Returns the position of the door in the Game Grid.
+        :return: the position of the door in the Game Grid
+        """
+        return self._door_pos
+
+    def get_hearts(self):
+        """Returns the positions of the hearts in the Game Grid.
+        :return: the set of positions of the hearts in the Game Grid
+        """
+        return self._hearts
+
     def is_at_heart(self):
         """Checks if player is at a heart in Game Grid.
         :return: True if player position is also a heart position, else False
         """
-        return self.get_position() in self._hearts
+        return self._occupancy.has_heart(self.get_x(), self.get_y())
 
     def need_update(self):
         """Checks if an update is necessary. If so, additionally resets update flag to False.
@@ -1,10 +1,12 @@
+from functools import lru_cache
 from math import sqrt
-from random import randrange
+from random import Random, randrange
 
 import numpy as np
 
 from model.living_entity.weapon.sword import Sword
 from model.game_grid import GameGrid
+from model.level_generator.corridor import CORRIDOR_STRATEGIES
 from model.level_generator.room import Room
 from model.living_entity.mob import Rat
 from model.living_entity.player import Player
@@ -23,6 +25,13 @@ MIN_ROOM_WIDTH = 12
 MIN_ROOM_HEIGHT = 12
 MAX_ROOM_WIDTH = 40
 MAX_ROOM_HEIGHT = 15
+PLACEMENT_BATCH_SIZE = 64
+MAX_PLACEMENT_BATCHES = 64
+
+CORRIDOR_STRATEGY = "chain"
+
+SEED_RANGE = 2 ** 32
+TERRAIN_CACHE_SIZE = 16
 
 
 def init_level():
@@ -33,30 +42,71 @@ def init_level():
     return np.zeros((LEVEL_HEIGHT - 2, LEVEL_WIDTH - 2), dtype=np.int8)
 
 
-def init_rooms(level_map):
+def make_rng(seed, level, stream):
+    """Returns the random number generator of the given stream of the given level
+    of the given seed. Each stream is seeded independently, so that the terrain
+    of a level can be cached without changing what is drawn for its population.
+    :param seed: the seed of the run
+    :param level: the level being generated
+    :param stream: the name of the stream, such as "terrain" or "population"
+    :return: the random number generator of the stream
+    """
+    return Random("%d/%d/%s" % (seed, level, stream))
+
+
+def init_rooms(level_map, rng, num_rooms=None):
     """Generates a list of Rooms with random position, width, and length,
     all of which lie within level boundaries and don't overlap each other.
+    Candidate rooms are drawn in batches of at least PLACEMENT_BATCH_SIZE, growing
+    with the number of rooms still to place, and checked
+    all at once against a summed-area table of the tiles already taken, so
+    placement cost grows with the number of batches rather than with the
+    number of candidate and accepted room pairs. Batches are drawn until
+    num_rooms rooms are placed. If num_rooms is not specified, it is drawn
+    between MIN_NUM_ROOMS and MAX_NUM_ROOMS.
     Each room is inserted/reflected into the level map, and the list of rooms is returned
     :param level_map: the level data, in which to insert rooms
+    :param rng: the random number generator from which to draw
+    :param num_rooms: the number of rooms to place
     :return: the list of rooms
+    :raises ValueError: if fewer than num_rooms or MIN_NUM_ROOMS rooms, whichever is less, fit in
+    MAX_PLACEMENT_BATCHES batches
     """
+    rows, columns = level_map.shape
+    if num_rooms is None:
+        num_rooms = rng.randrange(MIN_NUM_ROOMS, MAX_NUM_ROOMS)
+    batch_rng = np.random.default_rng(rng.getrandbits(64))
+    # tiles covered by a room or its right and bottom edge, which no other room may touch
+    taken = np.zeros((rows, columns), dtype=bool)
     rooms = []
-    num_rooms = randrange(MIN_NUM_ROOMS, MAX_NUM_ROOMS)
 
-    for i in range(MIN_NUM_ROOMS):
-        for j in range(num_rooms):
-            if len(rooms) >= MAX_NUM_ROOMS:
-                break
+    for batch in range(MAX_PLACEMENT_BATCHES):
+        if len(rooms) >= num_rooms:
+            break
+
+        batch_size = max(PLACEMENT_BATCH_SIZE, PLACEMENT_BATCH_SIZE * (num_rooms - len(rooms)) // 4)
+        widths = batch_rng.integers(MIN_ROOM_WIDTH, MAX_ROOM_WIDTH, batch_size)
+        heights = batch_rng.integers(MIN_ROOM_HEIGHT, MAX_ROOM_HEIGHT, batch_size)
+        xs = 1 + (batch_rng.random(batch_size) * (columns - 1 - widths)).astype(np.intp)
+        ys = 1 + (batch_rng.random(batch_size) * (rows - 1 - heights)).astype(np.intp)
 
-            x = randrange(0, LEVEL_WIDTH - 2)
-            y = randrange(0, LEVEL_HEIGHT - 2)
+        table = np.zeros((rows + 1, columns + 1), dtype=np.int32)
+        np.cumsum(np.cumsum(taken, axis=0, dtype=np.int32), axis=1, out=table[1:, 1:])
+        covered = (table[ys + heights + 1, xs + widths + 1] - table[ys, xs + widths + 1]
+                   - table[ys + heights + 1, xs] + table[ys, xs])
 
-            width = randrange(MIN_ROOM_WIDTH, MAX_ROOM_WIDTH)
-            height = randrange(MIN_ROOM_HEIGHT, MAX_ROOM_HEIGHT)
-            room = Room(Position(x, y), width, height)
+        for candidate in np.flatnonzero(covered == 0).tolist():
+            x, y, width, height = int(xs[candidate]), int(ys[candidate]), int(widths[candidate]), int(heights[candidate])
+            if len(rooms) >= num_rooms or taken[y:y + height + 1, x:x + width + 1].any():
+                continue
 
-            if room.lies_within(Position(0, 0), Position(LEVEL_WIDTH, LEVEL_HEIGHT)) and not room.overlaps(rooms):
-                rooms.append(room)
+            taken[y:y + height + 1, x:x + width + 1] = True
+            rooms.append(Room(Position(x, y), width, height))
+
+    min_rooms = min(num_rooms, MIN_NUM_ROOMS)
+    if len(rooms) < min_rooms:
+        raise ValueError("Could not place %d rooms in a %dx%d level, only placed %d"
+                         % (min_rooms, columns, rows, len(rooms)))
 
     for room in rooms:
         level_map[room.get_y():room.get_y() + room.get_height(), room.get_x():room.get_x() + room.get_width()] = 1
@@ -64,17 +114,21 @@ def init_rooms(level_map):
     return rooms
 
 
-def connect_rooms(rooms, level_map):
+def connect_rooms(rooms, level_map, strategy=CORRIDOR_STRATEGY):
     """Connects Rooms in level_map with paths, ensuring no unreachable Rooms.
+    The given strategy, a key of CORRIDOR_STRATEGIES, chooses which rooms to
+    connect: "chain" connects each room to the next, "spanning_tree" along a
+    minimum spanning tree over the room centers, and "loops" adds the shortest
+    remaining corridors to that tree. If strategy is not specified, the default
+    is CORRIDOR_STRATEGY.
     :param rooms: the list of rooms
     :param level_map: the level_data with isolated rooms
+    :param strategy: the name of the corridor strategy
     :return: None
     """
-    for i in range(len(rooms) - 1):
-        room_a = rooms[i]
-        room_b = rooms[i + 1]
-        cols, rows = zip(*room_a.get_path_indices_to(room_b))
-        level_map[rows, cols] = 1
+    centers = np.array([(room.get_center_position().get_x(), room.get_center_position().get_y()) for room in rooms])
+    for i, j in CORRIDOR_STRATEGIES[strategy](centers):
+        rooms[i].carve_path_to(rooms[j], level_map)
 
 
 def add_boarder_wall(level_map: np.ndarray):
@@ -96,8 +150,7 @@ def add_door(level_map: np.ndarray, rooms: list):
     """
     highest_room = rooms[0]
     door_room_sentinel = Room(Position(highest_room.get_center_position().get_x(), 1), width=0, height=0)
-    cols, rows = zip(*highest_room.get_path_indices_to(door_room_sentinel))
-    level_map[rows, cols] = 1
+    highest_room.carve_path_to(door_room_sentinel, level_map)
 
     level_map[0, door_room_sentinel.get_x() - 1] = 2
     level_map[0, door_room_sentinel.get_x()] = 3
@@ -105,73 +158,125 @@ def add_door(level_map: np.ndarray, rooms: list):
     return Position(door_room_sentinel.get_x(), 0)
 
 
-def get_random_point_in_room(room: Room):
+def get_random_point_in_room(room: Room, rng):
     """Returns a random Position within the given Room.
     :param room: the Room in which the point will reside
+    :param rng: the random number generator from which to draw
     :return: a random Position within the given Room.
     """
-    offset = Position(randrange((room.get_width() - 4) // -2, (room.get_width() - 4) // 2),
-                      randrange((room.get_height() - 4) // -2, (room.get_height() - 4) // 2))
+    offset = Position(rng.randrange((room.get_width() - 4) // -2, (room.get_width() - 4) // 2),
+                      rng.randrange((room.get_height() - 4) // -2, (room.get_height() - 4) // 2))
 
     return room.get_center_position() + offset
 
 
-def generate_mobs(rooms: list, level):
+def generate_mobs(rooms: list, level, rng):
     """Generates a level-influenced randomized distribution
     of mobs with the given list of Rooms, and returns a dictionary
-    mapping each Mob's id to its respective Mob.
+    mapping each Mob's id to its respective Mob. No two Mobs share a position.
     :param rooms: the list of rooms in which to spawn Mobs
     :param level: the current level, used to determine difficulty
+    :param rng: the random number generator from which to draw
     :return: a dictionary mapping each Mob's id to its respective Mob
     """
     other_rooms = rooms[0:len(rooms) - 1]
 
     mobs = dict()
+    occupied = set()
     for room in other_rooms:
-        for i in range(randrange(1, round(sqrt((level + 1) * 2.5)))):
-            mob = Rat(position=get_random_point_in_room(room))
-            mobs[mob.get_mob_id()] = mob
+        for i in range(rng.randrange(1, round(sqrt((level + 1) * 2.5)))):
+            position = get_random_point_in_room(room, rng)
+            if position not in occupied:
+                occupied.add(position)
+                mob = Rat(position=position)
+                mobs[mob.get_mob_id()] = mob
 
     return mobs
 
 
-def generate_hearts(rooms: list, level):
+def generate_hearts(rooms: list, level, rng):
     """Generates a level-influenced randomized distribution
     of hearts with the given list of Rooms, and returns a set
     containing each heart's position.
     :param rooms: the list of rooms in which to place hearts
     :param level: the current level, used to determine difficulty
+    :param rng: the random number generator from which to draw
     :return: a set containing each heart's position.
     """
     hearts = set()
 
     for room in rooms:
-        for i in range(randrange(0, 2 + int(sqrt(level)))):
-            heart = get_random_point_in_room(room)
+        for i in range(rng.randrange(0, 2 + int(sqrt(level)))):
+            heart = get_random_point_in_room(room, rng)
             hearts.add(heart)
 
     return hearts
 
 
-def generate_level(level=0, player=None):
-    """Procedurally generates a Game Grid from the given level and player.
+@lru_cache(maxsize=TERRAIN_CACHE_SIZE)
+def generate_terrain(seed, level):
+    """Procedurally generates the terrain of the given level of the given seed:
+    the level data with its rooms, corridors, border wall and door. Results are
+    kept in an LRU cache of TERRAIN_CACHE_SIZE levels, so the returned level
+    data is read-only and shared between the Game Grids of the same key.
+    :param seed: the seed of the run
+    :param level: the level to generate
+    :return: the read-only level data, the sorted list of rooms, and the position of the door
+    """
+    rng = make_rng(seed, level, "terrain")
+    level_map = init_level()
+    rooms = init_rooms(level_map, rng)
+    rooms.sort()
+    level_map = add_boarder_wall(level_map)
+    connect_rooms(rooms, level_map)
+    door_pos = add_door(level_map, rooms)
+    level_map.flags.writeable = False
+
+    return level_map, rooms, door_pos
+
+
+def shift_rooms(rooms: list):
+    """Returns the given rooms of a level's terrain in level data coordinates. The
+    rooms were placed before the border wall shifted the level by one tile.
+    :param rooms: the list of rooms returned by generate_terrain
+    :return: the list of rooms, each shifted by one tile right and down
+    """
+    return [Room(room.get_position() + Position(1, 1), room.get_width(), room.get_height()) for room in rooms]
+
+
+def generate_population(seed, level, rooms: list):
+    """Generates the mobs and hearts of the given level of the given seed, placed
+    in the given rooms of its terrain.
+    :param seed: the seed of the run
+    :param level: the level to populate
+    :param rooms: the sorted list of rooms of the level's terrain
+    :return: a dictionary mapping each Mob's id to its respective Mob, and a set containing each heart's position
+    """
+    rng = make_rng(seed, level, "population")
+    mobs = generate_mobs(rooms, level=level, rng=rng)
+    hearts = generate_hearts(rooms, level=level, rng=rng)
+
+    return mobs, hearts
+
+
+def generate_level(level=0, player=None, seed=None):
+    """Procedurally generates a Game Grid from the given level, player and seed.
     If level is not specified, the default level is 0. If player
     is not specified, the defualt value is a Player with 10 Health,
     position spawn, and weapon fist. Spawn is determined as the center
-    position of the last element of the sorted room array.
+    position of the last element of the sorted room array. If seed is not
+    specified, a random seed is drawn. The same seed and level always
+    generate the same Game Grid.
     :param level: the level to generate
     :param player: the player to place in Game Grid
+    :param seed: the seed of the run
     :return: a procedurally generated Game Grid
     """
-    level_map = init_level()
-    rooms = init_rooms(level_map)
-    rooms.sort()
-    level_map = add_boarder_wall(level_map)
-    connect_rooms(rooms, level_map)
+    if seed is None:
+        seed = randrange(SEED_RANGE)
+    level_map, rooms, door_pos = generate_terrain(seed, level)
     spawn = rooms[len(rooms) - 1].get_center_position()
-    mobs = generate_mobs(rooms, level=level)
-    hearts = generate_hearts(rooms, level=level)
-    door_pos = add_door(level_map, rooms)
+    mobs, hearts = generate_population(seed, level, rooms)
     if player is None:
         player = Player(health=20, position=spawn, weapon=Sword())
     else:
@@ -182,4 +287,6 @@ def generate_level(level=0, player=None):
                     mobs=mobs,
                     door_pos=door_pos,
                     level=level,
-                    hearts=hearts)
+                    hearts=hearts,
+                    rooms=shift_rooms(rooms),
+                    seed=seed)
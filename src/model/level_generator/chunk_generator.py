@@ -0,0 +1,117 @@
+from random import randrange
+
+import numpy as np
+
+from model.chunked_array import ChunkedLevel
+from model.game_grid import GameGrid
+from model.level_generator import init_rooms, make_rng, SEED_RANGE
+from model.level_generator.corridor import carve_corridor
+from model.living_entity.player import Player
+from model.living_entity.weapon.sword import Sword
+from model.position import Position
+from model.settings import CHUNK_SIZE
+
+CHUNKED_LEVEL_WIDTH = 4096
+CHUNKED_LEVEL_HEIGHT = 4096
+ROOMS_PER_CHUNK = 2
+
+
+class ChunkGenerator:
+    """This class represents the terrain generator of a Chunked Level. Every chunk
+    is crossed by a two-tile-wide corridor through its middle row and column, so
+    the corridors of neighbouring chunks meet at their shared edge and every chunk
+    is reachable without generating any other. Each chunk's rooms are connected to
+    its crossing. A chunk is drawn from its own random stream of the seed, so it
+    can be generated in any order, and again after eviction."""
+    def __init__(self, seed, level, rows, columns, chunk_size=CHUNK_SIZE):
+        """Constructs a Chunk Generator for the given level of the given seed, of the given size.
+        :param seed: the seed of the run
+        :param level: the level being generated
+        :param rows: the number of rows in the level
+        :param columns: the number of columns in the level
+        :param chunk_size: the width and height of a chunk, in tiles
+        """
+        self._seed = seed
+        self._level = level
+        self._rows = rows
+        self._columns = columns
+        self._chunk_size = chunk_size
+
+    def get_door_position(self):
+        """Returns the position of the door, where the corridor crossing the first
+        chunk meets the top border wall.
+        :return: the position of the door
+        """
+        return Position(self._chunk_size // 2, 0)
+
+    def get_spawn_position(self):
+        """Returns the position at which the player spawns, the corridor crossing
+        of the chunk at the center of the level.
+        :return: the position at which the player spawns
+        """
+        middle = self._chunk_size // 2
+        return Position((self._columns // 2) // self._chunk_size * self._chunk_size + middle,
+                        (self._rows // 2) // self._chunk_size * self._chunk_size + middle)
+
+    def __call__(self, chunk_y, chunk_x):
+        """Generates the level data of the given chunk.
+        :param chunk_y: the row of the chunk, in chunks
+        :param chunk_x: the column of the chunk, in chunks
+        :return: the level data of the chunk, chunk_size tiles square
+        """
+        size = self._chunk_size
+        middle = size // 2
+        chunk = np.zeros((size, size), dtype=np.int8)
+        chunk[middle - 1:middle + 1, :] = 1
+        chunk[:, middle - 1:middle + 1] = 1
+
+        rng = make_rng(self._seed, self._level, "chunk/%d/%d" % (chunk_y, chunk_x))
+        for room in init_rooms(chunk, rng, ROOMS_PER_CHUNK):
+            carve_corridor(chunk, room.get_center_position(), Position(middle, middle))
+
+        top, left = chunk_y * size, chunk_x * size
+        chunk[max(self._rows - 1 - top, 0):, :] = 0
+        chunk[:, max(self._columns - 1 - left, 0):] = 0
+        if top == 0:
+            chunk[0, :] = 0
+        if left == 0:
+            chunk[:, 0] = 0
+
+        if (chunk_y, chunk_x) == (0, 0):
+            door = self.get_door_position()
+            chunk[door.get_y(), door.get_x() - 1] = 2
+            chunk[door.get_y(), door.get_x()] = 3
+
+        return chunk
+
+
+def generate_chunked_level(level=0, player=None, seed=None, rows=CHUNKED_LEVEL_HEIGHT, columns=CHUNKED_LEVEL_WIDTH):
+    """Creates a Game Grid of the given level, player and seed on a Chunked Level of
+    the given size, whose chunks are only generated as they are read. The player
+    spawns at the center of the level, and the door is in its top left chunk. If
+    player is not specified, the default value is a Player with 20 Health and a
+    sword. If seed is not specified, a random seed is drawn. No mobs or hearts are
+    placed, as those are only generated for whole levels.
+    :param level: the level to generate
+    :param player: the player to place in Game Grid
+    :param seed: the seed of the run
+    :param rows: the number of rows in the level, at least one chunk
+    :param columns: the number of columns in the level, at least one chunk
+    :return: a Game Grid on a lazily generated Chunked Level
+    """
+    if seed is None:
+        seed = randrange(SEED_RANGE)
+    generator = ChunkGenerator(seed, level, rows, columns)
+    spawn = generator.get_spawn_position()
+    if player is None:
+        player = Player(health=20, position=spawn, weapon=Sword())
+    else:
+        player.set_position(spawn)
+
+    return GameGrid(level_data=ChunkedLevel(rows, columns, generator),
+                    player=player,
+                    mobs={},
+                    door_pos=generator.get_door_position(),
+                    level=level,
+                    hearts=set(),
+                    seed=seed)
@@ -0,0 +1,114 @@
+import numpy as np
+
+from model.position import Position
+
+CORRIDOR_WIDTH = 2
+EXTRA_LOOPS = 2
+
+
+def carve_corridor(level_map: np.ndarray, source: Position, destination: Position, width=CORRIDOR_WIDTH):
+    """Carves an L-shaped corridor between the given positions into the given level
+    map, with one slice assignment per leg. The vertical leg runs along the column of
+    whichever end is higher up, and the horizontal leg along the row where the
+    vertical leg ends, so the corridor covers the same tiles Room.get_path_indices_to
+    lists. Each leg is width tiles wide, widening leftwards and upwards from its line.
+    :param level_map: the level data, in which to carve the corridor
+    :param source: the position from which the corridor starts
+    :param destination: the position at which the corridor ends
+    :param width: the width of the corridor, in tiles
+    :return: None
+    """
+    source_x, source_y = source.get_x(), source.get_y()
+    destination_x, destination_y = destination.get_x(), destination.get_y()
+
+    y = None
+    if source_y != destination_y:
+        column = source_x if source_y < destination_y else destination_x
+        upper, lower = min(source_y, destination_y), max(source_y, destination_y)
+        level_map[upper:lower, max(column - width + 1, 0):column + 1] = 1
+        y = lower - 1
+
+    if source_x != destination_x:
+        if y is None:
+            y = source_y if source_x < destination_x else destination_y
+        left, right = min(source_x, destination_x), max(source_x, destination_x)
+        level_map[max(y - width + 1, 0):y + 1, left:right] = 1
+
+
+def chain_edges(centers: np.ndarray):
+    """Returns the corridors linking each room to the next, in the given order.
+    :param centers: an (n, 2) array of the x- and y-positions of the room centers
+    :return: the list of (i, j) index pairs of the rooms to connect
+    """
+    return [(i, i + 1) for i in range(len(centers) - 1)]
+
+
+def get_corridor_lengths(centers: np.ndarray, room):
+    """Returns the Manhattan distance from the center of the given room to every
+    room center, which is the length of the L-shaped corridor between them.
+    :param centers: an (n, 2) array of the x- and y-positions of the room centers
+    :param room: the index of the room from which to measure
+    :return: the array of n corridor lengths
+    """
+    return np.abs(centers - centers[room]).sum(axis=1)
+
+
+def spanning_tree_edges(centers: np.ndarray):
+    """Returns the corridors of a minimum spanning tree over the room centers, by
+    Prim's algorithm. Each step adds the shortest corridor from the tree to a room
+    outside it and updates the shortest corridor to every other room, in a couple
+    of array operations.
+    :param centers: an (n, 2) array of the x- and y-positions of the room centers
+    :return: the list of (i, j) index pairs of the rooms to connect
+    """
+    count = len(centers)
+    in_tree = np.zeros(count, dtype=bool)
+    in_tree[0] = True
+    best_length = get_corridor_lengths(centers, 0).astype(float)
+    best_length[0] = np.inf
+    best_parent = np.zeros(count, dtype=np.intp)
+
+    edges = []
+    for _ in range(count - 1):
+        room = int(best_length.argmin())
+        edges.append((int(best_parent[room]), room))
+        in_tree[room] = True
+        best_length[room] = np.inf
+        lengths = get_corridor_lengths(centers, room)
+        closer = ~in_tree & (lengths < best_length)
+        best_length[closer] = lengths[closer]
+        best_parent[closer] = room
+
+    return edges
+
+
+def loop_edges(centers: np.ndarray, extra_loops=EXTRA_LOOPS):
+    """Returns the corridors of a minimum spanning tree over the room centers, plus
+    up to extra_loops more, so the level has loops to circle. The extra corridors
+    are the shortest of each room's shortest corridor outside the tree.
+    :param centers: an (n, 2) array of the x- and y-positions of the room centers
+    :param extra_loops: the number of corridors to add to the tree
+    :return: the list of (i, j) index pairs of the rooms to connect
+    """
+    edges = spanning_tree_edges(centers)
+    neighbours = [[] for _ in range(len(centers))]
+    for i, j in edges:
+        neighbours[i].append(j)
+        neighbours[j].append(i)
+
+    shortest = {}
+    for room in range(len(centers)):
+        lengths = get_corridor_lengths(centers, room).astype(float)
+        lengths[room] = np.inf
+        lengths[neighbours[room]] = np.inf
+        other = int(lengths.argmin())
+        if np.isfinite(lengths[other]):
+            shortest[(min(room, other), max(room, other))] = lengths[other]
+
+    edges.extend(sorted(shortest, key=shortest.get)[:extra_loops])
+    return edges
+
+
+CORRIDOR_STRATEGIES = {"chain": chain_edges,
+                       "spanning_tree": spanning_tree_edges,
+                       "loops": loop_edges}
@@ -0,0 +1,137 @@
+from time import perf_counter
+
+from model.level_generator import generate_level
+
+# the start methods of the worker process, in order of preference; forking the
+# game's process would copy the locks held by its other threads, such as the
+# autosaver and input threads, and could leave the worker deadlocked on one
+START_METHODS = ("forkserver", "spawn")
+
+
+class LevelPrefetcher:
+    """This class represents a background generator of the next dungeon level. The
+    level after the one being played is generated in a worker process as soon as
+    the current level is entered, so the door transition only has to swap in the
+    finished Game Grid. If the level is not ready in time, it is generated
+    synchronously instead."""
+    def __init__(self):
+        """Constructs a Level Prefetcher with no level in preparation. The worker
+        process is started on the first prefetch, by the first of START_METHODS
+        the platform supports.
+        """
+        self._executor = None
+        self._key = None
+        self._future = None
+        self._transitions = 0
+        self._prefetch_hits = 0
+        self._total_latency = 0.0
+        self._max_latency = 0.0
+
+    def prefetch(self, level, seed=None):
+        """Starts generating the given level of the given seed in the worker process,
+        discarding any other level in preparation. If no seed is provided, a random
+        seed is drawn by the worker.
+        :param level: the level to generate
+        :param seed: the seed of the run
+        :return: None
+        """
+        if self._key == (seed, level) and self._future is not None:
+            return
+
+        self.discard()
+        if self._executor is None:
+            # imported here, as concurrent.futures and multiprocessing take longer to import than the model itself
+            import multiprocessing
+            from concurrent.futures import ProcessPoolExecutor
+            start_method = next(method for method in START_METHODS
+                                if method in multiprocessing.get_all_start_methods())
+            self._executor = ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context(start_method))
+        self._key = (seed, level)
+        self._future = self._executor.submit(generate_level, level, None, seed)
+
+    def is_ready(self, level, seed=None):
+        """Checks whether the given level of the given seed has finished generating
+        in the worker process.
+        :param level: the level to check
+        :param seed: the seed of the run
+        :return: True if the level is ready to be taken, else False
+        """
+        return self._key == (seed, level) and self._future is not None and self._future.done() \
+            and self._future.exception() is None
+
+    def take(self, level, player, seed=None):
+        """Returns the Game Grid of the given level of the given seed with the given
+        player at its spawn, swapping in the prefetched level if it is ready and
+        generating it synchronously otherwise. The time taken is recorded as the
+        door transition latency.
+        :param level: the level to take
+        :param player: the player to place in the Game Grid
+        :param seed: the seed of the run
+        :return: the Game Grid of the given level
+        """
+        start = perf_counter()
+        if self.is_ready(level, seed):
+            game_grid = self._future.result()
+            game_grid.replace_player(player)
+            self._prefetch_hits += 1
+        else:
+            game_grid = generate_level(level, player, seed)
+        self.discard()
+
+        latency = perf_counter() - start
+        self._transitions += 1
+        self._total_latency += latency
+        self._max_latency = max(self._max_latency, latency)
+
+        return game_grid
+
+    def discard(self):
+        """Discards the level in preparation, if any.
+        :return: None
+        """
+        if self._future is not None:
+            self._future.cancel()
+        self._key = None
+        self._future = None
+
+    def shutdown(self):
+        """Discards the level in preparation and stops the worker process.
+        :return: None
+        """
+        self.discard()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def get_transitions(self):
+        """Returns the number of door transitions made.
+        :return: the number of door transitions made
+        """
+        return self._transitions
+
+    def get_prefetch_hits(self):
+        """Returns the number of door transitions that swapped in a prefetched level.
+        :return: the number of door transitions that swapped in a prefetched level
+        """
+        return self._prefetch_hits
+
+    def get_mean_latency(self):
+        """Returns the mean time a door transition took, in seconds.
+        :return: the mean time a door transition took, in seconds
+        """
+        if self._transitions == 0:
+            return 0.0
+        return self._total_latency / self._transitions
+
+    def get_max_latency(self):
+        """Returns the longest time a door transition took, in seconds.
+        :return: the longest time a door transition took, in seconds
+        """
+        return self._max_latency
+
+    def __str__(self):
+        """Returns the door transition statistics as a one-line summary.
+        :return: the door transition statistics as a one-line summary
+        """
+        return ("door transitions: %d (%d prefetched, latency mean %.2f ms, max %.2f ms)"
+                % (self._transitions, self._prefetch_hits, self.get_mean_latency() * 1e3, self._max_latency * 1e3))
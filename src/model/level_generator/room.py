@@ -1,3 +1,4 @@
+from model.level_generator.corridor import carve_corridor, CORRIDOR_WIDTH
 from model.position import Position
 
 
@@ -133,3 +134,13 @@ class Room:
                 path.extend([(x, y - 1) for x in range(destination.get_x(), source.get_x())])
 
         return path
+
+    def carve_path_to(self, other, level_map, width=CORRIDOR_WIDTH):
+        """Carves a corridor from this Room to the given Room into the given level map,
+        covering the tiles get_path_indices_to lists, with one slice assignment per leg.
+        :param other: the Room to carve a corridor to from this Room
+        :param level_map: the level data, in which to carve the corridor
+        :param width: the width of the corridor, in tiles
+        :return: None
+        """
+        carve_corridor(level_map, self.get_center_position(), other.get_center_position(), width)
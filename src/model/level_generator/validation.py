@@ -0,0 +1,30 @@
+import numpy as np
+
+from model.flow_field import compute_distance_field, UNREACHABLE
+
+
+def find_reachable(game_grid):
+    """Returns which tiles of the given Game Grid can be walked to from the player's
+    spawn, by a vectorized flood fill over its terrain.
+    :param game_grid: the Game Grid to flood, whose player stands at its spawn
+    :return: a 2-D boolean array, True where a tile can be walked to from the spawn
+    """
+    terrain = game_grid.get_terrain()
+    walkable = (terrain == 1) | (terrain == -1)
+    distances, _, _ = compute_distance_field(walkable, game_grid.get_x(), game_grid.get_y())
+    return distances != UNREACHABLE
+
+
+def check_reachability(game_grid):
+    """Checks that every room and the door of the given Game Grid can be reached
+    from the player's spawn. The door counts as reached if the tile below it is.
+    :param game_grid: the Game Grid to check, whose player stands at its spawn
+    :return: the number of rooms that cannot be reached, and whether the door can be
+    """
+    reachable = find_reachable(game_grid)
+    centers = np.array([(room.get_center_position().get_y(), room.get_center_position().get_x())
+                        for room in game_grid.get_rooms()], dtype=np.intp).reshape(-1, 2)
+    unreachable_rooms = int(np.count_nonzero(~reachable[centers[:, 0], centers[:, 1]]))
+    door = game_grid.get_door_position()
+
+    return unreachable_rooms, bool(reachable[door.get_y() + 1, door.get_x()])
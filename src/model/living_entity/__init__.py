@@ -1,4 +1,3 @@
-import threading
 from abc import ABC
 
 from model.direction import Direction
@@ -7,6 +6,8 @@ from model.position import Position
 
 class LivingEntity(ABC):
     """This abstract class represents a living entity in Dungeon Crawler"""
+    _attack_timer = None
+
     def __init__(self, symbol, health, position, facing, weapon):
         """Constructs a Living Entity with the given symbol, health, position, facing direction, and weapon.
         :param symbol: a string representing the entity
@@ -124,6 +125,12 @@ class LivingEntity(ABC):
         """
         return self._weapon.get_attack()
 
+    def get_weapon(self):
+        """Retrieves the weapon wielded by the entity.
+        :return: the weapon wielded by the entity
+        """
+        return self._weapon
+
     def get_weapon_symbol(self):
         """Retrieves the string representation of the entity's weapon.
         :return: the string representation of the entity's weapon
@@ -156,11 +163,14 @@ class LivingEntity(ABC):
         """
         self._attacking = False
 
-    def attack(self):
+    def attack(self, timer_wheel):
         """Makes the entity attack for the duration of its weapon attack rate,
-        then stops attacking. Uses threading to make non-blocking.
+        then stops attacking. The end of the attack is scheduled on the given
+        Timer Wheel, replacing the end of any attack still in progress.
+        :param timer_wheel: the Timer Wheel on which to schedule the end of the attack
         :return: None
         """
         self._attacking = True
-        timer = threading.Timer(self._weapon.get_attack_rate(), self.set_not_attacking)
-        timer.start()
+        if self._attack_timer is not None:
+            self._attack_timer.cancel()
+        self._attack_timer = timer_wheel.schedule_seconds(self._weapon.get_attack_rate(), self.set_not_attacking)
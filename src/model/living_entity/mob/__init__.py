@@ -5,29 +5,141 @@ from abc import ABC
 from model import Fist
 from model.direction import Direction
 from model.living_entity import LivingEntity
+from model.living_entity.mob.mob_store import MobStore
 from model.position import Position
 
 
 class Mob(LivingEntity, ABC):
-    """This abstract class represents a Mob in Dungeon Crawler"""
+    """This abstract class represents a Mob in Dungeon Crawler. A Mob's position,
+    facing direction and health live in a slot of a Mob Store, so that all Mobs in
+    a Game Grid can be stepped in batched array operations, while the Mob itself
+    keeps the Living Entity interface."""
     mob_id = itertools.count(6, 2)
+    kind = 0
 
-    def __init__(self, symbol, health, position, facing, weapon):
+    def __init__(self, symbol, health, position, facing, weapon, store=None, mob_id=None):
         """Constructs a Mob with the given symbol, health,
         position, facing direction, and weapon. If symbol is
         not specified, the default symbol is '&'. If health is
         is not specified, the default health is given by the the
         constant INITIAL_HEALTH. If facing is not specified, the
         default direction is LEFT. If weapon is not specified,
-        the default weapon is a first.
+        the default weapon is a first. If no Mob Store is specified,
+        the Mob is given a store of its own. If no mob id is specified,
+        the next mob id is drawn.
         :param symbol: the string representation of the Mob
         :param health: the initial health of the Mob
         :param position: the initial position of the Mob
         :param facing: the initial facing direction of the Mob
         :param weapon: the weapon wielded by the Mob
+        :param store: the Mob Store in which the Mob's state is kept
+        :param mob_id: the mob id of the Mob, unique within its Game Grid
         """
+        self._mob_id = mob_id if mob_id is not None else next(Mob.mob_id)
+        self._store = store if store is not None else MobStore(1)
+        self._slot = self._store.add(self)
         super().__init__(symbol, health, position, facing, weapon)
-        self._mob_id = next(Mob.mob_id)
+        self._store.get_kind()[self._slot] = self.kind
+        self._store.get_attack()[self._slot] = weapon.get_attack()
+
+    def __setstate__(self, state):
+        """Restores the Mob from the given pickled state. Mobs saved before Mob
+        Stores were introduced carry their position, facing direction and health
+        themselves, and are given a store of their own to hold them.
+        :param state: the pickled Mob state
+        :return: None
+        """
+        if '_store' in state:
+            self.__dict__.update(state)
+            return
+
+        state = dict(state)
+        position = state.pop('_position')
+        facing = state.pop('_facing')
+        health = state.pop('_health')
+        max_health = state.pop('_max_health')
+        self.__dict__.update(state)
+        self._store = MobStore(1)
+        self._slot = self._store.add(self)
+        self._position = position
+        self._facing = facing
+        self._health = health
+        self._max_health = max_health
+        self._store.get_kind()[self._slot] = self.kind
+        self._store.get_attack()[self._slot] = self._weapon.get_attack()
+
+    @property
+    def _position(self):
+        """The Mob's position, read from its Mob Store slot."""
+        return Position(int(self._store.get_x()[self._slot]), int(self._store.get_y()[self._slot]))
+
+    @_position.setter
+    def _position(self, position: Position):
+        self._store.get_x()[self._slot] = position.get_x()
+        self._store.get_y()[self._slot] = position.get_y()
+
+    @property
+    def _facing(self):
+        """The Mob's facing direction, read from its Mob Store slot."""
+        return Direction(int(self._store.get_facing()[self._slot]))
+
+    @_facing.setter
+    def _facing(self, facing: Direction):
+        self._store.get_facing()[self._slot] = facing.value
+
+    @property
+    def _health(self):
+        """The Mob's health, read from its Mob Store slot."""
+        return int(self._store.get_health()[self._slot])
+
+    @_health.setter
+    def _health(self, health):
+        self._store.get_health()[self._slot] = health
+
+    @property
+    def _max_health(self):
+        """The Mob's max health, read from its Mob Store slot."""
+        return int(self._store.get_max_health()[self._slot])
+
+    @_max_health.setter
+    def _max_health(self, max_health):
+        self._store.get_max_health()[self._slot] = max_health
+
+    def get_x(self):
+        """Retrieves the Mob's current x-position.
+        :return: the Mob's current x-position
+        """
+        return int(self._store.get_x()[self._slot])
+
+    def get_y(self):
+        """Retrieves the Mob's current y-position.
+        :return: the Mob's current y-position
+        """
+        return int(self._store.get_y()[self._slot])
+
+    def move_left(self):
+        """Moves the Mob to the left by 1.
+        :return: None
+        """
+        self._store.get_x()[self._slot] -= 1
+
+    def move_right(self):
+        """Moves the Mob to the right by 1.
+        :return: None
+        """
+        self._store.get_x()[self._slot] += 1
+
+    def move_up(self):
+        """Moves the Mob up by 1.
+        :return: None
+        """
+        self._store.get_y()[self._slot] -= 1
+
+    def move_down(self):
+        """Moves the Mob down by 1.
+        :return: None
+        """
+        self._store.get_y()[self._slot] += 1
 
     def get_mob_id(self):
         """Returns the mob's mob id.
@@ -35,6 +147,36 @@ class Mob(LivingEntity, ABC):
         """
         return self._mob_id
 
+    def get_store(self):
+        """Returns the Mob Store in which the Mob's state is kept.
+        :return: the Mob Store in which the Mob's state is kept
+        """
+        return self._store
+
+    def get_slot(self):
+        """Returns the Mob's slot in its Mob Store.
+        :return: the Mob's slot in its Mob Store
+        """
+        return self._slot
+
+    def set_slot(self, slot):
+        """Sets the Mob's slot in its Mob Store, after the store has moved it.
+        :param slot: the Mob's new slot
+        :return: None
+        """
+        self._slot = slot
+
+    def move_to_store(self, store: MobStore):
+        """Moves the Mob's state from its current Mob Store to the given one.
+        :param store: the Mob Store to which the Mob's state is moved
+        :return: None
+        """
+        slot = store.add(self)
+        store.copy_slot(slot, self._store, self._slot)
+        self._store.remove(self._slot)
+        self._store = store
+        self._slot = slot
+
     def turn_to_face(self, pos: Position):
         """Rotates mob to face the given position.
         :param pos: the position to face
@@ -54,10 +196,17 @@ class Mob(LivingEntity, ABC):
 
 class Rat(Mob):
     """This class represents a Rat Mob in Dungeon Crawler"""
-    def __init__(self, position, facing=Direction.LEFT):
+    kind = 0
+
+    def __init__(self, position, facing=Direction.LEFT, store=None, mob_id=None):
         """Constructs a Rat with the given position and facing direction.
         If facing is not specified, the default direction is left.
+        If no Mob Store is specified, the Rat is given a store of its own.
+        If no mob id is specified, the next mob id is drawn.
         :param position: the initial position of the Rat
         :param facing: the initial facing direction of the Rat
+        :param store: the Mob Store in which the Rat's state is kept
+        :param mob_id: the mob id of the Rat, unique within its Game Grid
         """
-        super().__init__(symbol='@', health=4, position=position, facing=facing, weapon=Fist())
+        super().__init__(symbol='@', health=4, position=position, facing=facing, weapon=Fist(), store=store,
+                         mob_id=mob_id)
@@ -0,0 +1,149 @@
+import numpy as np
+
+INITIAL_CAPACITY = 16
+
+
+class MobStore:
+    """This class represents a struct-of-arrays store of Mob state. Each field is
+    a NumPy array indexed by slot, so the state of every Mob in a Game Grid can be
+    read and updated in batched array operations. Slots are kept contiguous: removing
+    a Mob moves the Mob in the last slot into the freed one."""
+    def __init__(self, capacity=INITIAL_CAPACITY):
+        """Constructs an empty Mob Store with room for the given number of Mobs,
+        growing as needed.
+        :param capacity: the number of Mobs for which to allocate room
+        """
+        self._count = 0
+        self._mobs = []
+        self._x = np.zeros(capacity, dtype=np.int32)
+        self._y = np.zeros(capacity, dtype=np.int32)
+        self._health = np.zeros(capacity, dtype=np.int32)
+        self._max_health = np.zeros(capacity, dtype=np.int32)
+        self._facing = np.zeros(capacity, dtype=np.int8)
+        self._kind = np.zeros(capacity, dtype=np.int8)
+        self._cooldown = np.zeros(capacity, dtype=np.int16)
+        self._attack = np.zeros(capacity, dtype=np.int16)
+        self._mob_id = np.zeros(capacity, dtype=np.int32)
+
+    def __len__(self):
+        """Returns the number of Mobs in the store.
+        :return: the number of Mobs in the store
+        """
+        return self._count
+
+    def add(self, mob):
+        """Allocates a zeroed slot for the given Mob, growing the arrays if full.
+        :param mob: the Mob to store
+        :return: the slot allocated to the Mob
+        """
+        if self._count == len(self._x):
+            self._grow(max(2 * len(self._x), INITIAL_CAPACITY))
+
+        slot = self._count
+        for field in self._fields():
+            field[slot] = 0
+        self._mob_id[slot] = mob.get_mob_id()
+        self._mobs.append(mob)
+        self._count += 1
+
+        return slot
+
+    def remove(self, slot):
+        """Frees the given slot, moving the Mob in the last slot into it.
+        :param slot: the slot to free
+        :return: None
+        """
+        last = self._count - 1
+        if slot != last:
+            for field in self._fields():
+                field[slot] = field[last]
+            self._mobs[slot] = self._mobs[last]
+            self._mobs[slot].set_slot(slot)
+        self._mobs.pop()
+        self._count -= 1
+
+    def copy_slot(self, slot, other, other_slot):
+        """Copies every field of the given slot of another Mob Store into the given slot.
+        :param slot: the slot to copy into
+        :param other: the Mob Store to copy from
+        :param other_slot: the slot to copy from
+        :return: None
+        """
+        for field, other_field in zip(self._fields(), other._fields()):
+            field[slot] = other_field[other_slot]
+
+    def get_mobs(self):
+        """Returns the Mobs in the store, in slot order.
+        :return: the list of Mobs in the store, indexed by slot
+        """
+        return self._mobs
+
+    def get_x(self):
+        """Returns the x-positions of the Mobs, indexed by slot.
+        :return: a writable view of the x-positions of the Mobs
+        """
+        return self._x[:self._count]
+
+    def get_y(self):
+        """Returns the y-positions of the Mobs, indexed by slot.
+        :return: a writable view of the y-positions of the Mobs
+        """
+        return self._y[:self._count]
+
+    def get_health(self):
+        """Returns the health of the Mobs, indexed by slot.
+        :return: a writable view of the health of the Mobs
+        """
+        return self._health[:self._count]
+
+    def get_max_health(self):
+        """Returns the max health of the Mobs, indexed by slot.
+        :return: a writable view of the max health of the Mobs
+        """
+        return self._max_health[:self._count]
+
+    def get_facing(self):
+        """Returns the facing Direction values of the Mobs, indexed by slot.
+        :return: a writable view of the facing Direction values of the Mobs
+        """
+        return self._facing[:self._count]
+
+    def get_kind(self):
+        """Returns the kinds of the Mobs, indexed by slot.
+        :return: a writable view of the kinds of the Mobs
+        """
+        return self._kind[:self._count]
+
+    def get_cooldown(self):
+        """Returns the number of Mob steps each Mob must wait before attacking again, indexed by slot.
+        :return: a writable view of the attack cooldowns of the Mobs
+        """
+        return self._cooldown[:self._count]
+
+    def get_attack(self):
+        """Returns the attack damage of the Mobs, indexed by slot.
+        :return: a writable view of the attack damage of the Mobs
+        """
+        return self._attack[:self._count]
+
+    def get_mob_ids(self):
+        """Returns the mob ids of the Mobs, indexed by slot.
+        :return: a view of the mob ids of the Mobs
+        """
+        return self._mob_id[:self._count]
+
+    def _fields(self):
+        """Returns every per-slot array of the store.
+        :return: the tuple of per-slot arrays
+        """
+        return (self._x, self._y, self._health, self._max_health, self._facing,
+                self._kind, self._cooldown, self._attack, self._mob_id)
+
+    def _grow(self, capacity):
+        """Reallocates every per-slot array with room for the given number of Mobs.
+        :param capacity: the new number of Mobs for which to allocate room
+        :return: None
+        """
+        (self._x, self._y, self._health, self._max_health, self._facing,
+         self._kind, self._cooldown, self._attack, self._mob_id) = \
+            (np.resize(field, capacity) for field in self._fields())
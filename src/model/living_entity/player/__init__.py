@@ -12,7 +12,7 @@ class Player(LivingEntity):
                  health=INITIAL_HEALTH,
                  position=Position(0, 0),
                  facing=Direction.LEFT,
-                 weapon=Sword()):
+                 weapon=None):
         """Constructs a Player with the given symbol, health,
         position, facing direction, and weapon. If symbol is
         not specified, the defualt symbol is '&'. If health is
@@ -26,5 +26,5 @@ class Player(LivingEntity):
         :param facing: the initial facing direction of the player
         :param weapon: the weapon wielded by the player
         """
-        super().__init__(symbol, health, position, facing, weapon)
+        super().__init__(symbol, health, position, facing, weapon if weapon is not None else Sword())
 
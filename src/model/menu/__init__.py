@@ -2,17 +2,36 @@ from abc import ABC
 from model.position import Position
 from model.menu.option import Option
 
-import numpy as np
+from time import localtime, strftime
 
-import os.path
+from model.menu.asset_cache import load_background
+from model.save_slot_manager import SaveSlotManager
+
+PREVIEW_CENTER = 74
+PREVIEW_OFFSET = 2
+# the cursor columns and row of each slot's box in the load_menu background
+SLOT_BOXES = ((62, 87, 15), (62, 88, 19), (59, 90, 23))
+
+
+def get_preview(entry):
+    """Returns the one-line preview of a save slot shown in the Load Menu.
+    :param entry: the save slot's manifest entry, or None if the slot is empty
+    :return: the level reached, health and time of the save, or EMPTY
+    """
+    if entry is None:
+        return "EMPTY"
+
+    return "LEVEL %d  HP %d/%d  %s" % (entry["level"] + 1, entry["health"], entry["max_health"],
+                                       strftime("%Y-%m-%d %H:%M", localtime(entry["timestamp"])))
 
 
 class Menu(ABC):
     """This abstract class represents a Menu."""
 
-    def __init__(self, background: np, options: tuple):
-        """Constructs a menu with the given background and options.
-        :param background: the menu background
+    def __init__(self, background: str, options: tuple):
+        """Constructs a menu with the given background and options. The background
+        is loaded when the menu is first drawn.
+        :param background: the name of the menu background asset
         :param options: the menu options
         """
         self._background = background
@@ -72,12 +91,18 @@ class Menu(ABC):
         """
         (left_pos, right_pos) = self._options[self._current_option].select()
 
-        bg = self._background.copy()
+        bg = self.get_background().copy()
         bg[left_pos.get_y(), left_pos.get_x()] = "="
         bg[right_pos.get_y(), right_pos.get_x()] = "="
 
         return bg
 
+    def get_background(self):
+        """Returns the menu background, loading it from the asset cache on first use.
+        :return: the read-only menu background
+        """
+        return load_background(self._background)
+
     def need_update(self):
         """Checks if an update is necessary. If so, additionally resets update flag to False.
         :return: True if update flag is True, else False
@@ -97,86 +122,69 @@ class Menu(ABC):
 
 class MainMenu(Menu):
     """This class represents the Main Menu"""
-    background = np.loadtxt("model/menu/main_menu.txt", dtype='<U1')
 
     def __init__(self):
         """Constructs a Main Menu"""
         load_option = Option("load", Position(61, 20), Position(89, 20))
         exit_option = Option("exit", Position(68, 24), Position(81, 24))
-        super().__init__(background=MainMenu.background, options=(load_option, exit_option))
-
-
-def get_saves():
-    """Retrieves the attendance of the three save slots as a size-3 tuple of boolean values.
-    :return: the attendance of the three save slots as a size-3 tuple of boolean values
-    """
-    return (os.path.exists("save_data/save1.dat"),
-            os.path.exists("save_data/save2.dat"),
-            os.path.exists("save_data/save3.dat"))
+        super().__init__(background="main_menu", options=(load_option, exit_option))
 
 
 class LoadMenu(Menu):
-    """This class represents the Load Menu"""
-    background = np.loadtxt("model/menu/load_menu.txt", dtype='<U1')
-
-    def __init__(self):
-        """Constructs a Load Menu"""
-        slot1 = Option("slot1", Position(62, 15), Position(87, 15))
-        slot2 = Option("slot2", Position(62, 19), Position(88, 19))
-        slot3 = Option("slot3", Position(59, 23), Position(90, 23))
-        super().__init__(background=LoadMenu.background, options=(slot1, slot2, slot3))
+    """This class represents the Load Menu. It lists one save slot for each box
+    drawn in its background, so the number of slots shown is that of SLOT_BOXES;
+    the Save Slot Manager itself supports any number of slots."""
+    slots = tuple(range(1, len(SLOT_BOXES) + 1))
+
+    def __init__(self, save_slots: SaveSlotManager):
+        """Constructs a Load Menu listing the given save slots.
+        :param save_slots: the Save Slot Manager indexing the save slots
+        """
+        self._save_slots = save_slots
+        options = tuple(Option("slot" + str(slot), Position(left, row), Position(right, row))
+                        for slot, (left, right, row) in zip(LoadMenu.slots, SLOT_BOXES))
+        super().__init__(background="load_menu", options=options)
 
     def get_full_background(self):
-        """Returns the menu background with selection cursors and save slot state included.
-        :return: the menu background with selection cursors and save slot state included
+        """Returns the menu background with selection cursors and a preview of each
+        save slot included, taken from the save slot manifest.
+        :return: the menu background with selection cursors and save slot previews included
         """
         bg = super().get_full_background()
-        saves = get_saves()
-        for i in range(len(saves)):
-            if saves[i]:
-                bg[17 + (i * 4), 72] = "S"
-                bg[17 + (i * 4), 73] = "A"
-                bg[17 + (i * 4), 74] = "V"
-                bg[17 + (i * 4), 75] = "E"
-                bg[17 + (i * 4), 76] = str(i + 1)
-            else:
-                bg[17 + (i * 4), 72] = "E"
-                bg[17 + (i * 4), 73] = "M"
-                bg[17 + (i * 4), 74] = "P"
-                bg[17 + (i * 4), 75] = "T"
-                bg[17 + (i * 4), 76] = "Y"
+        for slot, (_, _, row) in zip(LoadMenu.slots, SLOT_BOXES):
+            preview = get_preview(self._save_slots.get_slot(slot)).replace(" ", ".")
+            start = PREVIEW_CENTER - len(preview) // 2
+            bg[row + PREVIEW_OFFSET, start:start + len(preview)] = list(preview)
 
         return bg
 
     def delete_save(self):
-        """Deletes the currently selected save, if it exists
+        """Deletes the currently selected save, if it exists. Called through
+        Model.delete_save, which first waits for any save being written.
         :return: None
         """
-        curr = self.get_current_option()
-        save = get_saves()[curr]
-        if save:
-            os.remove("save_data/save" + str(curr + 1) + ".dat")
+        slot = LoadMenu.slots[self.get_current_option()]
+        if self._save_slots.is_used(slot):
+            self._save_slots.delete(slot)
             self.set_need_update()
 
 
 class PauseMenu(Menu):
     """This class represents the Pause Menu"""
-    background = np.loadtxt("model/menu/pause_menu.txt", dtype='<U1')
 
     def __init__(self):
         """Constructs a Pause Menu"""
         resume = Option("resume", Position(65, 15), Position(85, 15))
         save = Option("save", Position(67, 19), Position(82, 19))
         quit_option = Option("quit", Position(68, 23), Position(81, 23))
-        super().__init__(background=PauseMenu.background, options=(resume, save, quit_option))
+        super().__init__(background="pause_menu", options=(resume, save, quit_option))
 
 
 class DeathMenu(Menu):
     """This class represents the Death Menu"""
-    background = np.loadtxt("model/menu/death_menu.txt", dtype='<U1')
 
     def __init__(self):
         """Constructs a Death Menu"""
         new_game = Option("new_game", Position(62, 17), Position(88, 17))
         main_menu = Option("main_menu", Position(62, 22), Position(90, 22))
-        super().__init__(background=DeathMenu.background, options=(new_game, main_menu))
+        super().__init__(background="death_menu", options=(new_game, main_menu))
@@ -0,0 +1,43 @@
+import io
+import os
+from functools import lru_cache
+
+import numpy as np
+
+from model.save_format import publish_file
+from model.settings import ASSET_CACHE_DIRECTORY
+
+MENU_DIRECTORY = "model/menu"
+
+
+@lru_cache(maxsize=None)
+def load_background(name):
+    """Returns the background of the given menu as a read-only 2-D array of
+    characters. The text asset is only parsed when its precompiled .npy copy in
+    ASSET_CACHE_DIRECTORY is missing or older than it, in which case the copy is
+    written again. Backgrounds are loaded on first use and kept for the session.
+    :param name: the name of the menu asset, without extension, e.g. "main_menu"
+    :return: the read-only menu background
+    """
+    source = os.path.join(MENU_DIRECTORY, name + ".txt")
+    cache = os.path.join(ASSET_CACHE_DIRECTORY, name + ".npy")
+    try:
+        if os.path.getmtime(cache) >= os.path.getmtime(source):
+            background = np.load(cache)
+            background.flags.writeable = False
+            return background
+    except (OSError, ValueError):
+        pass
+
+    background = np.loadtxt(source, dtype='<U1')
+    buffer = io.BytesIO()
+    np.save(buffer, background)
+    try:
+        os.makedirs(ASSET_CACHE_DIRECTORY, exist_ok=True)
+        publish_file(buffer.getvalue(), cache)
+    except OSError:
+        # a read-only install still runs, parsing the text asset each session
+        pass
+    background.flags.writeable = False
+
+    return background
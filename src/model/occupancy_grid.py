@@ -0,0 +1,157 @@
+import numpy as np
+
+from model.chunked_array import ChunkedArray
+
+
+class OccupancyGrid:
+    """This class represents a spatial index of a Game Grid, mapping each tile to
+    the living entity and heart on it. Living entities are stored as their level
+    data codes in a 2-D array, so both single-tile and area queries are array
+    lookups, and the index is updated incrementally as entities move."""
+    def __init__(self, rows, columns, chunked=False):
+        """Constructs an empty Occupancy Grid with the given number of rows and columns.
+        If chunked, the index is kept in Chunked Arrays, which only allocate the
+        chunks entities have stood in, for levels too large to index densely.
+        :param rows: the number of rows in the indexed Game Grid
+        :param columns: the number of columns in the indexed Game Grid
+        :param chunked: whether to keep the index in Chunked Arrays
+        """
+        if chunked:
+            self._codes = ChunkedArray(rows, columns, np.int32)
+            self._hearts = ChunkedArray(rows, columns, bool)
+        else:
+            self._codes = np.zeros((rows, columns), dtype=np.int32)
+            self._hearts = np.zeros((rows, columns), dtype=bool)
+        self._entities = {}
+
+    def add_entity(self, entity, code):
+        """Places the given entity, identified by the given level data code, at its position.
+        :param entity: the living entity to place
+        :param code: the level data code of the entity, which must be non-zero
+        :return: None
+        """
+        self._entities[code] = entity
+        self._codes[entity.get_y(), entity.get_x()] = code
+
+    def remove_entity(self, entity, code):
+        """Removes the given entity, identified by the given level data code, from its position.
+        :param entity: the living entity to remove
+        :param code: the level data code of the entity
+        :return: None
+        """
+        del self._entities[code]
+        if self._codes[entity.get_y(), entity.get_x()] == code:
+            self._codes[entity.get_y(), entity.get_x()] = 0
+
+    def move_entity(self, code, old_x, old_y, new_x, new_y):
+        """Moves the entity identified by the given level data code between the given tiles.
+        :param code: the level data code of the entity
+        :param old_x: the x-position the entity moved from
+        :param old_y: the y-position the entity moved from
+        :param new_x: the x-position the entity moved to
+        :param new_y: the y-position the entity moved to
+        :return: None
+        """
+        if self._codes[old_y, old_x] == code:
+            self._codes[old_y, old_x] = 0
+        self._codes[new_y, new_x] = code
+
+    def move_entities(self, codes, old_xs, old_ys, new_xs, new_ys):
+        """Moves the entities identified by the given level data codes between the
+        given tiles, in one batched update. No two entities may move to the same tile.
+        :param codes: the array of level data codes of the entities
+        :param old_xs: the array of x-positions the entities moved from
+        :param old_ys: the array of y-positions the entities moved from
+        :param new_xs: the array of x-positions the entities moved to
+        :param new_ys: the array of y-positions the entities moved to
+        :return: None
+        """
+        vacated = self._codes[old_ys, old_xs] == codes
+        self._codes[old_ys[vacated], old_xs[vacated]] = 0
+        self._codes[new_ys, new_xs] = codes
+
+    def are_occupied(self, xs, ys):
+        """Checks, for each of the given tiles, whether a living entity is on it.
+        :param xs: the array of x-positions of the tiles
+        :param ys: the array of y-positions of the tiles
+        :return: a boolean array, True where a living entity is on the tile
+        """
+        return self._codes[ys, xs] != 0
+
+    def is_occupied(self, x, y):
+        """Checks whether a living entity is on the given tile.
+        :param x: the x-position of the tile
+        :param y: the y-position of the tile
+        :return: True if a living entity is on the tile, else False
+        """
+        return self._codes[y, x] != 0
+
+    def get_entity_at(self, x, y):
+        """Returns the living entity on the given tile.
+        :param x: the x-position of the tile
+        :param y: the y-position of the tile
+        :return: the living entity on the tile, or None if the tile is free
+        """
+        return self._entities.get(int(self._codes[y, x]))
+
+    def add_heart(self, x, y):
+        """Places a heart on the given tile.
+        :param x: the x-position of the tile
+        :param y: the y-position of the tile
+        :return: None
+        """
+        self._hearts[y, x] = True
+
+    def remove_heart(self, x, y):
+        """Removes the heart from the given tile.
+        :param x: the x-position of the tile
+        :param y: the y-position of the tile
+        :return: None
+        """
+        self._hearts[y, x] = False
+
+    def has_heart(self, x, y):
+        """Checks whether a heart is on the given tile.
+        :param x: the x-position of the tile
+        :param y: the y-position of the tile
+        :return: True if a heart is on the tile, else False
+        """
+        return bool(self._hearts[y, x])
+
+    def get_codes_within(self, x, y, radius):
+        """Returns the level data codes of the living entities within the given
+        Euclidean radius of the given tile. Only the square window around the tile
+        is searched, so the cost depends on the radius, not on the number of
+        entities in the Game Grid.
+        :param x: the x-position of the center tile
+        :param y: the y-position of the center tile
+        :param radius: the search radius, in tiles
+        :return: the array of level data codes within the radius, in row-major order
+        """
+        upper = max(y - radius, 0)
+        left = max(x - radius, 0)
+        window = self._codes[upper:y + radius + 1, left:x + radius + 1]
+
+        rows, columns = np.nonzero(window)
+        within = (rows + upper - y) ** 2 + (columns + left - x) ** 2 <= radius ** 2
+
+        return window[rows[within], columns[within]]
+
+    def get_entities_within(self, x, y, radius):
+        """Returns the living entities within the given Euclidean radius of the given tile.
+        :param x: the x-position of the center tile
+        :param y: the y-position of the center tile
+        :param radius: the search radius, in tiles
+        :return: the list of living entities within the radius, in row-major order
+        """
+        return [self._entities[code] for code in self.get_codes_within(x, y, radius).tolist()]
+
+    def get_window(self, upper, lower, left, right):
+        """Returns the entity codes and heart mask of the given window.
+        :param upper: the first row of the window
+        :param lower: the row after the last row of the window
+        :param left: the first column of the window
+        :param right: the column after the last column of the window
+        :return: the entity codes (0 where free) and the heart mask of the window
+        """
+        return self._codes[upper:lower, left:right], self._hearts[upper:lower, left:right]
@@ -0,0 +1,142 @@
+from time import perf_counter
+
+import numpy as np
+
+from model.settings import PROFILER_CAPACITY
+
+PHASES = ("update_mobs", "update_dead_mobs", "get_fov_grid", "data_grid_to_ascii", "assemble_frame", "diff_frame",
+          "write_frame")
+UPDATE_MOBS, UPDATE_DEAD_MOBS, GET_FOV_GRID, DATA_GRID_TO_ASCII, ASSEMBLE_FRAME, DIFF_FRAME, WRITE_FRAME = \
+    range(len(PHASES))
+OVERLAY_LABELS = ("mobs", "dead", "fov", "ascii", "build", "diff", "write")
+PERCENTILES = (50, 95, 99)
+OVERLAY_REFRESH_INTERVAL = 0.5
+
+_active_profiler = None
+
+
+def get_active_profiler():
+    """Retrieves the Phase Profiler recording the phases of the game.
+    :return: the active Phase Profiler, or None if phases are not being profiled
+    """
+    return _active_profiler
+
+
+def set_active_profiler(profiler):
+    """Makes the given Phase Profiler the one recording the phases of the game.
+    :param profiler: the Phase Profiler to make active, or None to stop profiling
+    :return: None
+    """
+    global _active_profiler
+    _active_profiler = profiler
+
+
+def record_phase(phase, start):
+    """Records a run of the given phase that started at the given time, if phases
+    are being profiled. When they are not, this costs a single check, so it is
+    left in place around each phase.
+    :param phase: the index of the phase in PHASES
+    :param start: the perf_counter time at which the phase started
+    :return: None
+    """
+    if _active_profiler is not None:
+        _active_profiler.record(phase, perf_counter() - start)
+
+
+class PhaseProfiler:
+    """This class represents a profiler of the phases of a tick and a frame, from
+    updating the mobs to writing the frame to the terminal. The latest capacity
+    durations of each phase are kept in a ring buffer allocated up front, so
+    recording a phase never allocates, and the rolling percentiles are computed
+    from them only when asked for. The time of update_mobs includes that of
+    update_dead_mobs, which runs within it."""
+    def __init__(self, capacity=PROFILER_CAPACITY):
+        """Constructs a Phase Profiler keeping the given number of durations of each phase.
+        :param capacity: the number of latest durations kept for each phase
+        """
+        self._capacity = capacity
+        self._durations = np.zeros((len(PHASES), capacity))
+        self._counts = [0] * len(PHASES)
+        self._maxima = [0.0] * len(PHASES)
+        self._overlay = ""
+        self._overlay_time = None
+
+    def record(self, phase, duration):
+        """Records one run of the given phase.
+        :param phase: the index of the phase in PHASES
+        :param duration: the time the phase took, in seconds
+        :return: None
+        """
+        self._durations[phase, self._counts[phase] % self._capacity] = duration
+        self._counts[phase] += 1
+        if duration > self._maxima[phase]:
+            self._maxima[phase] = duration
+
+    def get_count(self, phase):
+        """Returns the number of runs of the given phase recorded.
+        :param phase: the index of the phase in PHASES
+        :return: the number of runs of the phase recorded
+        """
+        return self._counts[phase]
+
+    def get_max(self, phase):
+        """Returns the longest time the given phase took, over every run recorded, in seconds.
+        :param phase: the index of the phase in PHASES
+        :return: the longest time the phase took, in seconds
+        """
+        return self._maxima[phase]
+
+    def get_durations(self, phase):
+        """Returns the latest durations of the given phase kept in the ring buffer, in no particular order.
+        :param phase: the index of the phase in PHASES
+        :return: the latest durations of the phase, in seconds
+        """
+        return self._durations[phase, :min(self._counts[phase], self._capacity)]
+
+    def get_percentiles(self, phase, percentiles=PERCENTILES):
+        """Returns the given percentiles of the latest durations of the given phase.
+        :param phase: the index of the phase in PHASES
+        :param percentiles: the percentiles, from 0 to 100
+        :return: the tuple of percentiles of the phase's latest durations, in seconds,
+        all 0.0 if the phase has not run
+        """
+        durations = self.get_durations(phase)
+        if durations.size == 0:
+            return (0.0,) * len(percentiles)
+
+        return tuple(np.percentile(durations, percentiles).tolist())
+
+    def get_overlay(self):
+        """Returns the one-line debug overlay shown in the HUD: the p95 duration of
+        each phase, in milliseconds. It is refreshed at most once every
+        OVERLAY_REFRESH_INTERVAL seconds, so drawing it costs next to nothing.
+        :return: the debug overlay
+        """
+        now = perf_counter()
+        if self._overlay_time is None or now - self._overlay_time >= OVERLAY_REFRESH_INTERVAL:
+            self._overlay = "p95 ms: " + " ".join("%s %.2f" % (label, self.get_percentiles(phase, (95,))[0] * 1e3)
+                                                  for phase, label in enumerate(OVERLAY_LABELS))
+            self._overlay_time = now
+
+        return self._overlay
+
+    def dump(self, path):
+        """Writes the statistics of every phase to the given file.
+        :param path: the path of the file to write
+        :return: None
+        """
+        with open(path, "w") as dump_file:
+            dump_file.write(str(self) + "\n")
+
+    def __str__(self):
+        """Returns the statistics of every phase as a table, one phase per line.
+        :return: the statistics of every phase as a table
+        """
+        lines = ["%-20s %8s %10s %10s %10s %10s" % ("phase (ms)", "runs", "p50", "p95", "p99", "max")]
+        for phase, name in enumerate(PHASES):
+            lines.append("%-20s %8d %10.3f %10.3f %10.3f %10.3f"
+                         % ((name, self._counts[phase])
+                            + tuple(percentile * 1e3 for percentile in self.get_percentiles(phase))
+                            + (self._maxima[phase] * 1e3,)))
+
+        return "\n".join(lines)
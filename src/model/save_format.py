@@ -0,0 +1,281 @@
+import os
+import struct
+from functools import lru_cache
+
+import numpy as np
+
+from model.chunked_array import ChunkedArray
+from model.direction import Direction
+from model.game_grid import GameGrid
+from model.level_generator import generate_population, generate_terrain, shift_rooms, TERRAIN_CACHE_SIZE
+from model.level_generator.room import Room
+from model.living_entity.mob import Rat
+from model.living_entity.mob.mob_store import MobStore
+from model.living_entity.player import Player
+from model.living_entity.weapon.fist import Fist
+from model.living_entity.weapon.sword import Sword
+from model.position import Position
+
+MAGIC = b"DCSV"
+VERSION = 1
+HEADER = struct.Struct("<4sHHiiiqiiIIQQQ")
+LEVEL_ALIGNMENT = 64
+TABLE_ALIGNMENT = 8
+NO_SEED = -1
+FLAG_SEEDED = 1
+
+ENTITY_PLAYER = 0
+ENTITY_MOB = 1
+ENTITY_HEART = 2
+ENTITY_CONSUMED_HEART = 3
+ENTITY_DTYPE = np.dtype([("type", "u1"), ("kind", "u1"), ("facing", "u1"), ("weapon", "u1"),
+                         ("x", "<i4"), ("y", "<i4"), ("health", "<i4"), ("max_health", "<i4"), ("mob_id", "<i4")])
+ROOM_DTYPE = np.dtype([("x", "<i4"), ("y", "<i4"), ("width", "<i4"), ("height", "<i4")])
+
+MOB_KINDS = {Rat.kind: Rat}
+WEAPONS = (Fist, Sword)
+
+
+def align(offset, alignment):
+    """Rounds the given offset up to a multiple of the given alignment.
+    :param offset: the offset to round up
+    :param alignment: the alignment, in bytes
+    :return: the aligned offset
+    """
+    return -(-offset // alignment) * alignment
+
+
+@lru_cache(maxsize=TERRAIN_CACHE_SIZE)
+def get_generated_hearts(seed, level):
+    """Returns the hearts generated for the given level of the given seed, against
+    which a seeded save records the hearts consumed. Results are kept in an LRU
+    cache, so saving the same level again does not repopulate it.
+    :param seed: the seed of the run
+    :param level: the level whose hearts to return
+    :return: a frozenset containing each generated heart's position
+    """
+    _, hearts = generate_population(seed, level, generate_terrain(seed, level)[1])
+
+    return frozenset(hearts)
+
+
+def encode_entities(game_grid: GameGrid, hearts, heart_type):
+    """Returns the entity table of the player and every mob of the given Game Grid,
+    followed by the given hearts.
+    :param game_grid: the Game Grid whose player and mobs to encode
+    :param hearts: the collection of heart positions to encode
+    :param heart_type: the entity type of the hearts, ENTITY_HEART or ENTITY_CONSUMED_HEART
+    :return: the entity table, an array of ENTITY_DTYPE
+    """
+    player = game_grid.get_player()
+    store = game_grid.get_mob_store()
+    entities = np.zeros(1 + len(store) + len(hearts), dtype=ENTITY_DTYPE)
+
+    health, max_health = player.get_health()
+    entities[0] = (ENTITY_PLAYER, 0, player.get_direction().value, WEAPONS.index(type(player.get_weapon())),
+                   player.get_x(), player.get_y(), health, max_health, 0)
+
+    mobs = entities[1:1 + len(store)]
+    mobs["type"] = ENTITY_MOB
+    mobs["kind"] = store.get_kind()
+    mobs["facing"] = store.get_facing()
+    mobs["x"] = store.get_x()
+    mobs["y"] = store.get_y()
+    mobs["health"] = store.get_health()
+    mobs["max_health"] = store.get_max_health()
+    mobs["mob_id"] = store.get_mob_ids()
+
+    heart_entities = entities[1 + len(store):]
+    heart_entities["type"] = heart_type
+    heart_entities["x"] = [heart.get_x() for heart in hearts]
+    heart_entities["y"] = [heart.get_y() for heart in hearts]
+
+    return entities
+
+
+def encode_game_grid(game_grid: GameGrid, seeded=False):
+    """Encodes the given Game Grid in the binary save format. The file starts with a
+    fixed header, followed by the raw int8 level data at an offset aligned to
+    LEVEL_ALIGNMENT bytes, so it can be memory-mapped, then a fixed-width entity
+    table holding the player, every mob and every heart, and a table of rooms.
+    Only state that cannot be derived is saved: symbols, lookup arrays and
+    indexes are rebuilt on decoding. If seeded is True, the level data and rooms
+    are left out, as they are generated again from the seed on decoding, and the
+    entity table lists the hearts consumed rather than those left; mobs not
+    listed were killed.
+    :param game_grid: the Game Grid to encode
+    :param seeded: whether to save the Game Grid as its seed and level plus the changes since
+    :return: the encoded Game Grid
+    :raises TypeError: if the Game Grid's terrain is a Chunked Level, which is saved by its seed
+    :raises ValueError: if seeded is True and the Game Grid was not generated from a seed
+    """
+    terrain = game_grid.get_terrain()
+    if isinstance(terrain, ChunkedArray):
+        raise TypeError("A Chunked Level cannot be saved as level data")
+    rows, columns = terrain.shape
+    seed = game_grid.get_seed()
+    level = game_grid.get_current_level()
+
+    if seeded:
+        if seed is None:
+            raise ValueError("Only a Game Grid generated from a seed can be saved by its seed")
+        entities = encode_entities(game_grid, get_generated_hearts(seed, level) - game_grid.get_hearts(),
+                                   ENTITY_CONSUMED_HEART)
+        level_data = b""
+        rooms = np.zeros(0, dtype=ROOM_DTYPE)
+        level_offset = HEADER.size
+    else:
+        entities = encode_entities(game_grid, game_grid.get_hearts(), ENTITY_HEART)
+        level_data = np.ascontiguousarray(terrain, dtype=np.int8).tobytes()
+        rooms = np.array([(room.get_x(), room.get_y(), room.get_width(), room.get_height())
+                          for room in game_grid.get_rooms()], dtype=ROOM_DTYPE)
+        level_offset = align(HEADER.size, LEVEL_ALIGNMENT)
+
+    entity_offset = align(level_offset + len(level_data), TABLE_ALIGNMENT)
+    room_offset = entity_offset + entities.nbytes
+    door = game_grid.get_door_position()
+    header = HEADER.pack(MAGIC, VERSION, FLAG_SEEDED if seeded else 0, rows, columns, level,
+                         NO_SEED if seed is None else seed, door.get_x(), door.get_y(),
+                         len(entities), len(rooms), level_offset, entity_offset, room_offset)
+
+    data = bytearray(room_offset + rooms.nbytes)
+    data[:HEADER.size] = header
+    data[level_offset:level_offset + len(level_data)] = level_data
+    data[entity_offset:room_offset] = entities.tobytes()
+    data[room_offset:] = rooms.tobytes()
+
+    return bytes(data)
+
+
+def decode_header(data):
+    """Decodes and checks the header of the given encoded Game Grid.
+    :param data: the encoded Game Grid, or at least its first HEADER.size bytes
+    :return: the tuple of header fields, in the order of HEADER
+    :raises ValueError: if the data is not in the binary save format or is of an unknown version
+    """
+    if len(data) < HEADER.size or bytes(data[:len(MAGIC)]) != MAGIC:
+        raise ValueError("Not a Dungeon Crawler save file")
+    fields = HEADER.unpack_from(data)
+    if fields[1] != VERSION:
+        raise ValueError("Unsupported save format version %d" % fields[1])
+
+    return fields
+
+
+def decode_entities(entities: np.ndarray):
+    """Rebuilds the player and mobs of the given entity table, with the mobs sharing
+    one Mob Store.
+    :param entities: the entity table, an array of ENTITY_DTYPE
+    :return: the player, a dictionary mapping each mob id to its respective Mob,
+    and a set containing the position of each heart entity, whether left or consumed
+    """
+    _, _, facing, weapon, x, y, health, max_health, _ = entities[entities["type"] == ENTITY_PLAYER][0].tolist()
+    player = Player(health=max_health, position=Position(x, y), facing=Direction(facing), weapon=WEAPONS[weapon]())
+    player.take_damage(max_health - health)
+
+    mob_entities = entities[entities["type"] == ENTITY_MOB]
+    store = MobStore(len(mob_entities))
+    mobs = {}
+    for kind, facing, x, y, mob_id in zip(*(mob_entities[field].tolist()
+                                            for field in ("kind", "facing", "x", "y", "mob_id"))):
+        mobs[mob_id] = MOB_KINDS[kind](Position(x, y), Direction(facing), store=store, mob_id=mob_id)
+    store.get_health()[:] = mob_entities["health"]
+    store.get_max_health()[:] = mob_entities["max_health"]
+
+    heart_entities = entities[(entities["type"] == ENTITY_HEART) | (entities["type"] == ENTITY_CONSUMED_HEART)]
+    hearts = {Position(x, y) for x, y in zip(heart_entities["x"].tolist(), heart_entities["y"].tolist())}
+
+    return player, mobs, hearts
+
+
+def decode_game_grid(data, level_data=None):
+    """Decodes a Game Grid from the binary save format. The terrain, rooms and
+    hearts of a seeded save are generated again from its seed, so decoding it
+    costs one level generation.
+    :param data: the encoded Game Grid, as a bytes-like object
+    :param level_data: the level data to use instead of a copy of the encoded one,
+    such as a memory map of the save file
+    :return: the decoded Game Grid
+    :raises ValueError: if the data is not in the binary save format or is of an unknown version,
+    or if the level generated from the seed of a seeded save does not match it
+    """
+    (_, _, flags, rows, columns, level, seed, door_x, door_y,
+     entity_count, room_count, level_offset, entity_offset, room_offset) = decode_header(data)
+    entities = np.frombuffer(data, dtype=ENTITY_DTYPE, count=entity_count, offset=entity_offset)
+    player, mobs, hearts = decode_entities(entities)
+
+    if flags & FLAG_SEEDED:
+        level_data, rooms, door_pos = generate_terrain(seed, level)
+        if level_data.shape != (rows, columns) or door_pos != Position(door_x, door_y):
+            raise ValueError("The level generated from seed %d does not match the save" % seed)
+        hearts = set(get_generated_hearts(seed, level) - hearts)
+        rooms = shift_rooms(rooms)
+    else:
+        if level_data is None:
+            level_data = np.frombuffer(data, dtype=np.int8, count=rows * columns, offset=level_offset)
+            level_data = level_data.reshape(rows, columns).copy()
+        rooms = [Room(Position(x, y), width, height) for x, y, width, height
+                 in np.frombuffer(data, dtype=ROOM_DTYPE, count=room_count, offset=room_offset).tolist()]
+
+    return GameGrid(mobs=mobs,
+                    level_data=level_data,
+                    player=player,
+                    door_pos=Position(door_x, door_y),
+                    level=level,
+                    hearts=hearts,
+                    rooms=rooms,
+                    seed=None if seed == NO_SEED else seed)
+
+
+def publish_file(data, path):
+    """Atomically replaces the file at the given path, such as a save file, with the
+    given data. The data is written and flushed to disk in a temporary file next to
+    it, which is then renamed over the file, so a crash leaves either the old file
+    or the new one, never a partial write.
+    :param data: the bytes to write
+    :param path: the path of the file
+    :return: None
+    """
+    temporary_path = path + ".tmp"
+    with open(temporary_path, "wb") as save_file:
+        save_file.write(data)
+        save_file.flush()
+        os.fsync(save_file.fileno())
+    os.replace(temporary_path, path)
+
+
+def write_save(game_grid: GameGrid, path, seeded=False):
+    """Atomically writes the given Game Grid to the given path in the binary save format.
+    :param game_grid: the Game Grid to save
+    :param path: the path of the save file
+    :param seeded: whether to save the Game Grid as its seed and level plus the changes since
+    :return: None
+    """
+    publish_file(encode_game_grid(game_grid, seeded), path)
+
+
+def read_save(path, memory_map=False):
+    """Reads a Game Grid from the save file at the given path. Files in the binary
+    save format are decoded, and older saves are unpickled with dill. If memory_map
+    is True, the level data of a binary save is memory-mapped read-only rather than
+    copied, so the file must not be overwritten while the Game Grid is in use.
+    Seeded saves hold no level data, so memory_map has no effect on them.
+    :param path: the path of the save file
+    :param memory_map: whether to memory-map the level data of a binary save
+    :return: the saved Game Grid
+    """
+    with open(path, "rb") as save_file:
+        if save_file.read(len(MAGIC)) != MAGIC:
+            # dill is slow to import and only needed for saves older than this format
+            from dill import load
+            save_file.seek(0)
+            return load(save_file)
+        save_file.seek(0)
+        data = save_file.read()
+
+    level_data = None
+    _, _, flags, rows, columns, _, _, _, _, _, _, level_offset, _, _ = decode_header(data)
+    if memory_map and not flags & FLAG_SEEDED:
+        level_data = np.memmap(path, dtype=np.int8, mode="r", offset=level_offset, shape=(rows, columns))
+
+    return decode_game_grid(data, level_data)
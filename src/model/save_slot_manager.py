@@ -0,0 +1,164 @@
+import json
+import os
+import re
+import threading
+from time import time
+
+from model.save_format import publish_file, read_save
+from model.settings import SAVE_DIRECTORY
+
+MANIFEST_NAME = "manifest.json"
+MANIFEST_VERSION = 1
+SAVE_NAME = re.compile(r"save(\d+)\.dat")
+
+
+class SaveSlotManager:
+    """This class represents the index of the save slots in the save directory. The
+    level reached, health, time, size and modification time of every save are cached in one manifest
+    file, so menus can list the saves without probing or reading the save files.
+    A save file is always published before its manifest entry, and a manifest entry
+    removed before its save file, each replacing the manifest atomically. The
+    manifest is reconciled with the save files when the directory is opened, in
+    case the game stopped between the two steps. Any number of slots is supported,
+    numbered from 1. Saves may be published from a worker thread."""
+    def __init__(self, directory=SAVE_DIRECTORY):
+        """Constructs a Save Slot Manager for the given save directory, reading its
+        manifest and reconciling it with the save files present.
+        :param directory: the directory holding the save files and the manifest
+        """
+        self._directory = directory
+        self._lock = threading.Lock()
+        self._slots = {}
+        os.makedirs(directory, exist_ok=True)
+        self.reconcile()
+
+    def get_path(self, slot):
+        """Returns the path of the save file of the given slot.
+        :param slot: the slot, from 1
+        :return: the path of the save file of the slot
+        """
+        return os.path.join(self._directory, "save%d.dat" % slot)
+
+    def get_manifest_path(self):
+        """Returns the path of the manifest file.
+        :return: the path of the manifest file
+        """
+        return os.path.join(self._directory, MANIFEST_NAME)
+
+    def is_used(self, slot):
+        """Checks whether the given slot holds a save.
+        :param slot: the slot, from 1
+        :return: True if the slot holds a save, else False
+        """
+        return slot in self._slots
+
+    def get_slot(self, slot):
+        """Returns the cached metadata of the save in the given slot: its level,
+        health, max_health, timestamp, size and mtime_ns, the modification time of its file.
+        :param slot: the slot, from 1
+        :return: a dictionary of the save's metadata, or None if the slot is empty
+        """
+        return self._slots.get(slot)
+
+    def get_slots(self):
+        """Returns the used slots, in order.
+        :return: the sorted list of used slots
+        """
+        return sorted(self._slots)
+
+    def publish(self, slot, data, level, health, max_health, timestamp=None):
+        """Atomically writes the given encoded Game Grid to the given slot, then
+        records its metadata in the manifest.
+        :param slot: the slot, from 1
+        :param data: the encoded Game Grid
+        :param level: the level of the Game Grid
+        :param health: the player's health
+        :param max_health: the player's max health
+        :param timestamp: the time the Game Grid was saved, in seconds since the epoch,
+        or None for the current time
+        :return: None
+        """
+        with self._lock:
+            path = self.get_path(slot)
+            publish_file(data, path)
+            self._slots[slot] = {"level": level,
+                                 "health": health,
+                                 "max_health": max_health,
+                                 "timestamp": time() if timestamp is None else timestamp,
+                                 "size": len(data),
+                                 "mtime_ns": os.stat(path).st_mtime_ns}
+            self.write_manifest()
+
+    def delete(self, slot):
+        """Removes the save in the given slot from the manifest, then deletes its save file.
+        :param slot: the slot, from 1
+        :return: None
+        """
+        with self._lock:
+            if self._slots.pop(slot, None) is None:
+                return
+            self.write_manifest()
+            if os.path.exists(self.get_path(slot)):
+                os.remove(self.get_path(slot))
+
+    def write_manifest(self):
+        """Atomically replaces the manifest with the cached metadata. The caller holds the lock.
+        :return: None
+        """
+        manifest = {"version": MANIFEST_VERSION,
+                    "slots": {str(slot): entry for slot, entry in sorted(self._slots.items())}}
+        publish_file(json.dumps(manifest, indent=1).encode(), self.get_manifest_path())
+
+    def reconcile(self):
+        """Reads the manifest and brings it up to date with the save files present:
+        entries whose file is missing are dropped, and files that are not listed, or
+        whose size or modification time differs from their entry, are read to
+        describe them. Checking the modification time catches a save published just
+        before the game stopped whose size happens to match the stale entry.
+        :return: None
+        """
+        with self._lock:
+            try:
+                with open(self.get_manifest_path(), "rb") as manifest_file:
+                    manifest = json.load(manifest_file)
+                slots = {int(slot): entry for slot, entry in manifest["slots"].items()} \
+                    if manifest.get("version") == MANIFEST_VERSION else {}
+            except (OSError, ValueError, KeyError, AttributeError):
+                slots = {}
+
+            stats = {}
+            for name in os.listdir(self._directory):
+                match = SAVE_NAME.fullmatch(name)
+                if match:
+                    stats[int(match.group(1))] = os.stat(os.path.join(self._directory, name))
+
+            self._slots = {}
+            for slot, stat in stats.items():
+                entry = slots.get(slot)
+                if entry is None or entry.get("size") != stat.st_size or entry.get("mtime_ns") != stat.st_mtime_ns:
+                    entry = self.describe_save(slot, stat)
+                if entry is not None:
+                    self._slots[slot] = entry
+
+            if self._slots != slots:
+                self.write_manifest()
+
+    def describe_save(self, slot, stat):
+        """Reads the save file of the given slot and returns its metadata.
+        :param slot: the slot, from 1
+        :param stat: the os.stat result of the save file
+        :return: a dictionary of the save's metadata, or None if the save cannot be read
+        """
+        path = self.get_path(slot)
+        try:
+            game_grid = read_save(path)
+        except Exception:
+            return None
+        health, max_health = game_grid.get_player().get_health()
+
+        return {"level": game_grid.get_current_level(),
+                "health": health,
+                "max_health": max_health,
+                "timestamp": stat.st_mtime,
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns}
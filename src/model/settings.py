@@ -1,5 +1,23 @@
+import os
+
 # Settings #
 FOV_WIDTH = 160
 FOV_HEIGHT = 30
 LEVEL_WIDTH = 202
-LEVEL_HEIGHT = 68
\ No newline at end of file
+LEVEL_HEIGHT = 68
+TICK_RATE = 20
+FRAME_RATE = 30
+MOB_MOVE_INTERVAL = 0.5
+CHUNK_SIZE = 64
+MAX_RESIDENT_CHUNKS = 64
+SEEDED_SAVES = True
+AUTOSAVE_INTERVAL = 60
+AUTOSAVE_ON_LEVEL_CHANGE = True
+SAVE_DIRECTORY = "save_data"
+ASSET_CACHE_DIRECTORY = ".asset_cache"
+JOURNAL_PATH = os.path.join(SAVE_DIRECTORY, "last_session.journal")
+INPUT_BACKEND = "terminal"
+PROFILE_PHASES = False
+PROFILE_OVERLAY = True
+PROFILER_CAPACITY = 1024
+PROFILE_DUMP_PATH = "phase_profile.txt"
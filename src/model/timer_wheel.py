@@ -0,0 +1,125 @@
+BITS_PER_LEVEL = 6
+SLOTS_PER_LEVEL = 1 << BITS_PER_LEVEL
+SLOT_MASK = SLOTS_PER_LEVEL - 1
+LEVELS = 4
+
+
+class ScheduledTimer:
+    """This class represents a callback scheduled on a Timer Wheel"""
+    def __init__(self, expiry, callback):
+        """Constructs a Scheduled Timer calling the given callback at the given tick.
+        :param expiry: the tick at which the callback is called
+        :param callback: the zero-argument callable to call
+        """
+        self._expiry = expiry
+        self._callback = callback
+        self._cancelled = False
+
+    def get_expiry(self):
+        """Returns the tick at which the callback is called.
+        :return: the tick at which the callback is called
+        """
+        return self._expiry
+
+    def is_cancelled(self):
+        """Checks whether the timer has been cancelled.
+        :return: True if the timer has been cancelled, else False
+        """
+        return self._cancelled
+
+    def cancel(self):
+        """Cancels the timer, so its callback is never called. Cancelled timers are
+        discarded lazily, when the wheel next reaches their slot.
+        :return: None
+        """
+        self._cancelled = True
+
+    def fire(self):
+        """Calls the callback, unless the timer has been cancelled.
+        :return: None
+        """
+        if not self._cancelled:
+            self._callback()
+
+
+class TimerWheel:
+    """This class represents a hierarchical timer wheel keyed on simulation ticks.
+    Level 0 holds timers due within SLOTS_PER_LEVEL ticks, one slot per tick, and
+    each further level covers SLOTS_PER_LEVEL times the span of the level below.
+    Timers are cascaded down a level whenever the level below completes a turn,
+    so scheduling, cancelling and advancing all cost O(1) per timer, and no
+    threads are ever created."""
+    def __init__(self, tick_rate):
+        """Constructs an empty Timer Wheel advanced at the given tick rate.
+        :param tick_rate: the number of ticks per second, used to convert delays in seconds
+        """
+        self._tick_rate = tick_rate
+        self._tick = 0
+        self._wheels = [[[] for _ in range(SLOTS_PER_LEVEL)] for _ in range(LEVELS)]
+
+    def get_tick(self):
+        """Returns the current tick of the wheel.
+        :return: the current tick of the wheel
+        """
+        return self._tick
+
+    def schedule(self, delay, callback):
+        """Schedules the given callback to be called after the given number of ticks.
+        Delays under one tick are rounded up to one tick.
+        :param delay: the number of ticks after which to call the callback
+        :param callback: the zero-argument callable to call
+        :return: the Scheduled Timer, which may be used to cancel the callback
+        """
+        timer = ScheduledTimer(self._tick + max(1, delay), callback)
+        self._insert(timer)
+        return timer
+
+    def schedule_seconds(self, seconds, callback):
+        """Schedules the given callback to be called after the given number of
+        seconds, rounded to the nearest tick.
+        :param seconds: the number of seconds after which to call the callback
+        :param callback: the zero-argument callable to call
+        :return: the Scheduled Timer, which may be used to cancel the callback
+        """
+        return self.schedule(round(seconds * self._tick_rate), callback)
+
+    def advance(self):
+        """Advances the wheel by one tick, cascading timers down from any higher
+        levels whose turn has come, then calling every timer due at the new tick.
+        :return: None
+        """
+        self._tick += 1
+
+        level = 0
+        while level < LEVELS - 1 and (self._tick >> (BITS_PER_LEVEL * level)) & SLOT_MASK == 0:
+            level += 1
+
+        for cascading_level in range(level, 0, -1):
+            slot = (self._tick >> (BITS_PER_LEVEL * cascading_level)) & SLOT_MASK
+            timers = self._wheels[cascading_level][slot]
+            self._wheels[cascading_level][slot] = []
+            for timer in timers:
+                if not timer.is_cancelled():
+                    self._insert(timer)
+
+        slot = self._tick & SLOT_MASK
+        timers = self._wheels[0][slot]
+        self._wheels[0][slot] = []
+        for timer in timers:
+            timer.fire()
+
+    def _insert(self, timer: ScheduledTimer):
+        """Places the given timer in the lowest level whose span covers its delay.
+        Timers beyond the span of the top level are placed in it and re-placed each
+        time the top level turns.
+        :param timer: the timer to place
+        :return: None
+        """
+        delay = timer.get_expiry() - self._tick
+
+        level = 0
+        while level < LEVELS - 1 and delay >= 1 << (BITS_PER_LEVEL * (level + 1)):
+            level += 1
+
+        slot = (timer.get_expiry() >> (BITS_PER_LEVEL * level)) & SLOT_MASK
+        self._wheels[level][slot].append(timer)
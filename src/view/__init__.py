@@ -1,22 +1,45 @@
-import os
+from time import perf_counter
 
 from model import GameState
+from model.phase_profiler import get_active_profiler, record_phase, ASSEMBLE_FRAME
+from model.settings import PROFILE_OVERLAY
+from view.terminal_renderer import TerminalRenderer
 
 
 class View:
     """This class represents a view in Dungeon Crawler."""
-    def __init__(self, model):
-        """Constructs a view from the given model.
+    def __init__(self, model, renderer=None):
+        """Constructs a view from the given model and render backend. If no
+        render backend is provided, a Terminal Renderer on standard output is used.
         :param model: the model from which the view is constructed
+        :param renderer: the render backend to which frames are written
         """
         self._model = model
+        self._renderer = renderer if renderer is not None else TerminalRenderer()
+        self._displayed_game_state = None
+
+    def get_renderer(self):
+        """Retrieves the render backend, e.g. to report bytes written per frame.
+        :return: the render backend
+        """
+        return self._renderer
 
     def display(self):
-        """Prints the current Game State in a user-friendly format.
+        """Renders the current Game State in a user-friendly format. A change of
+        Game State forces a full redraw, otherwise only changed cells are written.
+        If phases are being profiled and PROFILE_OVERLAY is True, the profiler's
+        debug overlay is shown at the end of the HUD line.
         :return: None
         """
-        if self._model.get_game_state() == GameState.IN_GAME:
+        game_state = self._model.get_game_state()
+        if game_state != self._displayed_game_state:
+            self._renderer.invalidate()
+            self._displayed_game_state = game_state
+
+        if game_state == GameState.IN_GAME:
             if self._model.get_current_game_state().need_update():
+                ascii_grid = self._model.data_grid_to_ascii()
+                start = perf_counter()
                 hud = "\n\n\n\t\tHealth: " + health_to_string(self._model.get_player_health()) + "\t"
 
                 if self._model.get_current_enemy_symbol() is not None:
@@ -27,15 +50,18 @@ class View:
 
                 hud += "\tLevel: " + str(self._model.get_current_level() + 1)
 
-                print("\n\n\n\t\t" + '\n\t\t'.join([''.join(row)
-                                              for row
-                                              in self._model.data_grid_to_ascii()]) + hud)
-        elif self._model.get_game_state() != GameState.EXIT:
+                profiler = get_active_profiler()
+                if profiler is not None and PROFILE_OVERLAY:
+                    hud += "\t" + profiler.get_overlay()
+
+                frame = "\n\n\n\t\t" + '\n\t\t'.join([''.join(row) for row in ascii_grid]) + hud
+                record_phase(ASSEMBLE_FRAME, start)
+                self._renderer.render(frame)
+        elif game_state != GameState.EXIT:
             if self._model.get_current_game_state().need_update():
-                os.system("clear")
-                print("\n\n\n\t\t" + '\n\t\t'.join([''.join(row)
-                                              for row
-                                              in self._model.get_current_game_state().get_full_background()]))
+                self._renderer.render("\n\n\n\t\t" + '\n\t\t'.join([''.join(row)
+                                                                  for row
+                                                                  in self._model.get_current_game_state().get_full_background()]))
 
 
 def health_to_string(health: tuple):
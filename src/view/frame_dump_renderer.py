@@ -0,0 +1,32 @@
+class FrameDumpRenderer:
+    """This class represents a render backend that appends every frame, as plain
+    text, to a stream, e.g. to dump the frames of a replayed session to a file.
+    Each frame is preceded by a line giving its number and simulation tick."""
+    def __init__(self, stream, clock=None):
+        """Constructs a Frame Dump Renderer writing to the given text stream.
+        :param stream: the text stream to which frames are appended
+        :param clock: a callable returning the current simulation tick, or None to leave ticks out
+        """
+        self._stream = stream
+        self._clock = clock
+        self._frame_count = 0
+
+    def invalidate(self):
+        """Does nothing, as every frame is written whole.
+        :return: None
+        """
+
+    def render(self, text: str):
+        """Appends the given text to the stream as a frame.
+        :param text: the frame, as newline-separated lines of text
+        :return: None
+        """
+        tick = "" if self._clock is None else ", tick %d" % self._clock()
+        self._stream.write("=== frame %d%s ===\n%s\n" % (self._frame_count, tick, text.expandtabs()))
+        self._frame_count += 1
+
+    def get_frame_count(self):
+        """Returns the number of frames rendered so far.
+        :return: the number of frames rendered so far
+        """
+        return self._frame_count
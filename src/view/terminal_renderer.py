@@ -0,0 +1,155 @@
+import shutil
+import sys
+from time import perf_counter
+
+import numpy as np
+
+from model.phase_profiler import record_phase, DIFF_FRAME, WRITE_FRAME
+
+CSI = "\x1b["
+
+
+class TerminalRenderer:
+    """This class represents a terminal render backend that keeps the previously
+    written frame and, using ANSI cursor-positioning escapes, rewrites only the
+    cells that have changed since."""
+    def __init__(self, stream=None):
+        """Constructs a Terminal Renderer writing to the given text stream.
+        If no stream is provided, frames are written to standard output.
+        :param stream: the text stream to which frames are written
+        """
+        self._stream = stream
+        self._previous = None
+        self._terminal_size = None
+        self._last_frame_bytes = 0
+        self._total_bytes = 0
+        self._frame_count = 0
+        self._full_redraw_count = 0
+
+    def invalidate(self):
+        """Discards the previous frame, forcing a full redraw on the next render.
+        :return: None
+        """
+        self._previous = None
+
+    def render(self, text: str):
+        """Writes the given text to the terminal as a frame. The whole screen is
+        redrawn if there is no previous frame or if the frame or terminal size has
+        changed, otherwise only the changed cells are written. Either way, the
+        output is sent in a single buffered write.
+        :param text: the frame, as newline-separated lines of text
+        :return: None
+        """
+        start = perf_counter()
+        frame = text_to_frame(text)
+        terminal_size = shutil.get_terminal_size()
+
+        if self._previous is None or self._previous.shape != frame.shape or self._terminal_size != terminal_size:
+            output = full_redraw(frame)
+            self._full_redraw_count += 1
+        else:
+            output = diff_redraw(self._previous, frame)
+
+        self._previous = frame
+        self._terminal_size = terminal_size
+
+        record_phase(DIFF_FRAME, start)
+
+        start = perf_counter()
+        stream = self._stream if self._stream is not None else sys.stdout
+        stream.write(output)
+        stream.flush()
+        record_phase(WRITE_FRAME, start)
+
+        self._last_frame_bytes = len(output.encode())
+        self._total_bytes += self._last_frame_bytes
+        self._frame_count += 1
+
+    def get_last_frame_bytes(self):
+        """Returns the number of bytes written for the most recent frame.
+        :return: the number of bytes written for the most recent frame
+        """
+        return self._last_frame_bytes
+
+    def get_total_bytes(self):
+        """Returns the number of bytes written for all frames so far.
+        :return: the number of bytes written for all frames so far
+        """
+        return self._total_bytes
+
+    def get_frame_count(self):
+        """Returns the number of frames rendered so far.
+        :return: the number of frames rendered so far
+        """
+        return self._frame_count
+
+    def get_full_redraw_count(self):
+        """Returns the number of frames that required a full redraw.
+        :return: the number of frames that required a full redraw
+        """
+        return self._full_redraw_count
+
+
+def text_to_frame(text: str):
+    """Returns the given text as a 2-D array of characters, one row per line.
+    Tabs are expanded and short lines are padded with spaces.
+    :param text: the newline-separated lines of text
+    :return: the text as a 2-D array of dtype '<U1'
+    """
+    lines = text.expandtabs().split("\n")
+    width = max(max(len(line) for line in lines), 1)
+    frame = np.array(lines, dtype='<U' + str(width)).view('<U1').reshape(len(lines), width)
+    frame[frame == ''] = ' '
+
+    return frame
+
+
+def full_redraw(frame: np.ndarray):
+    """Returns the escape sequence clearing the screen and drawing the given frame.
+    :param frame: the frame, as a 2-D array of characters
+    :return: the output string redrawing the whole screen
+    """
+    return (CSI + "H" + CSI + "2J"
+            + "\n".join(''.join(row).rstrip() for row in frame)
+            + park_cursor(frame))
+
+
+def diff_redraw(previous: np.ndarray, frame: np.ndarray):
+    """Returns the escape sequences rewriting only the changed cells of the given
+    frame. Each changed row is rewritten as one span from its first to its last
+    changed cell. Non-ASCII symbols may be drawn wider than one column, so a span
+    is widened to start at the first such symbol to its left and, if such a symbol
+    has itself changed, to run to the end of the row.
+    :param previous: the previously written frame
+    :param frame: the frame to write, of the same shape as previous
+    :return: the output string rewriting the changed cells
+    """
+    changed = previous != frame
+    non_ascii = (frame.view(np.uint32) > 127) | (previous.view(np.uint32) > 127)
+    output = []
+
+    for row in np.flatnonzero(changed.any(axis=1)):
+        changed_columns = np.flatnonzero(changed[row])
+        start = changed_columns[0]
+        end = changed_columns[-1] + 1
+
+        wide_columns = np.flatnonzero(non_ascii[row, :start])
+        if wide_columns.size:
+            start = wide_columns[0]
+        if non_ascii[row, changed_columns].any():
+            end = frame.shape[1]
+
+        output.append(CSI + str(row + 1) + ";" + str(start + 1) + "H" + ''.join(frame[row, start:end]))
+
+    if output:
+        output.append(park_cursor(frame))
+
+    return ''.join(output)
+
+
+def park_cursor(frame: np.ndarray):
+    """Returns the escape sequence moving the cursor to the line below the given frame.
+    :param frame: the frame, as a 2-D array of characters
+    :return: the escape sequence moving the cursor below the frame
+    """
+    return CSI + str(frame.shape[0] + 1) + ";1H"